@@ -0,0 +1,72 @@
+"""Throughput benchmark: single-respondent scoring vs `ScoringService.score_batch`.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_scoring --respondents 5000
+
+For every test type the script scores the same random answer sets through
+both paths, checks that scores, percentages and result codes agree exactly,
+and prints respondents/second for each.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from characterify.services.scoring import TRAIT_KEYS, ScoringService
+
+
+def _random_answers(n_questions: int, n: int, rng: random.Random):
+    return [{i: rng.randint(1, 5) for i in range(n_questions)} for _ in range(n)]
+
+
+def _check_agreement(test_id: str, singles, batch) -> None:
+    keys = batch["trait_keys"]
+    for n, payload in enumerate(singles):
+        if payload["result_type"] != batch["result_types"][n]:
+            raise AssertionError(f"{test_id}[{n}]: result {payload['result_type']} != {batch['result_types'][n]}")
+        if [payload["scores"][k] for k in keys] != batch["scores"][n].tolist():
+            raise AssertionError(f"{test_id}[{n}]: scores differ")
+        if test_id == "mbti":
+            expected = [[d["pct_a"], d["pct_b"]] for d in payload["percentages"]]
+        else:
+            expected = [payload["percentages"][k] for k in keys]
+        if expected != batch["percentages"][n].tolist():
+            raise AssertionError(f"{test_id}[{n}]: percentages differ")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--respondents", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    scoring = ScoringService()
+    rng = random.Random(args.seed)
+
+    print(f"{'test':<12} {'single (resp/s)':>16} {'batch (resp/s)':>16} {'speed-up':>9}")
+    for test_id in TRAIT_KEYS:
+        n_questions = len(scoring.get_test(test_id).questions)
+        answers = _random_answers(n_questions, args.respondents, rng)
+
+        start = time.perf_counter()
+        singles = [scoring.score_test(test_id, a) for a in answers]
+        single_s = time.perf_counter() - start
+
+        matrix = scoring.answers_to_matrix(test_id, answers)
+        start = time.perf_counter()
+        batch = scoring.score_batch(test_id, matrix)
+        batch_s = time.perf_counter() - start
+
+        _check_agreement(test_id, singles, batch)
+        single_rate = args.respondents / single_s
+        batch_rate = args.respondents / batch_s
+        print(f"{test_id:<12} {single_rate:>16,.0f} {batch_rate:>16,.0f} {batch_rate / single_rate:>8.0f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
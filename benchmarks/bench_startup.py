@@ -0,0 +1,69 @@
+"""Cold-start benchmark: time from process start to the first painted frame.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_startup --runs 5 --budget-ms 1500
+
+Each run launches the app in a fresh data directory with
+`--profile-startup --exit-after-paint` (offscreen Qt platform unless
+`QT_QPA_PLATFORM` is already set), reads `logs/startup_profile.json` and prints
+the median of every phase. With `--budget-ms`, exits non-zero when the median
+total exceeds the budget, so it can guard startup regressions in CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+
+def _run_once(repo_root: Path) -> Dict[str, float]:
+    with tempfile.TemporaryDirectory() as home:
+        env = dict(os.environ)
+        env["HOME"] = home
+        env["USERPROFILE"] = home
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+        subprocess.run(
+            [sys.executable, str(repo_root / "main.py"), "--profile-startup", "--exit-after-paint"],
+            env=env,
+            check=True,
+            timeout=120,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        data = json.loads((Path(home) / ".characterify" / "logs" / "startup_profile.json").read_text("utf-8"))
+    timings = dict(data["phases_ms"])
+    timings["total"] = data["total_ms"]
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    repo_root = Path(__file__).resolve().parents[1]
+    runs: List[Dict[str, float]] = [_run_once(repo_root) for _ in range(args.runs)]
+
+    print(f"{'phase':<14} {'median (ms)':>12} {'max (ms)':>10}")
+    for phase in runs[0]:
+        values = [r.get(phase, 0.0) for r in runs]
+        print(f"{phase:<14} {statistics.median(values):>12.1f} {max(values):>10.1f}")
+
+    total = statistics.median(r["total"] for r in runs)
+    if args.budget_ms is not None and total > args.budget_ms:
+        print(f"FAIL: median startup {total:.1f}ms exceeds budget {args.budget_ms:.1f}ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
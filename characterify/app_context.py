@@ -4,8 +4,10 @@ from dataclasses import dataclass
 from typing import Optional
 
 from characterify.db.database import Database
+from characterify.services.article_status import ArticleStatusService
 from characterify.services.auth import AuthService
 from characterify.services.pdf_report import PdfReportService
+from characterify.services.report_jobs import ReportJobService
 from characterify.services.scoring import ScoringService
 from characterify.services.security import SecurityService
 from characterify.services.settings import SettingsService
@@ -24,6 +26,8 @@ class AppContext:
     pdf: PdfReportService
     security: SecurityService
     settings: SettingsService
+    article_status: ArticleStatusService
+    reports: ReportJobService
 
     current_user_id: Optional[int] = None
 
@@ -0,0 +1,361 @@
+"""Headless command line for scoring and report generation (no Qt needed).
+
+    python -m characterify.cli score mbti answers.json
+    python -m characterify.cli regenerate --all-users --since 2026-01-01 --dry-run
+    python -m characterify.cli export pdf --user budi@example.com --since 2026-01-01 --until 2026-01-31
+    python -m characterify.cli export csv --all-users
+
+Works directly on `characterify.db` in the data folder (`--data-dir`, default
+`~/.characterify`); files are written to its `exports/` folder. PDF exports are
+split into tasks and run on a process pool (`--workers`).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from characterify.db.database import Database
+from characterify.db.repositories import UserRepository
+from characterify.services.history import HistoryService
+from characterify.services.pdf_report import BATCH_MODES, CHART_BACKENDS, PdfReportService
+from characterify.services.scoring import ScoringService
+from characterify.services.security import SecurityService
+from characterify.services.settings import SettingsService
+from characterify.utils.paths import AppPaths
+
+logger = logging.getLogger("characterify")
+
+# Allowed answer values per question scale
+_SCALE_RANGES: Dict[str, Tuple[int, int]] = {"likert5": (1, 5)}
+
+
+class CliError(Exception):
+    """Invalid input; reported without a traceback (exit code 2)."""
+
+
+# ---------------------------
+# Helpers
+# ---------------------------
+def _paths(data_dir: Optional[str]) -> AppPaths:
+    paths = AppPaths(base_dir=Path(data_dir).expanduser()) if data_dir else AppPaths()
+    paths.ensure()
+    return paths
+
+
+def _open_db(paths: AppPaths) -> Database:
+    db = Database(paths.db_path)
+    db.initialize()
+    return db
+
+
+def _date_bounds(since: Optional[str], until: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """ISO bounds for `since <= created_at < until`; a plain date `until` includes that whole day."""
+
+    def parse(value: str, name: str) -> datetime:
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError as exc:
+            raise CliError(f"--{name} tidak valid (pakai YYYY-MM-DD atau ISO datetime): {value}") from exc
+
+    lo = parse(since, "since").isoformat() if since else None
+    hi = None
+    if until:
+        end = parse(until, "until")
+        if len(until) == 10:
+            end += timedelta(days=1)
+        hi = end.isoformat()
+    return lo, hi
+
+
+def _resolve_users(db: Database, users: List[str], all_users: bool) -> List[int]:
+    repo = UserRepository(db)
+    if all_users:
+        return repo.list_ids()
+    if not users:
+        raise CliError("Pilih user dengan --user (id atau email) atau --all-users.")
+    ids: List[int] = []
+    for ref in users:
+        row = repo.get_by_id(int(ref)) if ref.isdigit() else repo.get_by_email(ref)
+        if not row:
+            raise CliError(f"User tidak ditemukan: {ref}")
+        ids.append(int(row["id"]))
+    return list(dict.fromkeys(ids))
+
+
+def _read_answers(path: Path) -> List[Dict[int, int]]:
+    """Respondents in an answer file.
+
+    Accepted: `{"0": 5, "1": 3, ...}`, a list of answers in question order,
+    either of those under an `"answers"` key, or a list of respondents.
+    """
+
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        raise CliError(f"Tidak bisa membaca {path}: {exc}") from exc
+
+    def one(obj: Any) -> Dict[int, int]:
+        if isinstance(obj, dict) and "answers" in obj:
+            obj = obj["answers"]
+        try:
+            if isinstance(obj, dict):
+                return {int(k): int(v) for k, v in obj.items()}
+            if isinstance(obj, list) and all(isinstance(v, (int, float)) for v in obj):
+                return {i: int(v) for i, v in enumerate(obj)}
+        except (TypeError, ValueError) as exc:
+            raise CliError(f"Format jawaban tidak valid di {path}: {exc}") from exc
+        raise CliError(f"Format jawaban tidak dikenal di {path}")
+
+    if isinstance(data, list) and data and not all(isinstance(v, (int, float)) for v in data):
+        return [one(x) for x in data]
+    return [one(data)]
+
+
+def _check_answers(test, answers: Dict[int, int], where: str) -> None:
+    """Reject question indices and answer values outside the test's range."""
+
+    low, high = _SCALE_RANGES.get(test.scale_type, (1, 5))
+    count = len(test.questions)
+    for index, value in answers.items():
+        if not 0 <= index < count:
+            raise CliError(f"{where}: nomor soal {index} di luar rentang 0-{count - 1} untuk tes {test.id}")
+        if not low <= value <= high:
+            raise CliError(f"{where}: jawaban soal {index} = {value} di luar skala {low}-{high}")
+
+
+def _user_lang(settings: SettingsService, user_id: int, lang: Optional[str]) -> str:
+    return lang or str(settings.get_language(user_id))
+
+
+# ---------------------------
+# score
+# ---------------------------
+def cmd_score(args: argparse.Namespace) -> int:
+    scoring = ScoringService()
+    test = scoring.get_test(args.test_id)
+    if test is None:
+        raise CliError(f"Tes tidak dikenal: {args.test_id}")
+    # Validate every file before writing any output
+    respondents = [(file, index, answers) for file in args.files for index, answers in enumerate(_read_answers(Path(file)))]
+    for file, index, answers in respondents:
+        _check_answers(test, answers, f"{file}[{index}]")
+    out = open(args.out, "w", encoding="utf-8") if args.out else sys.stdout
+    try:
+        for file, index, answers in respondents:
+            payload = scoring.score_test(args.test_id, answers, args.lang)
+            if args.compact:
+                payload = scoring.compact_payload(payload)
+            record = {"file": file, "index": index, "result_type": payload.get("result_type"), "payload": payload}
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+# ---------------------------
+# regenerate
+# ---------------------------
+def cmd_regenerate(args: argparse.Namespace) -> int:
+    paths = _paths(args.data_dir)
+    db = _open_db(paths)
+    try:
+        since, until = _date_bounds(args.since, args.until)
+        history = HistoryService(db, paths)
+        scoring = ScoringService()
+        total = {"checked": 0, "changed": 0, "skipped": 0}
+        for uid in _resolve_users(db, args.user, args.all_users):
+            counts = history.regenerate(uid, scoring, since=since, until=until, dry_run=args.dry_run)
+            print(f"user {uid}: {counts['checked']} dicek, {counts['changed']} berubah, {counts['skipped']} dilewati")
+            for k in total:
+                total[k] += counts[k]
+        note = " (dry run, tidak disimpan)" if args.dry_run else ""
+        print(f"Total: {total['checked']} dicek, {total['changed']} berubah, {total['skipped']} dilewati{note}")
+    finally:
+        db.close()
+    return 0
+
+
+# ---------------------------
+# export
+# ---------------------------
+def _pdf_task(
+    base_dir: str,
+    user_id: int,
+    history_ids: List[int],
+    mode: str,
+    chart_backend: Optional[str],
+    lang: str,
+) -> List[str]:
+    """One unit of PDF work (runs in a worker process; opens its own connection)."""
+
+    paths = AppPaths(base_dir=Path(base_dir))
+    db = Database(paths.db_path)
+    try:
+        user = UserRepository(db).get_by_id(user_id) or {}
+        # The pool already uses every core; render charts in-process
+        pdf = PdfReportService(paths=paths, db=db, scoring=ScoringService(), chart_processes=1)
+        out = pdf.create_reports_batch(
+            history_ids,
+            mode=mode,
+            user_id=user_id,
+            user_name=user.get("name", "User"),
+            user_email=user.get("email", "-"),
+            lang=lang,
+            chart_backend=chart_backend,
+        )
+        return [str(p) for p in out]
+    finally:
+        db.close()
+
+
+def _chunks(items: List[int], size: int) -> Iterable[List[int]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def cmd_export(args: argparse.Namespace) -> int:
+    paths = _paths(args.data_dir)
+    db = _open_db(paths)
+    try:
+        since, until = _date_bounds(args.since, args.until)
+        user_ids = _resolve_users(db, args.user, args.all_users)
+        history = HistoryService(db, paths)
+
+        if args.format in ("json", "csv"):
+            export = history.export_json if args.format == "json" else history.export_csv
+            for uid in user_ids:
+                print(export(uid, since=since, until=until))
+            return 0
+
+        settings = SettingsService(db=db, security=SecurityService(paths), paths=paths)
+        tasks: List[Tuple[int, List[int], str]] = []
+        for uid in user_ids:
+            ids = [int(r["id"]) for r in history.repo.list_range(uid, since=since, until=until)]
+            if not ids:
+                continue
+            lang = _user_lang(settings, uid, args.lang)
+            if args.mode == "combined":
+                tasks.append((uid, ids, lang))
+            else:
+                tasks.extend((uid, chunk, lang) for chunk in _chunks(ids, args.chunk_size))
+    finally:
+        db.close()
+
+    if not tasks:
+        print("Tidak ada history pada rentang ini.")
+        return 0
+
+    base_dir = str(paths.base_dir)
+    failed = 0
+    written: List[Path] = []
+    seen: Dict[Path, int] = {}
+
+    def collect(uid: int, paths_out: List[str]) -> None:
+        nonlocal failed
+        for p in map(Path, paths_out):
+            if p in seen:
+                logger.error(f"PDF export wrote the same file twice | path={p} users={seen[p]},{uid}")
+                failed += 1
+                continue
+            seen[p] = uid
+            if not p.is_file():
+                logger.error(f"PDF export reported a missing file | user={uid} path={p}")
+                failed += 1
+                continue
+            print(p)
+            written.append(p)
+
+    workers = max(1, min(args.workers, len(tasks)))
+    if workers == 1:
+        for uid, ids, lang in tasks:
+            try:
+                collect(uid, _pdf_task(base_dir, uid, ids, args.mode, args.chart_backend, lang))
+            except Exception:
+                logger.exception(f"PDF export failed | user={uid}")
+                failed += 1
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(_pdf_task, base_dir, uid, ids, args.mode, args.chart_backend, lang): uid
+                for uid, ids, lang in tasks
+            }
+            for fut in as_completed(futures):
+                try:
+                    paths_out = fut.result()
+                except Exception:
+                    logger.exception(f"PDF export failed | user={futures[fut]}")
+                    failed += 1
+                    continue
+                collect(futures[fut], paths_out)
+
+    print(f"{len(written)} PDF ditulis, {failed} tugas gagal.", file=sys.stderr)
+    return 1 if failed else 0
+
+
+# ---------------------------
+# Entry point
+# ---------------------------
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m characterify.cli", description="Characterify tanpa GUI.")
+    parser.add_argument("--data-dir", help="Folder data (default: ~/.characterify)")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("score", help="Skor file jawaban (output JSON Lines)")
+    p.add_argument("test_id", help="mbti | ocean | enneagram | temperament")
+    p.add_argument("files", nargs="+", help="File JSON jawaban")
+    p.add_argument("--lang", default="id", choices=("id", "en"))
+    p.add_argument("--compact", action="store_true", help="Hanya skor (tanpa konten narasi)")
+    p.add_argument("--out", help="Tulis ke file, bukan stdout")
+    p.set_defaults(func=cmd_score)
+
+    def add_selection(p: argparse.ArgumentParser) -> None:
+        p.add_argument("--user", action="append", default=[], help="Id atau email user (boleh berulang)")
+        p.add_argument("--all-users", action="store_true")
+        p.add_argument("--since", help="Mulai tanggal (YYYY-MM-DD, inklusif)")
+        p.add_argument("--until", help="Sampai tanggal (YYYY-MM-DD, inklusif)")
+
+    p = sub.add_parser("regenerate", help="Hitung ulang hasil dari jawaban tersimpan")
+    add_selection(p)
+    p.add_argument("--dry-run", action="store_true", help="Hanya hitung perubahan, jangan simpan")
+    p.set_defaults(func=cmd_regenerate)
+
+    p = sub.add_parser("export", help="Export history ke PDF/JSON/CSV")
+    p.add_argument("format", choices=("pdf", "json", "csv"))
+    add_selection(p)
+    p.add_argument("--mode", default="separate", choices=BATCH_MODES, help="PDF: satu file per history atau gabungan per user")
+    p.add_argument("--chart-backend", choices=CHART_BACKENDS, default=None)
+    p.add_argument("--lang", choices=("id", "en"), default=None, help="Default: bahasa di pengaturan user")
+    p.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1))
+    p.add_argument("--chunk-size", type=int, default=20, help="History per tugas PDF (mode separate)")
+    p.set_defaults(func=cmd_export)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s %(levelname)s %(message)s",
+    )
+    if getattr(args, "chunk_size", 1) < 1:
+        parser.error("--chunk-size minimal 1")
+    try:
+        return int(args.func(args))
+    except CliError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,305 @@
+"""Article content pack: metadata up front, bodies loaded on demand.
+
+`characterify/data/articles.py` is the editable source. `build_pack` turns it
+into `assets/articles/articles.pack`:
+
+    MAGIC (8 bytes) | header length (uint32 BE) | header JSON (UTF-8) | bodies
+
+The header lists every article's localized metadata plus the offset/length of
+each zlib-compressed body. List views only parse the header; `get_article`
+seeks to and inflates a single body.
+
+The header records a hash of `articles.py`. If the pack is missing or was
+built from a different source, everything falls back to importing
+`articles.py` directly, so editing articles never shows stale content.
+
+Rebuild after editing articles:
+
+    python -m characterify.data.article_store
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import struct
+import zlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+MAGIC = b"CHRARTP1"
+PACK_VERSION = 1
+
+_DATA_DIR = Path(__file__).resolve().parent
+SOURCE_PATH = _DATA_DIR / "articles.py"
+PACK_PATH = _DATA_DIR.parent / "assets" / "articles" / "articles.pack"
+
+LANGS = ("id", "en")
+
+# Reading speed used for the computed `read_minutes`
+WORDS_PER_MINUTE = 200
+
+
+def _lang(lang: str) -> str:
+    return "en" if lang == "en" else "id"
+
+
+def _source_hash() -> Optional[str]:
+    try:
+        return hashlib.sha256(SOURCE_PATH.read_bytes()).hexdigest()
+    except OSError:
+        # Frozen/packaged builds may ship without the .py source; trust the pack.
+        return None
+
+
+# ---------------------------
+# Body helpers
+# ---------------------------
+def word_count_html(html: str) -> int:
+    text = re.sub(r"<[^>]+>", " ", html)
+    text = re.sub(r"&[a-zA-Z0-9#]+;", " ", text)
+    text = re.sub(r"\s+", " ", text).strip()
+    return 0 if not text else len(text.split(" "))
+
+
+def augment_if_short(title: str, html: str, lang: str) -> str:
+    """Append a practice/reflection block to articles under 200 words."""
+
+    if word_count_html(html) >= 200:
+        return html
+
+    if lang == "en":
+        extra = f"""
+<h2>Practice & Reflection</h2>
+<p><b>Make it actionable:</b> pick one idea from <i>{title}</i> and turn it into a small habit you can repeat for 7 days. Keep the habit tiny on purpose—consistency matters more than intensity.</p>
+<ul>
+  <li><b>One-sentence plan:</b> “When ___ happens, I will ___ for ___ minutes.”</li>
+  <li><b>Friction check:</b> what usually blocks you (time, mood, environment)? Remove one obstacle.</li>
+  <li><b>Scorecard:</b> after each day, rate (1–5) your energy, focus, and stress. Look for patterns.</li>
+</ul>
+<p><b>Reflection prompts:</b> What did you learn about your defaults? Which situation amplified your strengths—and which one triggered your blind spot? Write a short note so the insight becomes reusable, not just a “nice read.”</p>
+<p><i>Reminder:</i> this content is educational and not a clinical diagnosis. If distress or anxiety feels heavy and persistent, consider talking with a qualified professional.</p>
+"""
+    else:
+        extra = f"""
+<h2>Latihan & Refleksi</h2>
+<p><b>Buat jadi nyata:</b> pilih satu ide dari <i>{title}</i> lalu ubah menjadi kebiasaan kecil selama 7 hari. Sengaja dibuat kecil agar mudah konsisten—stabilitas lebih penting daripada intensitas.</p>
+<ul>
+  <li><b>Rencana 1 kalimat:</b> “Saat ___ terjadi, saya akan ___ selama ___ menit.”</li>
+  <li><b>Cek hambatan:</b> apa yang biasanya menghalangi (waktu, mood, lingkungan)? Hilangkan 1 hambatan.</li>
+  <li><b>Skor harian:</b> setelah menjalankan, nilai (1–5) energi, fokus, dan stres. Cari polanya.</li>
+</ul>
+<p><b>Pertanyaan refleksi:</b> Apa yang Anda pelajari tentang pola otomatis Anda? Situasi apa yang memperkuat kekuatan Anda—dan situasi apa yang memicu blind spot? Catat singkat agar insight bisa dipakai ulang.</p>
+<p><i>Catatan:</i> konten ini bersifat edukatif dan bukan diagnosis klinis. Jika stres atau kecemasan terasa berat dan berkepanjangan, pertimbangkan berdiskusi dengan profesional.</p>
+"""
+
+    return html + "\n" + extra
+
+
+# ---------------------------
+# Build
+# ---------------------------
+def build_pack(path: Path = PACK_PATH) -> Path:
+    """Write the content pack from `characterify.data.articles.ARTICLES`."""
+
+    from characterify.data.articles import ARTICLES
+
+    blobs: List[bytes] = []
+    offset = 0
+    entries: List[Dict[str, Any]] = []
+    for a in ARTICLES:
+        entry: Dict[str, Any] = {"id": a["id"], "read_time": a["read_time"], "meta": {}, "bodies": {}}
+        for lang in LANGS:
+            title = a[f"title_{lang}"]
+            raw = a[f"content_{lang}"]
+            words = word_count_html(augment_if_short(title=title, html=raw, lang=lang))
+            entry["meta"][lang] = {
+                "title": title,
+                "category": a[f"category_{lang}"],
+                "summary": a[f"summary_{lang}"],
+                "word_count": words,
+            }
+            blob = zlib.compress(raw.encode("utf-8"), 9)
+            entry["bodies"][lang] = [offset, len(blob)]
+            blobs.append(blob)
+            offset += len(blob)
+        entries.append(entry)
+
+    header = json.dumps(
+        {"version": PACK_VERSION, "source_sha256": _source_hash(), "articles": entries},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with tmp.open("wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack(">I", len(header)))
+        f.write(header)
+        for blob in blobs:
+            f.write(blob)
+    tmp.replace(path)
+    return path
+
+
+# ---------------------------
+# Read
+# ---------------------------
+class ArticlePack:
+    """Read-only view of a content pack (header parsed once, bodies on demand)."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with path.open("rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"Not an article pack: {path}")
+            (size,) = struct.unpack(">I", f.read(4))
+            self.header: Dict[str, Any] = json.loads(f.read(size).decode("utf-8"))
+        self._data_start = len(MAGIC) + 4 + size
+        self.entries: Dict[str, Dict[str, Any]] = {e["id"]: e for e in self.header.get("articles", [])}
+
+    def body(self, article_id: str, lang: str) -> str:
+        entry = self.entries.get(article_id)
+        if not entry:
+            return ""
+        offset, length = entry["bodies"][lang]
+        with self.path.open("rb") as f:
+            f.seek(self._data_start + offset)
+            return zlib.decompress(f.read(length)).decode("utf-8")
+
+
+_UNSET = object()
+_pack: Any = _UNSET
+
+
+def _open_pack() -> Optional[ArticlePack]:
+    """The current pack, or None when it is missing or stale."""
+
+    global _pack
+    if _pack is _UNSET:
+        _pack = None
+        logger = logging.getLogger("characterify")
+        try:
+            pack = ArticlePack(PACK_PATH)
+            expected = _source_hash()
+            if pack.header.get("version") != PACK_VERSION:
+                logger.info("Article pack has an old format; using articles.py")
+            elif expected is not None and pack.header.get("source_sha256") != expected:
+                logger.info("Article pack is out of date; using articles.py (rebuild with python -m characterify.data.article_store)")
+            else:
+                _pack = pack
+        except FileNotFoundError:
+            pass
+        except Exception:
+            logger.warning("Could not read article pack; using articles.py", exc_info=True)
+    return _pack
+
+
+# lang -> {article id: metadata record}; built once per language on first use
+_CATALOG: Dict[str, Dict[str, Dict]] = {}
+# Bumped by invalidate_catalog() so derived caches (e.g. the search index) can rebuild
+_CATALOG_VERSION = 0
+
+
+def _record(article_id: str, read_time: str, meta: Dict[str, Any]) -> Dict:
+    words = int(meta.get("word_count", 0))
+    return {
+        "id": article_id,
+        "title": meta["title"],
+        "category": meta["category"],
+        "read_time": read_time,
+        "summary": meta["summary"],
+        "word_count": words,
+        "read_minutes": max(1, round(words / WORDS_PER_MINUTE)),
+    }
+
+
+def _catalog(lang: str) -> Dict[str, Dict]:
+    lang = _lang(lang)
+    catalog = _CATALOG.get(lang)
+    if catalog is None:
+        pack = _open_pack()
+        if pack is not None:
+            catalog = {
+                e["id"]: _record(e["id"], e["read_time"], e["meta"][lang]) for e in pack.header["articles"]
+            }
+        else:
+            from characterify.data import articles
+
+            catalog = {
+                a["id"]: {k: v for k, v in a.items() if k != "content"} for a in articles.get_articles(lang)
+            }
+        _CATALOG[lang] = catalog
+    return catalog
+
+
+def invalidate_catalog() -> None:
+    """Forget the loaded pack and catalogs (call after rebuilding or editing articles)."""
+
+    global _pack, _CATALOG_VERSION
+    _pack = _UNSET
+    _CATALOG.clear()
+    _raw_body.cache_clear()
+    try:
+        from characterify.data import articles
+
+        articles.invalidate_catalog()
+    except Exception:
+        pass
+    _CATALOG_VERSION += 1
+
+
+def catalog_version() -> int:
+    return _CATALOG_VERSION
+
+
+@lru_cache(maxsize=16)
+def _raw_body(article_id: str, lang: str) -> str:
+    pack = _open_pack()
+    if pack is not None:
+        return pack.body(article_id, lang)
+    from characterify.data.articles import ARTICLES
+
+    a = next((x for x in ARTICLES if x["id"] == article_id), None)
+    return a[f"content_{lang}"] if a else ""
+
+
+def get_articles(lang: str = "id") -> List[Dict]:
+    """Localized article metadata for list views (no `content`).
+
+    Records are shared between calls; treat them as read-only.
+    """
+
+    return list(_catalog(lang).values())
+
+
+def get_article(article_id: str, lang: str = "id") -> Dict:
+    """A single localized article including its HTML `content`."""
+
+    lang = _lang(lang)
+    meta = _catalog(lang).get(article_id)
+    if not meta:
+        return {}
+    content = augment_if_short(title=meta["title"], html=_raw_body(article_id, lang), lang=lang)
+    return {**meta, "content": content}
+
+
+def iter_bodies(lang: str = "id"):
+    """Yield (article id, raw body HTML) for every article, e.g. for indexing."""
+
+    lang = _lang(lang)
+    pack = _open_pack()
+    for article_id in _catalog(lang):
+        if pack is not None:
+            yield article_id, pack.body(article_id, lang)
+        else:
+            yield article_id, _raw_body(article_id, lang)
+
+
+if __name__ == "__main__":
+    out = build_pack()
+    print(f"Wrote {out} ({out.stat().st_size:,} bytes)")
@@ -1,47 +1,11 @@
 from __future__ import annotations
 from typing import Dict, List
 
-
-def _word_count_html(html: str) -> int:
-    import re
-
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"&[a-zA-Z0-9#]+;", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
-    return 0 if not text else len(text.split(" "))
-
-
-def _augment_if_short(title: str, html: str, lang: str) -> str:
-
-    if _word_count_html(html) >= 200:
-        return html
-
-    if lang == "en":
-        extra = f"""
-<h2>Practice & Reflection</h2>
-<p><b>Make it actionable:</b> pick one idea from <i>{title}</i> and turn it into a small habit you can repeat for 7 days. Keep the habit tiny on purpose—consistency matters more than intensity.</p>
-<ul>
-  <li><b>One-sentence plan:</b> “When ___ happens, I will ___ for ___ minutes.”</li>
-  <li><b>Friction check:</b> what usually blocks you (time, mood, environment)? Remove one obstacle.</li>
-  <li><b>Scorecard:</b> after each day, rate (1–5) your energy, focus, and stress. Look for patterns.</li>
-</ul>
-<p><b>Reflection prompts:</b> What did you learn about your defaults? Which situation amplified your strengths—and which one triggered your blind spot? Write a short note so the insight becomes reusable, not just a “nice read.”</p>
-<p><i>Reminder:</i> this content is educational and not a clinical diagnosis. If distress or anxiety feels heavy and persistent, consider talking with a qualified professional.</p>
-"""
-    else:
-        extra = f"""
-<h2>Latihan & Refleksi</h2>
-<p><b>Buat jadi nyata:</b> pilih satu ide dari <i>{title}</i> lalu ubah menjadi kebiasaan kecil selama 7 hari. Sengaja dibuat kecil agar mudah konsisten—stabilitas lebih penting daripada intensitas.</p>
-<ul>
-  <li><b>Rencana 1 kalimat:</b> “Saat ___ terjadi, saya akan ___ selama ___ menit.”</li>
-  <li><b>Cek hambatan:</b> apa yang biasanya menghalangi (waktu, mood, lingkungan)? Hilangkan 1 hambatan.</li>
-  <li><b>Skor harian:</b> setelah menjalankan, nilai (1–5) energi, fokus, dan stres. Cari polanya.</li>
-</ul>
-<p><b>Pertanyaan refleksi:</b> Apa yang Anda pelajari tentang pola otomatis Anda? Situasi apa yang memperkuat kekuatan Anda—dan situasi apa yang memicu blind spot? Catat singkat agar insight bisa dipakai ulang.</p>
-<p><i>Catatan:</i> konten ini bersifat edukatif dan bukan diagnosis klinis. Jika stres atau kecemasan terasa berat dan berkepanjangan, pertimbangkan berdiskusi dengan profesional.</p>
-"""
-
-    return html + "\n" + extra
+# Source data for the article content pack (see `article_store`). Runtime code
+# should go through `characterify.data.article_store` instead of importing this.
+from characterify.data.article_store import WORDS_PER_MINUTE
+from characterify.data.article_store import augment_if_short as _augment_if_short
+from characterify.data.article_store import word_count_html as _word_count_html
 
 
 ARTICLES: List[Dict] = [
@@ -1346,48 +1310,54 @@ ARTICLES += [
 ]
 
 
+# lang -> {article id: localized record}; built once per language on first use
+_CATALOG: Dict[str, Dict[str, Dict]] = {}
+
+
+def _localize(a: Dict, lang: str) -> Dict:
+    title = a["title_en"] if lang == "en" else a["title_id"]
+    content = _augment_if_short(
+        title=title,
+        html=(a["content_en"] if lang == "en" else a["content_id"]),
+        lang=lang,
+    )
+    words = _word_count_html(content)
+    return {
+        "id": a["id"],
+        "title": title,
+        "category": a["category_en"] if lang == "en" else a["category_id"],
+        "read_time": a["read_time"],
+        "summary": a["summary_en"] if lang == "en" else a["summary_id"],
+        "content": content,
+        "word_count": words,
+        "read_minutes": max(1, round(words / WORDS_PER_MINUTE)),
+    }
+
+
+def _catalog(lang: str) -> Dict[str, Dict]:
+    lang = "en" if lang == "en" else "id"
+    catalog = _CATALOG.get(lang)
+    if catalog is None:
+        catalog = _CATALOG[lang] = {a["id"]: _localize(a, lang) for a in ARTICLES}
+    return catalog
+
+
+def invalidate_catalog() -> None:
+    """Drop the localized catalogs (call after `ARTICLES` changes)."""
+    _CATALOG.clear()
+
+
 def get_articles(lang: str = "id") -> List[Dict]:
     """Return localized article list.
 
-    The UI uses this to render cards and article content.
+    The UI uses this to render cards and article content. Records are shared
+    between calls; treat them as read-only.
     """
 
-    lang = "en" if lang == "en" else "id"
-    out: List[Dict] = []
-    for a in ARTICLES:
-        out.append(
-            {
-                "id": a["id"],
-                "title": a["title_en"] if lang == "en" else a["title_id"],
-                "category": a["category_en"] if lang == "en" else a["category_id"],
-                "read_time": a["read_time"],
-                "summary": a["summary_en"] if lang == "en" else a["summary_id"],
-                "content": _augment_if_short(
-                    title=(a["title_en"] if lang == "en" else a["title_id"]),
-                    html=(a["content_en"] if lang == "en" else a["content_id"]),
-                    lang=lang,
-                ),
-            }
-        )
-    return out
+    return list(_catalog(lang).values())
 
 
 def get_article(article_id: str, lang: str = "id") -> Dict:
     """Get a single localized article by id."""
 
-    lang = "en" if lang == "en" else "id"
-    a = next((x for x in ARTICLES if x["id"] == article_id), None)
-    if not a:
-        return {}
-    return {
-        "id": a["id"],
-        "title": a["title_en"] if lang == "en" else a["title_id"],
-        "category": a["category_en"] if lang == "en" else a["category_id"],
-        "read_time": a["read_time"],
-        "summary": a["summary_en"] if lang == "en" else a["summary_id"],
-        "content": _augment_if_short(
-            title=(a["title_en"] if lang == "en" else a["title_id"]),
-            html=(a["content_en"] if lang == "en" else a["content_id"]),
-            lang=lang,
-        ),
-    }
+    return _catalog(lang).get(article_id) or {}
@@ -2,25 +2,173 @@ from __future__ import annotations
 
 import json
 import sqlite3
-from dataclasses import dataclass
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from characterify.db.migrations import migrate
+
+# Accepted values of the keyword PRAGMAs (they cannot be bound as parameters)
+JOURNAL_MODES = ("WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY", "OFF")
+SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+TEMP_STORES = ("DEFAULT", "FILE", "MEMORY")
+
+
+@dataclass
+class StorageProfile:
+    """SQLite PRAGMAs applied to every new connection.
+
+    The defaults favour a desktop app: WAL so the UI can keep reading while a
+    write (export, history insert) is in progress, and `synchronous=NORMAL`
+    which is safe with WAL and avoids a full fsync per commit.
+    """
+
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    cache_size_kib: int = 8192
+    mmap_size: int = 64 * 1024 * 1024
+    temp_store: str = "MEMORY"
+    busy_timeout_ms: int = 5000
+
+    def __post_init__(self) -> None:
+        self.validate()
+
+    def validate(self) -> None:
+        """Normalize the keyword settings; raises ValueError for unknown values."""
+
+        for name, allowed in (
+            ("journal_mode", JOURNAL_MODES),
+            ("synchronous", SYNCHRONOUS_MODES),
+            ("temp_store", TEMP_STORES),
+        ):
+            value = str(getattr(self, name)).strip().upper()
+            if value not in allowed:
+                raise ValueError(f"storage.{name} tidak valid: {getattr(self, name)!r} (pilih: {', '.join(allowed)})")
+            setattr(self, name, value)
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "StorageProfile":
+        """Build a profile from the `storage` block of `app_config.json`."""
+
+        profile = cls()
+        for key, value in (config or {}).items():
+            if key in cls.__dataclass_fields__:
+                setattr(profile, key, type(getattr(profile, key))(value))
+        profile.validate()
+        return profile
+
+    def pragmas(self) -> List[str]:
+        self.validate()
+        return [
+            f"PRAGMA journal_mode = {self.journal_mode};",
+            f"PRAGMA synchronous = {self.synchronous};",
+            # Negative value = size in KiB (not pages)
+            f"PRAGMA cache_size = {-abs(int(self.cache_size_kib))};",
+            f"PRAGMA mmap_size = {int(self.mmap_size)};",
+            f"PRAGMA temp_store = {self.temp_store};",
+            f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)};",
+        ]
 
 
 @dataclass
 class Database:
-    """Thin wrapper around sqlite3 with helper methods."""
+    """Thin wrapper around sqlite3 with helper methods.
+
+    Connections are cached per thread: the first query on a thread opens a
+    connection (and applies the connection PRAGMAs), later queries reuse it.
+    A cached connection is only health-checked after a query on it failed.
+    Call :meth:`close` on shutdown to release every cached connection.
+    """
 
     path: Path
+    profile: StorageProfile = field(default_factory=StorageProfile)
+
+    last_used: float = field(default=0.0, init=False, repr=False)
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.path, check_same_thread=False)
+    _local: threading.local = field(default_factory=threading.local, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _connections: List[sqlite3.Connection] = field(default_factory=list, init=False, repr=False)
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False, timeout=self.profile.busy_timeout_ms / 1000)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys = ON;")
+        for pragma in self.profile.pragmas():
+            conn.execute(pragma)
+        return conn
+
+    def _connect(self, touch: bool = True) -> sqlite3.Connection:
+        """Return this thread's cached connection, reopening it if it went bad.
+
+        `touch=False` leaves `last_used` alone (maintenance must not count as use).
+        """
+
+        if touch:
+            self.last_used = time.monotonic()
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+        if conn is not None:
+            if not getattr(self._local, "suspect", False):
+                return conn
+            self._local.suspect = False
+            if self._is_healthy(conn):
+                return conn
+            self._discard(conn)
+
+        conn = self._open()
+        self._local.conn = conn
+        with self._lock:
+            self._connections.append(conn)
         return conn
 
+    @contextmanager
+    def _session(self) -> Iterator[sqlite3.Connection]:
+        """`with conn:` on this thread's connection; an sqlite3 error marks it for a health check."""
+
+        conn = self._connect()
+        try:
+            with conn:
+                yield conn
+        except sqlite3.Error:
+            self._local.suspect = True
+            raise
+
+    @staticmethod
+    def _is_healthy(conn: sqlite3.Connection) -> bool:
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        with self._lock:
+            if conn in self._connections:
+                self._connections.remove(conn)
+        if getattr(self._local, "conn", None) is conn:
+            self._local.conn = None
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    def close(self) -> None:
+        """Close all cached connections (from every thread)."""
+
+        with self._lock:
+            conns = list(self._connections)
+            self._connections.clear()
+        for conn in conns:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
+
     def initialize(self) -> None:
-        with self._connect() as conn:
+        with self._session() as conn:
             conn.executescript(
                 """
                 CREATE TABLE IF NOT EXISTS users (
@@ -67,30 +215,46 @@ class Database:
                 );
                 """
             )
+            migrate(conn)
 
     def fetch_one(self, query: str, params: Sequence[Any] = ()) -> Optional[Dict[str, Any]]:
-        with self._connect() as conn:
+        with self._session() as conn:
             cur = conn.execute(query, params)
             row = cur.fetchone()
             return dict(row) if row else None
 
     def fetch_all(self, query: str, params: Sequence[Any] = ()) -> List[Dict[str, Any]]:
-        with self._connect() as conn:
+        with self._session() as conn:
             cur = conn.execute(query, params)
             rows = cur.fetchall()
             return [dict(r) for r in rows]
 
     def execute(self, query: str, params: Sequence[Any] = ()) -> int:
-        with self._connect() as conn:
+        with self._session() as conn:
             cur = conn.execute(query, params)
             conn.commit()
             return int(cur.lastrowid or 0)
 
     def execute_many(self, query: str, params_list: Iterable[Sequence[Any]]) -> None:
-        with self._connect() as conn:
+        with self._session() as conn:
             conn.executemany(query, params_list)
             conn.commit()
 
+    # ---------------------------
+    # Maintenance
+    # ---------------------------
+    def checkpoint(self, mode: str = "PASSIVE") -> Optional[Dict[str, Any]]:
+        """Run `wal_checkpoint`; PASSIVE never blocks readers or writers."""
+
+        mode = mode.upper() if mode.upper() in ("PASSIVE", "FULL", "RESTART", "TRUNCATE") else "PASSIVE"
+        row = self._connect(touch=False).execute(f"PRAGMA wal_checkpoint({mode});").fetchone()
+        if not row:
+            return None
+        return {"busy": row[0], "log_frames": row[1], "checkpointed": row[2]}
+
+    def optimize(self) -> None:
+        self._connect(touch=False).execute("PRAGMA optimize;")
+
     @staticmethod
     def dumps(data: Any) -> str:
         return json.dumps(data, ensure_ascii=False)
@@ -0,0 +1,116 @@
+"""Versioned schema migrations.
+
+`Database.initialize` creates the base tables (version 0) and then calls
+:func:`migrate`, which applies every step in :data:`MIGRATIONS` whose version
+is newer than the one recorded in `schema_version`. Each step runs in its own
+transaction together with the version bump, so a failed step leaves the
+database at the previous version and is retried on next startup.
+
+To evolve the schema, append a new :class:`Migration` with the next version
+number. Never edit or reorder a step that has already shipped.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, List, Union
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    # Either an SQL script or a callable receiving the open connection.
+    apply: Union[str, Callable[[sqlite3.Connection], None]]
+
+
+def _strip_history_content(conn: sqlite3.Connection) -> None:
+    """Drop the stored narrative from history rows (rebuilt on read)."""
+
+    rows = conn.execute(
+        "SELECT id, score_json FROM test_history WHERE score_json LIKE '%\"content\"%'"
+    ).fetchall()
+    updates = []
+    for row_id, raw in rows:
+        try:
+            data = json.loads(raw)
+        except Exception:
+            continue
+        if not isinstance(data, dict) or "content" not in data:
+            continue
+        data.pop("content", None)
+        updates.append((json.dumps(data, ensure_ascii=False), row_id))
+    conn.executemany("UPDATE test_history SET score_json = ? WHERE id = ?", updates)
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(
+        version=1,
+        description="Indexes for history listing (keyset pagination) and bookmarks",
+        apply="""
+            -- Covering for `TestHistoryRepository.list_page` with SUMMARY_COLUMNS:
+            -- the page is read from the index without touching the table rows
+            CREATE INDEX IF NOT EXISTS idx_test_history_user_created_cover
+                ON test_history (user_id, created_at DESC, id DESC, test_type, result_type);
+
+            CREATE INDEX IF NOT EXISTS idx_article_reads_user_bookmarked
+                ON article_reads (user_id, bookmarked, last_read_at DESC, article_id);
+        """,
+    ),
+    Migration(
+        version=2,
+        description="Store compact result payloads (narrative regenerated on read)",
+        apply=_strip_history_content,
+    ),
+]
+
+
+def current_version(conn: sqlite3.Connection) -> int:
+    row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+    return int(row[0] or 0) if row else 0
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """Bring the schema up to date. Safe to call on every startup.
+
+    Returns:
+        The schema version after migrating.
+    """
+
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            description TEXT NOT NULL,
+            applied_at TEXT NOT NULL
+        )
+        """
+    )
+    conn.commit()
+
+    version = current_version(conn)
+    for step in sorted(MIGRATIONS, key=lambda m: m.version):
+        if step.version <= version:
+            continue
+        try:
+            conn.execute("BEGIN")
+            if isinstance(step.apply, str):
+                # executescript() would commit implicitly; run statements one by one
+                for statement in step.apply.split(";"):
+                    if statement.strip():
+                        conn.execute(statement)
+            else:
+                step.apply(conn)
+            conn.execute(
+                "INSERT INTO schema_version (version, description, applied_at) VALUES (?, ?, ?)",
+                (step.version, step.description, datetime.utcnow().isoformat()),
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        version = step.version
+    return version
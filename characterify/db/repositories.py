@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from characterify.db.database import Database
 
@@ -29,6 +29,9 @@ class UserRepository:
     def get_by_id(self, user_id: int) -> Optional[Dict[str, Any]]:
         return self.db.fetch_one("SELECT * FROM users WHERE id = ?", (user_id,))
 
+    def list_ids(self) -> List[int]:
+        return [int(r["id"]) for r in self.db.fetch_all("SELECT id FROM users ORDER BY id")]
+
     def update_profile(self, user_id: int, name: str, email: str) -> None:
         self.db.execute(
             "UPDATE users SET name = ?, email = ? WHERE id = ?",
@@ -54,6 +57,12 @@ class TestHistoryRepository:
 
     db: Database
 
+    # Light columns for list views (no JSON payloads)
+    SUMMARY_COLUMNS = ("id", "test_type", "result_type", "created_at")
+    _ALL_COLUMNS = frozenset(
+        ("id", "user_id", "test_type", "score_json", "result_type", "answers_json", "created_at")
+    )
+
     def add(
         self,
         user_id: int,
@@ -78,12 +87,96 @@ class TestHistoryRepository:
             (user_id,),
         )
 
+    def list_page(
+        self,
+        user_id: int,
+        before_created_at: Optional[str] = None,
+        limit: int = 50,
+        columns: Sequence[str] = SUMMARY_COLUMNS,
+        before_id: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return one page of history, newest first (keyset pagination).
+
+        Pass the `created_at`/`id` of the last row of the previous page as
+        `before_created_at`/`before_id` to get the next page. `id` breaks
+        ties between rows created in the same instant.
+        """
+
+        cols = [c for c in columns if c in self._ALL_COLUMNS]
+        if not cols:
+            raise ValueError("columns must contain at least one known column")
+        # Always return the keyset columns so the caller can request the next page
+        for key in ("created_at", "id"):
+            if key not in cols:
+                cols.append(key)
+
+        query = f"SELECT {', '.join(cols)} FROM test_history WHERE user_id = ?"
+        params: List[Any] = [user_id]
+        if before_created_at is not None:
+            if before_id is None:
+                query += " AND created_at < ?"
+                params.append(before_created_at)
+            else:
+                query += " AND (created_at, id) < (?, ?)"
+                params.extend([before_created_at, before_id])
+        query += " ORDER BY created_at DESC, id DESC LIMIT ?"
+        params.append(max(1, int(limit)))
+        return self.db.fetch_all(query, params)
+
+    def list_range(
+        self,
+        user_id: int,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """All rows with `since <= created_at < until` (either bound optional), oldest first."""
+
+        query = "SELECT * FROM test_history WHERE user_id = ?"
+        params: List[Any] = [user_id]
+        if since is not None:
+            query += " AND created_at >= ?"
+            params.append(since)
+        if until is not None:
+            query += " AND created_at < ?"
+            params.append(until)
+        query += " ORDER BY created_at, id"
+        return self.db.fetch_all(query, params)
+
+    def count_by_user(self, user_id: int) -> int:
+        row = self.db.fetch_one("SELECT COUNT(*) AS n FROM test_history WHERE user_id = ?", (user_id,))
+        return int(row["n"]) if row else 0
+
     def get(self, history_id: int, user_id: int) -> Optional[Dict[str, Any]]:
         return self.db.fetch_one(
             "SELECT * FROM test_history WHERE id = ? AND user_id = ?",
             (history_id, user_id),
         )
 
+    def get_many(self, history_ids: Sequence[int], user_id: int) -> List[Dict[str, Any]]:
+        """Rows for several ids in one query per 500 ids, in the order of `history_ids`.
+
+        Ids that do not exist (or belong to another user) are skipped.
+        """
+
+        ids = list(dict.fromkeys(int(i) for i in history_ids))
+        by_id: Dict[int, Dict[str, Any]] = {}
+        for start in range(0, len(ids), 500):
+            chunk = ids[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for row in self.db.fetch_all(
+                f"SELECT * FROM test_history WHERE user_id = ? AND id IN ({placeholders})",
+                (user_id, *chunk),
+            ):
+                by_id[int(row["id"])] = row
+        return [by_id[i] for i in ids if i in by_id]
+
+    def update_results(self, user_id: int, updates: Sequence[Tuple[int, str, str]]) -> None:
+        """Rewrite stored results in one batch; `updates` holds (history_id, result_type, score_json)."""
+        self.db.execute_many(
+            "UPDATE test_history SET result_type = ?, score_json = ? WHERE id = ? AND user_id = ?",
+            [(result_type, score_json, history_id, user_id) for history_id, result_type, score_json in updates],
+        )
+
     def delete(self, history_id: int, user_id: int) -> None:
         self.db.execute(
             "DELETE FROM test_history WHERE id = ? AND user_id = ?",
@@ -109,6 +202,17 @@ class ArticleReadRepository:
             (user_id, article_id, 1 if bookmarked else 0, now),
         )
 
+    def mark_read_many(self, user_id: int, reads: Sequence[Tuple[str, str]]) -> None:
+        """Record several reads at once; `reads` holds (article_id, read_at ISO timestamp)."""
+        self.db.execute_many(
+            """
+            INSERT INTO article_reads (user_id, article_id, bookmarked, last_read_at)
+            VALUES (?, ?, 0, ?)
+            ON CONFLICT(user_id, article_id) DO UPDATE SET last_read_at=excluded.last_read_at
+            """,
+            [(user_id, article_id, read_at) for article_id, read_at in reads],
+        )
+
     def toggle_bookmark(self, user_id: int, article_id: str, bookmarked: bool) -> None:
         now = datetime.utcnow().isoformat()
         self.db.execute(
@@ -129,6 +233,21 @@ class ArticleReadRepository:
             return {"bookmarked": False, "last_read_at": None}
         return {"bookmarked": bool(row.get("bookmarked")), "last_read_at": row.get("last_read_at")}
 
+    def get_statuses(self, user_id: int) -> Dict[str, Dict[str, Any]]:
+        """Statuses of all of the user's articles in one query.
+
+        Articles without a row are simply absent from the result.
+        """
+
+        rows = self.db.fetch_all(
+            "SELECT article_id, bookmarked, last_read_at FROM article_reads WHERE user_id = ?",
+            (user_id,),
+        )
+        return {
+            r["article_id"]: {"bookmarked": bool(r.get("bookmarked")), "last_read_at": r.get("last_read_at")}
+            for r in rows
+        }
+
     def list_bookmarks(self, user_id: int) -> List[str]:
         rows = self.db.fetch_all(
             "SELECT article_id FROM article_reads WHERE user_id = ? AND bookmarked = 1 ORDER BY last_read_at DESC",
@@ -5,8 +5,15 @@ import sys
 
 
 def main() -> int:
+    from characterify.utils.startup_profile import StartupProfiler, on_first_paint
+
+    # `--profile-startup` logs per-phase timings (and writes logs/startup_profile.json);
+    # `--exit-after-paint` quits once the first frame is drawn (for startup budgets/CI).
+    profiler = StartupProfiler(enabled="--profile-startup" in sys.argv)
+    exit_after_paint = "--exit-after-paint" in sys.argv
 
     try:
+        from PySide6.QtCore import QTimer
         from PySide6.QtGui import QFont
         from PySide6.QtWidgets import QApplication
     except Exception as exc:  # pragma: no cover
@@ -16,9 +23,12 @@ def main() -> int:
         return 1
 
     from characterify.app_context import AppContext
-    from characterify.db.database import Database
+    from characterify.db.database import Database, StorageProfile
+    from characterify.services.article_status import ArticleStatusService
     from characterify.services.auth import AuthService
-    from characterify.services.pdf_report import PdfReportService
+    from characterify.services.maintenance import MaintenanceService
+    from characterify.services.pdf_report import CHART_BACKENDS, PdfReportService
+    from characterify.services.report_jobs import ReportJobService
     from characterify.services.scoring import ScoringService
     from characterify.services.security import SecurityService
     from characterify.services.settings import SettingsService
@@ -26,6 +36,8 @@ def main() -> int:
     from characterify.ui.main_window import MainWindow
     from characterify.utils.paths import AppPaths
 
+    profiler.mark("imports")
+
     # High DPI
     os.environ.setdefault("QT_ENABLE_HIGHDPI_SCALING", "1")
     os.environ.setdefault("QT_SCALE_FACTOR_ROUNDING_POLICY", "PassThrough")
@@ -41,16 +53,25 @@ def main() -> int:
 
     telemetry = TelemetryService(paths)
     telemetry.install_exception_hook()
+    profiler.mark("app_setup")
 
     db = Database(paths.db_path)
-    db.initialize()
-
     security = SecurityService(paths)
     settings = SettingsService(db=db, security=security, paths=paths)
 
+    # Storage tuning can be overridden via the `storage` block of app_config.json
+    db.profile = StorageProfile.from_config(settings.load_global_config().get("storage"))
+    db.initialize()
+    profiler.mark("db_init")
+
     auth = AuthService(db=db, security=security)
+    # Password hashing cost: benchmarked on first run, then read from app_config.json
+    kdf_cfg = settings.load_global_config().get("kdf")
+    kdf_profile = auth.apply_kdf_profile(kdf_cfg)
+    if kdf_profile != kdf_cfg:
+        settings.save_global_config({**settings.load_global_config(), "kdf": kdf_profile})
     scoring = ScoringService()
-    pdf = PdfReportService(paths=paths)
+    pdf = PdfReportService(paths=paths, db=db, scoring=scoring)
     ctx = AppContext(
         db=db,
         auth=auth,
@@ -58,19 +79,54 @@ def main() -> int:
         pdf=pdf,
         security=security,
         settings=settings,
+        article_status=ArticleStatusService(db),
+        reports=ReportJobService(),
     )
 
     # Apply global preferences (pre-login)
     global_cfg = settings.load_global_config()
     settings.apply_theme(app, theme=str(global_cfg.get("theme", "dark")))
     settings.apply_language(app, lang=str(global_cfg.get("language", "id")))
+    # "vector" draws PDF report charts with reportlab instead of embedding a PNG
+    if global_cfg.get("pdf_chart_backend") in CHART_BACKENDS:
+        pdf.chart_backend = str(global_cfg["pdf_chart_backend"])
+    profiler.mark("theme_apply")
 
     window = MainWindow(ctx=ctx, telemetry=telemetry)
     window.resize(1240, 760)
     window.show()
+    profiler.mark("window_build")
+
+    def _first_paint() -> None:
+        profiler.mark("first_paint")
+        profiler.report(telemetry.logger, paths.logs_dir / "startup_profile.json")
+        if exit_after_paint:
+            app.quit()
+
+    if profiler.enabled or exit_after_paint:
+        on_first_paint(window, _first_paint)
+
+    # Build the remaining pages once the login screen is up (skippable via app_config.json)
+    if global_cfg.get("prewarm_pages", True) and not exit_after_paint:
+        QTimer.singleShot(300, window.prewarm_pages)
+
+    maintenance = MaintenanceService(db)
+    maintenance.start(app)
+    ctx.article_status.start(app)
+
+    code = app.exec()
+    ctx.reports.shutdown()
+    auth.shutdown()
+    ctx.article_status.stop()
+    maintenance.stop()
+    db.close()
+    return code
 
-    return app.exec()
 
+if __name__ == "__main__":
+    import multiprocessing
 
-if __name__ == "__main__":  
+    # PDF batch exports render charts in spawned worker processes; in a frozen
+    # (PyInstaller) build each worker must run the pool task, not the GUI
+    multiprocessing.freeze_support()
     raise SystemExit(main())
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import math
+import re
+from bisect import bisect_left
+from dataclasses import InitVar, dataclass
+from typing import Dict, List, Optional, Tuple
+
+
+# Field weights for ranking (title matches count most, body least).
+FIELD_WEIGHTS: Dict[str, float] = {"title": 3.0, "category": 2.0, "summary": 2.0, "body": 1.0}
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# A query term that only matches as a prefix (search-as-you-type) scores a bit
+# lower than an exact (stemmed) match.
+PREFIX_WEIGHT = 0.7
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_ENTITY_RE = re.compile(r"&[a-zA-Z0-9#]+;")
+_TOKEN_RE = re.compile(r"[^\W_]+", re.UNICODE)
+
+_ID_PARTICLES = ("lah", "kah", "pun", "nya", "ku", "mu")
+_ID_SUFFIXES = ("kan", "an", "i")
+_ID_PREFIXES = ("meng", "meny", "mem", "men", "me", "peng", "peny", "pem", "pen", "per", "pe", "ber", "ter", "di", "ke", "se")
+_EN_SUFFIXES = (("ies", "y"), ("ing", ""), ("ed", ""), ("ly", ""), ("es", ""), ("s", ""))
+
+
+def _stem_id(word: str) -> str:
+    """Very light Indonesian stemmer: particles, one suffix, one prefix.
+
+    >>> [_stem_id(w) for w in ("menyapa", "sapa", "penyakit", "membaca", "bermain", "pembelajaran")]
+    ['sapa', 'sapa', 'sakit', 'baca', 'main', 'belajar']
+    >>> [_stem_id(w) for w in ("bukunya", "terbaik", "diri")]
+    ['buku', 'baik', 'diri']
+    """
+    for suf in _ID_PARTICLES:
+        if word.endswith(suf) and len(word) - len(suf) >= 4:
+            word = word[: -len(suf)]
+            break
+    for suf in _ID_SUFFIXES:
+        if word.endswith(suf) and len(word) - len(suf) >= 4:
+            word = word[: -len(suf)]
+            break
+    for pre in _ID_PREFIXES:
+        if not word.startswith(pre):
+            continue
+        # meny-/peny- replace an initial "s" (menyapa -> sapa)
+        nasal_s = pre in ("meny", "peny")
+        rest = ("s" if nasal_s else "") + word[len(pre):]
+        if len(rest) >= 4:
+            word = rest
+            break
+        if nasal_s:
+            # Too short to strip; "men"/"pen" would leave a bogus "y..." stem
+            break
+    return word
+
+
+def _stem_en(word: str) -> str:
+    """Very light English stemmer: common inflectional suffixes only."""
+    if word.endswith("ss"):
+        return word
+    for suf, repl in _EN_SUFFIXES:
+        if word.endswith(suf) and len(word) - len(suf) >= 3:
+            return word[: -len(suf)] + repl
+    return word
+
+
+def stem(word: str, lang: str) -> str:
+    return _stem_en(word) if lang == "en" else _stem_id(word)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased word tokens; HTML tags and entities are dropped."""
+    text = _ENTITY_RE.sub(" ", _TAG_RE.sub(" ", text or ""))
+    return _TOKEN_RE.findall(text.lower())
+
+
+@dataclass
+class ArticleSearchIndex:
+    """In-memory inverted index over one language's articles (BM25 ranking).
+
+    `articles` are localized records as returned by `get_articles`; `bodies`
+    maps article id -> the HTML to index as body text.
+    """
+
+    lang: str
+    articles: List[Dict]
+    # Only used while building; not kept in memory afterwards.
+    bodies: InitVar[Optional[Dict[str, str]]] = None
+    # `article_store.catalog_version()` the index was built from
+    version: int = 0
+
+    def __post_init__(self, bodies: Optional[Dict[str, str]]) -> None:
+        # stem -> {doc index: weighted term frequency}
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._doc_len: List[float] = []
+        # surface tokens (sorted) for prefix lookup, and their stems
+        self._vocab: List[str] = []
+        self._vocab_stem: Dict[str, str] = {}
+        self._build(bodies or {})
+
+    def _build(self, bodies: Dict[str, str]) -> None:
+        vocab: Dict[str, str] = {}
+        for doc, a in enumerate(self.articles):
+            fields = {
+                "title": a.get("title", ""),
+                "category": a.get("category", ""),
+                "summary": a.get("summary", ""),
+                "body": bodies.get(a.get("id", ""), ""),
+            }
+            length = 0.0
+            for name, text in fields.items():
+                weight = FIELD_WEIGHTS[name]
+                for tok in tokenize(text):
+                    st = vocab.get(tok)
+                    if st is None:
+                        st = vocab[tok] = stem(tok, self.lang)
+                    postings = self._postings.setdefault(st, {})
+                    postings[doc] = postings.get(doc, 0.0) + weight
+                    length += weight
+            self._doc_len.append(length)
+
+        self._vocab = sorted(vocab)
+        self._vocab_stem = vocab
+        n = len(self.articles)
+        self._avg_len = (sum(self._doc_len) / n) if n else 1.0
+        self._idf = {
+            st: math.log(1.0 + (n - len(p) + 0.5) / (len(p) + 0.5)) for st, p in self._postings.items()
+        }
+
+    def _expand(self, term: str) -> Dict[str, float]:
+        """Index stems a query term can match, with their weight."""
+        out: Dict[str, float] = {}
+        exact = stem(term, self.lang)
+        if exact in self._postings:
+            out[exact] = 1.0
+        if len(term) >= 2:
+            i = bisect_left(self._vocab, term)
+            while i < len(self._vocab) and self._vocab[i].startswith(term):
+                st = self._vocab_stem[self._vocab[i]]
+                out.setdefault(st, PREFIX_WEIGHT)
+                i += 1
+        return out
+
+    def _bm25(self, st: str, doc: int, tf: float) -> float:
+        norm = K1 * (1.0 - B + B * self._doc_len[doc] / (self._avg_len or 1.0))
+        return self._idf[st] * tf * (K1 + 1.0) / (tf + norm)
+
+    def search(self, query: str, category: Optional[str] = None) -> List[Dict]:
+        """Articles matching every query term, best first.
+
+        An empty query returns all articles (in catalog order), optionally
+        restricted to `category`.
+        """
+
+        allowed = [category is None or a.get("category") == category for a in self.articles]
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return [a for a, ok in zip(self.articles, allowed) if ok]
+
+        scores: Optional[Dict[int, float]] = None
+        for term in terms:
+            term_scores: Dict[int, float] = {}
+            for st, weight in self._expand(term).items():
+                for doc, tf in self._postings[st].items():
+                    if not allowed[doc]:
+                        continue
+                    s = weight * self._bm25(st, doc, tf)
+                    if s > term_scores.get(doc, 0.0):
+                        term_scores[doc] = s
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {doc: s + term_scores[doc] for doc, s in scores.items() if doc in term_scores}
+            if not scores:
+                return []
+
+        ranked: List[Tuple[int, float]] = sorted(scores.items(), key=lambda x: (-x[1], x[0]))
+        return [self.articles[doc] for doc, _ in ranked]
+
+
+# lang -> index; each language is built on first search (and again if the catalog changes)
+_INDEXES: Dict[str, ArticleSearchIndex] = {}
+
+
+def _index(lang: str) -> ArticleSearchIndex:
+    from characterify.data.article_store import catalog_version, get_articles, iter_bodies
+
+    lang = "en" if lang == "en" else "id"
+    idx = _INDEXES.get(lang)
+    if idx is None or idx.version != catalog_version():
+        idx = _INDEXES[lang] = ArticleSearchIndex(
+            lang=lang, articles=get_articles(lang), bodies=dict(iter_bodies(lang)), version=catalog_version()
+        )
+    return idx
+
+
+def search_articles(query: str, lang: str = "id", category: Optional[str] = None) -> List[Dict]:
+    """Ranked article search (title, category, summary and body).
+
+    Terms are matched after light stemming, and as prefixes so partial words
+    match while typing. `category=None` searches all categories.
+    """
+
+    return _index(lang).search(query, category=category)
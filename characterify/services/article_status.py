@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+
+from characterify.db.database import Database
+from characterify.db.repositories import ArticleReadRepository
+
+
+@dataclass
+class ArticleStatusService:
+    """In-memory bookmark/read status for the logged-in user's articles.
+
+    All statuses are loaded in one query at login. Bookmark toggles are written
+    through to the database immediately; read marks only update the cache and
+    are flushed in batches (every `flush_interval_ms`, once `batch_size` reads
+    are pending, and on logout/exit).
+    """
+
+    db: Database
+    flush_interval_ms: int = 30_000
+    batch_size: int = 20
+
+    user_id: Optional[int] = field(default=None, init=False)
+    _statuses: Dict[str, Dict[str, Any]] = field(default_factory=dict, init=False, repr=False)
+    # article id -> read_at, not yet written
+    _pending_reads: Dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    _timer: Any = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.repo = ArticleReadRepository(self.db)
+
+    # ---------------------------
+    # Session
+    # ---------------------------
+    def load(self, user_id: int) -> None:
+        """Load every status for `user_id` (flushing the previous user's reads)."""
+        self.flush()
+        self.user_id = user_id
+        self._statuses = self.repo.get_statuses(user_id)
+
+    def clear(self) -> None:
+        """Flush pending reads and forget the current user (logout)."""
+        self.flush()
+        self.user_id = None
+        self._statuses = {}
+
+    # ---------------------------
+    # Reads
+    # ---------------------------
+    def status(self, article_id: str) -> Dict[str, Any]:
+        st = self._statuses.get(article_id)
+        if not st:
+            return {"bookmarked": False, "last_read_at": None}
+        return dict(st)
+
+    def statuses(self, article_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        return {aid: self.status(aid) for aid in article_ids}
+
+    def is_bookmarked(self, article_id: str) -> bool:
+        return bool(self._statuses.get(article_id, {}).get("bookmarked"))
+
+    # ---------------------------
+    # Writes
+    # ---------------------------
+    def set_bookmark(self, article_id: str, bookmarked: bool) -> None:
+        if self.user_id is None:
+            return
+        now = datetime.utcnow().isoformat()
+        self.repo.toggle_bookmark(self.user_id, article_id, bookmarked)
+        self._statuses[article_id] = {"bookmarked": bookmarked, "last_read_at": now}
+        # The upsert above already stamped last_read_at
+        self._pending_reads.pop(article_id, None)
+
+    def mark_read(self, article_id: str) -> None:
+        if self.user_id is None:
+            return
+        now = datetime.utcnow().isoformat()
+        st = self._statuses.setdefault(article_id, {"bookmarked": False, "last_read_at": None})
+        st["last_read_at"] = now
+        self._pending_reads[article_id] = now
+        if len(self._pending_reads) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write pending read marks in one batch."""
+        if not self._pending_reads or self.user_id is None:
+            self._pending_reads.clear()
+            return
+        pending = list(self._pending_reads.items())
+        try:
+            self.repo.mark_read_many(self.user_id, pending)
+        except Exception:
+            # Keep them for the next attempt
+            logging.getLogger("characterify").warning("Flushing article reads failed", exc_info=True)
+            return
+        for article_id, read_at in pending:
+            if self._pending_reads.get(article_id) == read_at:
+                del self._pending_reads[article_id]
+
+    # ---------------------------
+    # Periodic flush (Qt)
+    # ---------------------------
+    def start(self, parent=None) -> None:
+        """Flush periodically on the Qt event loop (no-op without Qt)."""
+
+        try:
+            from PySide6.QtCore import QTimer
+        except Exception:
+            return
+
+        if self._timer is not None:
+            return
+        timer = QTimer(parent)
+        timer.setInterval(self.flush_interval_ms)
+        timer.timeout.connect(self.flush)
+        timer.start()
+        self._timer = timer
+
+    def stop(self) -> None:
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+        self.flush()
@@ -3,10 +3,14 @@ from __future__ import annotations
 import base64
 import hashlib
 import hmac
+import logging
 import os
-from dataclasses import dataclass
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from characterify.db.database import Database
 from characterify.db.repositories import UserRepository
@@ -14,38 +18,124 @@ from characterify.services.security import SecurityService
 from characterify.utils.validators import is_valid_email, validate_password
 
 
+KDF_ALGORITHM = "pbkdf2_sha256"
+# Floor for the calibrated cost (and the cost of legacy hashes without parameters)
+MIN_ITERATIONS = 200_000
+# Calibration aims for about this much time per hash on the current machine
+KDF_TARGET_MS = 250
+# Upper bound for a cost read from config or a stored hash (a corrupt value must not stall the auth worker)
+MAX_ITERATIONS = 10_000_000
+
+
 class AuthError(Exception):
     pass
 
 
+def calibrate_iterations(target_ms: float = KDF_TARGET_MS, floor: int = MIN_ITERATIONS) -> int:
+    """PBKDF2 iterations that take about `target_ms` here (never below `floor`)."""
+
+    sample = 50_000
+    start = time.perf_counter()
+    hashlib.pbkdf2_hmac("sha256", b"calibration", os.urandom(16), sample)
+    elapsed_ms = max((time.perf_counter() - start) * 1000, 1e-3)
+    iterations = int(sample * target_ms / elapsed_ms) // 10_000 * 10_000
+    return min(MAX_ITERATIONS, max(floor, iterations))
+
+
 @dataclass
 class AuthService:
-    """Authentication + account utilities."""
+    """Authentication + account utilities.
+
+    Password hashes are stored as `pbkdf2_sha256$<iterations>$<base64>` (salt
+    in its own column); older rows hold only the base64 digest and imply
+    `MIN_ITERATIONS`. A successful login rehashes passwords stored with other
+    parameters than `iterations`.
+
+    Hashing is slow on purpose, so the UI uses the `*_async` variants: they run
+    on a single worker thread and return a `Future` (see `characterify.ui.jobs.watch_future`).
+    """
 
     db: Database
     security: SecurityService
+    iterations: int = MIN_ITERATIONS
+
+    _executor: Optional[ThreadPoolExecutor] = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
 
     def __post_init__(self) -> None:
         self.users = UserRepository(self.db)
 
+    # ---------------------------
+    # KDF profile
+    # ---------------------------
+    def apply_kdf_profile(self, profile: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Use the cost from `profile` (the `kdf` block of app_config.json).
+
+        Without a usable profile the machine is benchmarked once; the returned
+        profile should then be saved so later starts skip calibration.
+        """
+
+        profile = dict(profile) if isinstance(profile, dict) else {}
+        try:
+            iterations = int(profile.get("iterations") or 0)
+        except (TypeError, ValueError):
+            iterations = 0
+        if profile.get("algorithm") != KDF_ALGORITHM or not 0 < iterations <= MAX_ITERATIONS:
+            try:
+                target_ms = float(profile.get("target_ms") or KDF_TARGET_MS)
+            except (TypeError, ValueError):
+                target_ms = KDF_TARGET_MS
+            if not 0 < target_ms <= 10_000:
+                target_ms = KDF_TARGET_MS
+            iterations = calibrate_iterations(target_ms)
+            profile = {"algorithm": KDF_ALGORITHM, "iterations": iterations, "target_ms": target_ms}
+            logging.getLogger("characterify").info(f"KDF calibrated | iterations={iterations} target_ms={target_ms}")
+        self.iterations = max(MIN_ITERATIONS, iterations)
+        return profile
+
+    # ---------------------------
+    # Password hashing
+    # ---------------------------
     @staticmethod
-    def _pbkdf2(password: str, salt: bytes, iterations: int = 200_000) -> bytes:
+    def _pbkdf2(password: str, salt: bytes, iterations: int = MIN_ITERATIONS) -> bytes:
         return hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations)
 
+    @staticmethod
+    def _parse_hash(password_hash: str) -> Optional[Tuple[str, int, bytes]]:
+        """(algorithm, iterations, digest) of a stored hash, or None if malformed."""
+        try:
+            if "$" not in password_hash:
+                return KDF_ALGORITHM, MIN_ITERATIONS, base64.b64decode(password_hash.encode("utf-8"))
+            algorithm, iterations, digest = password_hash.split("$", 2)
+            count = int(iterations)
+            if not 0 < count <= MAX_ITERATIONS:
+                return None
+            return algorithm, count, base64.b64decode(digest.encode("utf-8"))
+        except Exception:
+            return None
+
     def hash_password(self, password: str) -> tuple[str, str]:
         salt = os.urandom(16)
-        dk = self._pbkdf2(password, salt)
-        return base64.b64encode(dk).decode("utf-8"), base64.b64encode(salt).decode("utf-8")
+        dk = self._pbkdf2(password, salt, self.iterations)
+        encoded = f"{KDF_ALGORITHM}${self.iterations}${base64.b64encode(dk).decode('utf-8')}"
+        return encoded, base64.b64encode(salt).decode("utf-8")
 
     def verify_password(self, password: str, password_hash: str, password_salt: str) -> bool:
+        parsed = self._parse_hash(password_hash)
+        if parsed is None or parsed[0] != KDF_ALGORITHM:
+            return False
+        _algorithm, iterations, expected = parsed
         try:
             salt = base64.b64decode(password_salt.encode("utf-8"))
-            expected = base64.b64decode(password_hash.encode("utf-8"))
         except Exception:
             return False
-        actual = self._pbkdf2(password, salt)
+        actual = self._pbkdf2(password, salt, iterations)
         return hmac.compare_digest(actual, expected)
 
+    def needs_rehash(self, password_hash: str) -> bool:
+        parsed = self._parse_hash(password_hash)
+        return parsed is None or parsed[0] != KDF_ALGORITHM or parsed[1] != self.iterations
+
     def register(self, name: str, email: str, password: str, confirm_password: str) -> int:
         name = (name or "").strip()
         email = (email or "").strip().lower()
@@ -77,6 +167,13 @@ class AuthService:
             raise AuthError("Akun tidak ditemukan.")
         if not self.verify_password(password, row["password_hash"], row["password_salt"]):
             raise AuthError("Password salah.")
+        if self.needs_rehash(row["password_hash"]):
+            try:
+                pw_hash, pw_salt = self.hash_password(password)
+                self.users.update_password(user_id=int(row["id"]), password_hash=pw_hash, password_salt=pw_salt)
+            except Exception:
+                # The login itself succeeded; try again next time
+                logging.getLogger("characterify").warning("Password rehash failed", exc_info=True)
         return int(row["id"])
 
     def get_user(self, user_id: int) -> Optional[Dict[str, Any]]:
@@ -108,3 +205,29 @@ class AuthService:
             raise AuthError("Konfirmasi password baru tidak sama.")
         pw_hash, pw_salt = self.hash_password(new_password)
         self.users.update_password(user_id=user_id, password_hash=pw_hash, password_salt=pw_salt)
+
+    # ---------------------------
+    # Background variants (for the UI)
+    # ---------------------------
+    def _submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="auth")
+            return self._executor.submit(fn, *args)
+
+    def login_async(self, email: str, password: str) -> Future:
+        """`login` on the auth worker thread; the future yields the user id or raises `AuthError`."""
+        return self._submit(self.login, email, password)
+
+    def register_async(self, name: str, email: str, password: str, confirm_password: str) -> Future:
+        return self._submit(self.register, name, email, password, confirm_password)
+
+    def update_password_async(self, user_id: int, current_password: str, new_password: str, confirm: str) -> Future:
+        return self._submit(self.update_password, user_id, current_password, new_password, confirm)
+
+    def shutdown(self) -> None:
+        """Stop the worker thread (on app exit), finishing a running request first."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+
+def _canonical(value: Any) -> Any:
+    """JSON-ready form of a chart input that keeps dict order (it is the bar order)."""
+    if isinstance(value, dict):
+        return [[str(k), _canonical(v)] for k, v in value.items()]
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, float):
+        return round(value, 6)
+    return value
+
+
+@dataclass
+class ChartCache:
+    """Content-addressed cache of rendered report charts (PNG files).
+
+    Files are named by a sha256 of `(chart_kind, percentages, theme, dpi)`, so
+    the same result is only ever rendered once. A small in-memory index skips
+    the disk lookup for charts used again in the same session (e.g. within a
+    batch). `prune()` evicts files older than `max_age_s`, then the least
+    recently used ones until the folder is under `max_bytes`.
+    """
+
+    root: Path
+    max_bytes: int = 64 * 1024 * 1024
+    max_age_s: float = 30 * 24 * 3600
+    memory_items: int = 256
+
+    _memory: "OrderedDict[str, Path]" = field(default_factory=OrderedDict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    @staticmethod
+    def key(chart_kind: str, percentages: Any, theme: str, dpi: int) -> str:
+        raw = json.dumps([chart_kind, _canonical(percentages), theme, int(dpi)], ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        return self.root / f"{key}.png"
+
+    # ---------------------------
+    # Lookup / store
+    # ---------------------------
+    def lookup(self, key: str) -> Optional[Path]:
+        """Cached chart for `key`, or None."""
+
+        with self._lock:
+            path = self._memory.get(key)
+            if path is not None:
+                self._memory.move_to_end(key)
+        if path is None:
+            path = self.path_for(key)
+        try:
+            # Refresh mtime: eviction treats it as "last used"
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self._memory.pop(key, None)
+            return None
+        self._remember(key, path)
+        return path
+
+    def staging_path(self, key: str) -> Path:
+        """Unique file to render into before `store` moves it into place."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        return self.root / f".{key}.{uuid.uuid4().hex[:8]}.png"
+
+    def store(self, key: str, staged: Path) -> Path:
+        """Atomically move a rendered file into the cache."""
+        path = self.path_for(key)
+        os.replace(staged, path)
+        self._remember(key, path)
+        return path
+
+    def get_or_render(self, key: str, render: Callable[[Path], Any]) -> Path:
+        """Cached chart for `key`, calling `render(path)` to create it on a miss."""
+
+        path = self.lookup(key)
+        if path is not None:
+            return path
+        staged = self.staging_path(key)
+        try:
+            render(staged)
+            return self.store(key, staged)
+        finally:
+            if staged.exists():
+                staged.unlink()
+
+    def _remember(self, key: str, path: Path) -> None:
+        with self._lock:
+            self._memory[key] = path
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_items:
+                self._memory.popitem(last=False)
+
+    # ---------------------------
+    # Eviction
+    # ---------------------------
+    def prune(self) -> int:
+        """Apply the age and size limits; returns the number of files removed."""
+
+        if not self.root.exists():
+            return 0
+        now = time.time()
+        entries: List[tuple] = []
+        for p in self.root.glob("*.png"):
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, p))
+
+        removed = 0
+        total = sum(size for _, size, _ in entries)
+        # Oldest (least recently used) first
+        for mtime, size, p in sorted(entries, key=lambda e: e[0]):
+            # Leftover staging files from a crash count as expired after an hour
+            expired = now - mtime > (3600 if p.name.startswith(".") else self.max_age_s)
+            if not expired and total <= self.max_bytes:
+                continue
+            try:
+                p.unlink()
+            except OSError:
+                continue
+            removed += 1
+            total -= size
+            with self._lock:
+                self._memory.pop(p.stem, None)
+        if removed:
+            logging.getLogger("characterify").debug(f"Chart cache pruned | removed={removed} bytes={total}")
+        return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+        for p in self.root.glob("*.png"):
+            try:
+                p.unlink()
+            except OSError:
+                pass
+
+
+def purge_legacy_charts(temp_dir: Path) -> int:
+    """Delete `chart_*.png` files older exports left in the temp folder."""
+
+    removed = 0
+    for p in temp_dir.glob("chart_*.png"):
+        try:
+            p.unlink()
+            removed += 1
+        except OSError:
+            pass
+    return removed
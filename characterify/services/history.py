@@ -5,7 +5,7 @@ import json
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Sequence
 
 from characterify.db.database import Database
 from characterify.db.repositories import TestHistoryRepository
@@ -20,17 +20,82 @@ class HistoryService:
     def __post_init__(self) -> None:
         self.repo = TestHistoryRepository(self.db)
 
-    def export_json(self, user_id: int) -> Path:
+    def report_items(self, user_id: int, history_ids: Sequence[int], scoring, lang: str = "id") -> List[Dict[str, Any]]:
+        """Resolve history ids into PDF report inputs, in the given order.
+
+        Each item has `history_id`, `test_title`, `result_payload` (hydrated
+        with localized content) and `created_at`. Unknown ids are skipped.
+        """
+
+        items: List[Dict[str, Any]] = []
+        for row in self.repo.get_many(history_ids, user_id):
+            test_id = row["test_type"]
+            payload = scoring.hydrate_payload(
+                self.db.loads(row["score_json"]), test_id=test_id, result_type=row["result_type"], lang=lang
+            )
+            test = scoring.get_test(test_id, lang)
+            items.append(
+                {
+                    "history_id": row["id"],
+                    "test_title": f"{test.title} — {test.subtitle}" if test else test_id,
+                    "result_payload": payload,
+                    "created_at": row.get("created_at"),
+                }
+            )
+        return items
+
+    def regenerate(
+        self,
+        user_id: int,
+        scoring,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        dry_run: bool = False,
+    ) -> Dict[str, int]:
+        """Re-score stored answers and rewrite results that changed.
+
+        Useful after a scoring fix. Rows without stored answers are skipped.
+        Returns counts: `checked`, `changed`, `skipped`.
+        """
+
+        counts = {"checked": 0, "changed": 0, "skipped": 0}
+        updates = []
+        for row in self.repo.list_range(user_id, since=since, until=until):
+            answers = self.db.loads(row.get("answers_json") or "{}")
+            if not isinstance(answers, dict) or not answers:
+                counts["skipped"] += 1
+                continue
+            counts["checked"] += 1
+            # keys stored as strings
+            payload = scoring.score_test(row["test_type"], {int(k): int(v) for k, v in answers.items()})
+            compact = scoring.compact_payload(payload)
+            stored = self.db.loads(row.get("score_json") or "{}")
+            stored_core = {k: stored.get(k) for k in scoring.STORED_KEYS if k != "test_id"}
+            new_core = {k: compact.get(k) for k in scoring.STORED_KEYS if k != "test_id"}
+            if stored_core == new_core and row.get("result_type") == payload.get("result_type"):
+                continue
+            counts["changed"] += 1
+            updates.append((row["id"], payload.get("result_type", "-"), self.db.dumps(compact)))
+        if updates and not dry_run:
+            self.repo.update_results(user_id, updates)
+        return counts
+
+    def _rows(self, user_id: int, since: Optional[str], until: Optional[str]) -> List[Dict[str, Any]]:
+        if since is None and until is None:
+            return self.repo.list_by_user(user_id)
+        return self.repo.list_range(user_id, since=since, until=until)
+
+    def export_json(self, user_id: int, since: Optional[str] = None, until: Optional[str] = None) -> Path:
         now = datetime.utcnow().isoformat().replace(":", "").replace("-", "")
         out = self.paths.exports_dir / f"history_{user_id}_{now}.json"
-        rows = self.repo.list_by_user(user_id)
+        rows = self._rows(user_id, since, until)
         out.write_text(json.dumps(rows, ensure_ascii=False, indent=2), encoding="utf-8")
         return out
 
-    def export_csv(self, user_id: int) -> Path:
+    def export_csv(self, user_id: int, since: Optional[str] = None, until: Optional[str] = None) -> Path:
         now = datetime.utcnow().isoformat().replace(":", "").replace("-", "")
         out = self.paths.exports_dir / f"history_{user_id}_{now}.csv"
-        rows = self.repo.list_by_user(user_id)
+        rows = self._rows(user_id, since, until)
         fields = ["id", "test_type", "result_type", "created_at"]
         with out.open("w", newline="", encoding="utf-8") as f:
             writer = csv.DictWriter(f, fieldnames=fields)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from characterify.db.database import Database
+
+
+@dataclass
+class MaintenanceService:
+    """Periodic housekeeping for the local database.
+
+    Every `interval_ms` the timer checks whether the database has been idle
+    for at least `idle_after_s`; if so it runs a PASSIVE WAL checkpoint and,
+    less often, `PRAGMA optimize`. Both are cheap and never block readers.
+    """
+
+    db: Database
+    interval_ms: int = 60_000
+    idle_after_s: float = 20.0
+    optimize_every_s: float = 30 * 60
+
+    _last_optimize: float = field(default=0.0, init=False, repr=False)
+    _timer: Any = field(default=None, init=False, repr=False)
+
+    def run_once(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self.db.last_used < self.idle_after_s:
+            return
+        logger = logging.getLogger("characterify")
+        try:
+            result = self.db.checkpoint("PASSIVE")
+            if now - self._last_optimize >= self.optimize_every_s or force:
+                self.db.optimize()
+                self._last_optimize = now
+            logger.debug(f"DB maintenance done | checkpoint={result}")
+        except Exception:
+            logger.warning("DB maintenance failed", exc_info=True)
+
+    def start(self, parent=None) -> None:
+        """Start the periodic timer on the Qt event loop (no-op without Qt)."""
+
+        try:
+            from PySide6.QtCore import QTimer
+        except Exception:
+            return
+
+        if self._timer is not None:
+            return
+        timer = QTimer(parent)
+        timer.setInterval(self.interval_ms)
+        timer.timeout.connect(self.run_once)
+        timer.start()
+        self._timer = timer
+
+    def stop(self) -> None:
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+        # Final checkpoint so the WAL file does not linger between sessions.
+        try:
+            self.db.checkpoint("TRUNCATE")
+            self.db.optimize()
+        except Exception:
+            pass
@@ -1,16 +1,218 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
+from characterify.db.database import Database
+from characterify.services.chart_cache import ChartCache, purge_legacy_charts
+from characterify.services.report_jobs import JobCancelled, ProgressFn
+from characterify.utils.i18n import N_
 from characterify.utils.paths import AppPaths
 
+# Batches with at least this many charts render them in worker processes;
+# smaller ones are faster in-process (a worker pays for importing matplotlib).
+PARALLEL_CHART_MIN = 6
+MAX_CHART_PROCESSES = 4
+
+BATCH_MODES = ("separate", "combined")
+
+# Part of the chart cache key: bump when `render_chart_png` output changes
+# (colors, layout) so old cached images are not reused.
+CHART_THEME = "default-v1"
+CHART_DPI = 150
+
+# Minimum seconds between chart cache evictions
+CHART_PRUNE_INTERVAL_S = 600
+
+# "raster": matplotlib PNG (cached); "vector": reportlab drawing, no rasterizing
+CHART_BACKENDS = ("raster", "vector")
+
+CHART_GREEN = "#1DB954"
+CHART_DARK = "#3A3A3A"
+
+
+# label(id_text, en_text) -> text shown with a progress step, e.g.
+# `functools.partial(t, ctx)`; without one the Indonesian text is used
+LabelFn = Callable[[str, str], str]
+
+STAGE_CHARTS = N_("Membuat grafik", "Rendering charts")
+STAGE_LAYOUT = N_("Menyusun dokumen", "Laying out the document")
+STAGE_WRITE = N_("Menulis PDF", "Writing PDF")
+STAGE_WRITE_N = N_("Menulis PDF {i}/{n}", "Writing PDF {i}/{n}")
+
+
+def _no_progress(percent: int, message: str) -> None:
+    pass
+
+
+def _source_label(id_text: str, en_text: str) -> str:
+    return id_text
+
+
+# ---------------------------
+# Charts
+# ---------------------------
+def render_chart_png(chart_kind: str, percentages: Any, out: str, dpi: int = 150) -> str:
+    """Render a result chart to `out` and return the path.
+
+    Module-level (and Qt-free) so it can run in a worker process. Uses the
+    matplotlib object API + Agg canvas: no pyplot global state and no backend
+    switch, so it is also safe off the UI thread while Qt charts use QtAgg.
+    """
+
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(8, 4.5))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    if chart_kind == "mbti_stacked":
+        dims = percentages or []
+        labels = [f"{d['name_a']} vs {d['name_b']}" for d in dims]
+        y = list(range(len(dims)))
+        for i, d in enumerate(dims):
+            ax.barh(i, d["pct_a"], color=CHART_GREEN)
+            ax.barh(i, d["pct_b"], left=d["pct_a"], color=CHART_DARK)
+            ax.text(d["pct_a"] / 2, i, f"{d['name_a']} {d['pct_a']:.0f}%", ha="center", va="center", color="white", fontsize=9)
+            ax.text(d["pct_a"] + d["pct_b"] / 2, i, f"{d['name_b']} {d['pct_b']:.0f}%", ha="center", va="center", color="white", fontsize=9)
+        ax.set_xlim(0, 100)
+        ax.set_yticks(y)
+        ax.set_yticklabels(labels, fontsize=9)
+        ax.set_xticks([])
+        ax.grid(False)
+        ax.set_frame_on(False)
+    else:
+        # barh chart for OCEAN/Enneagram/Temperament
+        if isinstance(percentages, dict):
+            labels = []
+            vals = []
+            for k, v in percentages.items():
+                labels.append(str(k))
+                vals.append(float(v))
+            ax.barh(labels, vals, color=CHART_GREEN)
+            ax.set_xlim(0, max(100, max(vals) + 10 if vals else 100))
+            ax.set_xticks([])
+            ax.grid(False)
+            ax.set_frame_on(False)
+        else:
+            # already list? fallback
+            ax.text(0.1, 0.5, "Chart unavailable", fontsize=12)
+
+    fig.tight_layout()
+    fig.savefig(out, bbox_inches="tight", transparent=False, dpi=dpi)
+    return out
+
+
+def chart_drawing(chart_kind: str, percentages: Any, width: float, height: float):
+    """The same chart as `render_chart_png`, as a reportlab vector Drawing.
+
+    The Drawing is a flowable, so it goes straight into a story: nothing is
+    rasterized, the PDF stays small and the bars stay sharp when printed.
+    """
+
+    from reportlab.graphics.shapes import Drawing, Rect, String
+    from reportlab.lib import colors
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+
+    green, dark = colors.HexColor(CHART_GREEN), colors.HexColor(CHART_DARK)
+    font, size = "Helvetica", 9
+    d = Drawing(width, height)
+
+    if chart_kind == "mbti_stacked":
+        dims = percentages or []
+        rows = [(f"{x['name_a']} vs {x['name_b']}", x) for x in dims]
+    elif isinstance(percentages, dict):
+        rows = [(str(k), float(v)) for k, v in percentages.items()]
+    else:
+        d.add(String(8, height / 2, "Chart unavailable", fontName=font, fontSize=12))
+        return d
+    if not rows:
+        return d
+
+    label_w = min(width * 0.4, max(stringWidth(label, font, size) for label, _ in rows) + 8)
+    plot_w = width - label_w
+    row_h = height / len(rows)
+    bar_h = row_h * 0.8
+
+    if chart_kind == "mbti_stacked":
+        x_max = 100.0
+    else:
+        vals = [v for _, v in rows]
+        x_max = max(100.0, max(vals) + 10)
+    scale = plot_w / x_max
+
+    # Like matplotlib's barh: the first row is at the bottom
+    for i, (label, value) in enumerate(rows):
+        y = i * row_h + (row_h - bar_h) / 2
+        mid = y + bar_h / 2 - size * 0.35
+        d.add(String(label_w - 6, mid, label, fontName=font, fontSize=size, textAnchor="end"))
+        if chart_kind == "mbti_stacked":
+            a, b = float(value["pct_a"]), float(value["pct_b"])
+            d.add(Rect(label_w, y, a * scale, bar_h, fillColor=green, strokeColor=None))
+            d.add(Rect(label_w + a * scale, y, b * scale, bar_h, fillColor=dark, strokeColor=None))
+            d.add(String(label_w + a * scale / 2, mid, f"{value['name_a']} {a:.0f}%",
+                         fontName=font, fontSize=size, fillColor=colors.white, textAnchor="middle"))
+            d.add(String(label_w + (a + b / 2) * scale, mid, f"{value['name_b']} {b:.0f}%",
+                         fontName=font, fontSize=size, fillColor=colors.white, textAnchor="middle"))
+        else:
+            d.add(Rect(label_w, y, max(0.0, value) * scale, bar_h, fillColor=green, strokeColor=None))
+    return d
+
+
+# ---------------------------
+# reportlab helpers (imported lazily)
+# ---------------------------
+@lru_cache(maxsize=1)
+def _toc_doc_class():
+    """SimpleDocTemplate that feeds headings marked with `toc_level` into a TableOfContents."""
+
+    from reportlab.platypus import SimpleDocTemplate
+
+    class TocDocTemplate(SimpleDocTemplate):
+        def afterFlowable(self, flowable):
+            level = getattr(flowable, "toc_level", None)
+            if level is None:
+                return
+            key = getattr(flowable, "toc_key", None)
+            text = flowable.getPlainText()
+            if key:
+                self.canv.bookmarkPage(key)
+                self.canv.addOutlineEntry(text, key, level=level, closed=True)
+            self.notify("TOCEntry", (level, text, self.page, key))
+
+    return TocDocTemplate
+
 
 @dataclass
 class PdfReportService:
     paths: AppPaths
+    # Only needed by `create_reports_batch` (resolving history ids)
+    db: Optional[Database] = None
+    scoring: Any = None
+    # Rendered chart images (defaults to <base>/cache/charts)
+    charts: Optional[ChartCache] = None
+    # Default for exports that do not pass `chart_backend` (see CHART_BACKENDS)
+    chart_backend: str = "raster"
+    # Upper bound for chart worker processes in batches (1 = always in-process)
+    chart_processes: int = MAX_CHART_PROCESSES
+
+    # Paragraph styles are built once and shared by every report
+    _styles: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
+    _styles_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _last_prune: Optional[float] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.charts is None:
+            self.charts = ChartCache(self.paths.cache_dir / "charts")
 
     def create_report(
         self,
@@ -19,56 +221,287 @@ class PdfReportService:
         test_title: str,
         result_payload: Dict[str, Any],
         created_at_iso: Optional[str] = None,
+        progress: Optional[ProgressFn] = None,
+        chart_backend: Optional[str] = None,
+        user_id: Optional[int] = None,
+        history_id: Optional[int] = None,
+        label: Optional[LabelFn] = None,
     ) -> Path:
-        """Generate a shareable PDF report (offline)."""
+        """Generate a shareable PDF report (offline).
 
+        Safe to call from a worker thread (see `ReportJobService`). `progress`
+        is called between steps and may raise `JobCancelled` to abort; `label`
+        translates its messages. `chart_backend` overrides the service default ("raster" or "vector").
+        `user_id`/`history_id` only go into the file name.
+        """
+
+        backend = self._backend(chart_backend)
+        progress = progress or _no_progress
+        label = label or _source_label
         created_at_iso = created_at_iso or datetime.utcnow().isoformat()
-        timestamp = created_at_iso.replace(":", "").replace("-", "").split(".")[0]
-        filename = f"Characterify_{result_payload.get('test_id','test')}_{timestamp}.pdf"
-        out_path = self.paths.exports_dir / filename
+        timestamp = self._stamp(created_at_iso)
 
-        chart_path = self._render_chart_png(result_payload, suffix=timestamp)
+        progress(10, label(*STAGE_CHARTS))
+        chart = self._chart(result_payload) if backend == "raster" else self._vector_chart(result_payload)
+        progress(50, label(*STAGE_LAYOUT))
 
-        from reportlab.lib.pagesizes import A4
+        from reportlab.platypus import Paragraph
+
+        st = self.styles()
+        story: List[Any] = [Paragraph("Characterify — Personality Report", st["title"])]
+        story += self._header_story(user_name, user_email, test_title, created_at_iso)
+        story += self._result_story(result_payload, chart)
+
+        progress(70, label(*STAGE_WRITE))
+        out_path = self._report_path(result_payload, timestamp, user_id=user_id, history_id=history_id)
+        self._build(out_path, story)
+        self._maybe_prune_charts()
+        return out_path
+
+    # ---------------------------
+    # Batch
+    # ---------------------------
+    def create_reports_batch(
+        self,
+        history_ids: Sequence[int],
+        mode: str = "separate",
+        *,
+        user_id: int,
+        user_name: str,
+        user_email: str,
+        lang: str = "id",
+        progress: Optional[ProgressFn] = None,
+        chart_backend: Optional[str] = None,
+        label: Optional[LabelFn] = None,
+    ) -> List[Path]:
+        """Export many history entries in one pass.
+
+        `mode="separate"` writes one PDF per entry; `mode="combined"` writes a
+        single PDF with a table of contents. Styles are built once, and charts
+        for larger batches are rendered in parallel worker processes.
+        Returns the written paths (in `history_ids` order for "separate").
+        """
+
+        if self.db is None or self.scoring is None:
+            raise RuntimeError("PdfReportService butuh db dan scoring untuk export batch.")
+
+        from characterify.services.history import HistoryService
+
+        progress = progress or _no_progress
+        items = HistoryService(self.db, self.paths).report_items(user_id, history_ids, self.scoring, lang=lang)
+        if not items:
+            raise ValueError("History tidak ditemukan.")
+        return self.build_reports(
+            items,
+            mode,
+            user_name=user_name,
+            user_email=user_email,
+            progress=progress,
+            chart_backend=chart_backend,
+            user_id=user_id,
+            label=label,
+        )
+
+    def build_reports(
+        self,
+        items: Sequence[Dict[str, Any]],
+        mode: str = "separate",
+        *,
+        user_name: str,
+        user_email: str,
+        progress: Optional[ProgressFn] = None,
+        chart_backend: Optional[str] = None,
+        user_id: Optional[int] = None,
+        label: Optional[LabelFn] = None,
+    ) -> List[Path]:
+        """Write reports for already-resolved items (see `HistoryService.report_items`).
+
+        Every call writes new files: names carry the user and history ids and
+        get a numeric suffix if the name is already taken.
+        """
+
+        if mode not in BATCH_MODES:
+            raise ValueError(f"Mode export tidak dikenal: {mode}")
+        backend = self._backend(chart_backend)
+        progress = progress or _no_progress
+        label = label or _source_label
+
+        charts: List[Any]
+        if backend == "raster":
+            charts = self._render_charts(
+                items, lambda done: progress(int(40 * done / len(items)), label(*STAGE_CHARTS))
+            )
+        else:
+            # Cheap to draw; no cache or worker processes needed
+            charts = [self._vector_chart(item["result_payload"]) for item in items]
+
+        from reportlab.platypus import PageBreak, Paragraph, Spacer
+
+        st = self.styles()
+        if mode == "separate":
+            out: List[Path] = []
+            for i, (item, chart) in enumerate(zip(items, charts)):
+                progress(40 + int(60 * i / len(items)), label(*STAGE_WRITE_N).format(i=i + 1, n=len(items)))
+                created_at = item.get("created_at") or datetime.utcnow().isoformat()
+                story: List[Any] = [Paragraph("Characterify — Personality Report", st["title"])]
+                story += self._header_story(user_name, user_email, item["test_title"], created_at)
+                story += self._result_story(item["result_payload"], chart)
+                path = self._report_path(
+                    item["result_payload"], self._stamp(created_at), user_id=user_id, history_id=item.get("history_id")
+                )
+                self._build(path, story)
+                out.append(path)
+            self._maybe_prune_charts()
+            return out
+
+        from reportlab.platypus.tableofcontents import TableOfContents
+
+        now = datetime.utcnow().isoformat()
+        toc = TableOfContents()
+        toc.levelStyles = [st["toc"]]
+        story = [
+            Paragraph("Characterify — Personality Reports", st["title"]),
+            Paragraph(f"<b>User</b>: {self._escape(user_name)} &lt;{self._escape(user_email)}&gt;", st["normal"]),
+            Paragraph(f"<b>Reports</b>: {len(items)}", st["normal"]),
+            Paragraph(f"<b>Generated</b>: {now}", st["normal"]),
+            Spacer(1, 18),
+            Paragraph("Daftar Isi", st["h2"]),
+            toc,
+        ]
+        for i, (item, chart) in enumerate(zip(items, charts)):
+            progress(40 + int(30 * i / len(items)), label(*STAGE_LAYOUT))
+            created_at = item.get("created_at") or now
+            heading = Paragraph(f"{i + 1}. {self._escape(item['test_title'])} ({created_at[:10]})", st["h1"])
+            heading.toc_level = 0
+            heading.toc_key = f"report-{i + 1}"
+            story += [PageBreak(), heading]
+            story += self._header_story(user_name, user_email, item["test_title"], created_at)
+            story += self._result_story(item["result_payload"], chart)
+
+        progress(70, label(*STAGE_WRITE))
+        user_part = f"_u{user_id}" if user_id is not None else ""
+        path = self._claim_path(f"Characterify_batch{user_part}_{len(items)}_{self._stamp(now)}")
+        # Two passes: the first collects heading page numbers for the TOC
+        self._build(path, story, toc=True)
+        self._maybe_prune_charts()
+        return [path]
+
+    def _render_charts(self, items: Sequence[Dict[str, Any]], on_chart) -> List[Optional[Path]]:
+        """Chart PNG for every item.
+
+        Cached charts are reused and identical charts within the batch are
+        rendered once; large sets of misses render in worker processes.
+        """
+
+        cache = self.charts
+        keys: List[str] = []
+        inputs: Dict[str, Tuple[str, Any]] = {}
+        for item in items:
+            payload = item["result_payload"]
+            kind, perc = payload.get("chart_kind", ""), payload.get("percentages")
+            key = cache.key(kind, perc, CHART_THEME, CHART_DPI)
+            keys.append(key)
+            inputs.setdefault(key, (kind, perc))
+
+        found: Dict[str, Path] = {}
+        for key in inputs:
+            path = cache.lookup(key)
+            if path is not None:
+                found[key] = path
+        on_chart(len(found) * len(items) // max(1, len(inputs)))
+
+        misses = [key for key in inputs if key not in found]
+        jobs: List[Tuple[str, Any, str, int]] = []
+        for key in misses:
+            kind, perc = inputs[key]
+            jobs.append((kind, perc, str(cache.staging_path(key)), CHART_DPI))
+
+        def rendered(n: int) -> None:
+            on_chart((len(found) + n) * len(items) // max(1, len(inputs)))
+
+        try:
+            workers = min(self.chart_processes, os.cpu_count() or 1)
+            staged: Optional[List[Path]] = None
+            if len(jobs) >= PARALLEL_CHART_MIN and workers > 1:
+                try:
+                    staged = self._render_charts_parallel(jobs, workers, rendered)
+                except JobCancelled:
+                    raise
+                except Exception:
+                    logging.getLogger("characterify").warning(
+                        "Parallel chart rendering failed; rendering in-process", exc_info=True
+                    )
+            if staged is None:
+                staged = []
+                for job in jobs:
+                    staged.append(Path(render_chart_png(*job)))
+                    rendered(len(staged))
+            for key, path in zip(misses, staged):
+                found[key] = cache.store(key, path)
+        finally:
+            for job in jobs:
+                Path(job[2]).unlink(missing_ok=True)
+
+        return [found.get(key) for key in keys]
+
+    @staticmethod
+    def _render_charts_parallel(jobs: List[Tuple[str, Any, str, int]], workers: int, on_chart) -> List[Path]:
+        # "spawn": forking a process that runs Qt threads is not safe
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        try:
+            futures = [pool.submit(render_chart_png, *job) for job in jobs]
+            out_paths: List[Path] = []
+            for fut in futures:
+                out_paths.append(Path(fut.result()))
+                on_chart(len(out_paths))
+            return out_paths
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    # ---------------------------
+    # Story building
+    # ---------------------------
+    def styles(self) -> Dict[str, Any]:
+        """Paragraph styles shared by all reports (built on first use)."""
+
+        with self._styles_lock:
+            if self._styles is None:
+                from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+
+                base = getSampleStyleSheet()
+                self._styles = {
+                    "title": ParagraphStyle("Title", parent=base["Title"], fontName="Helvetica-Bold", fontSize=18, leading=22),
+                    "h1": ParagraphStyle("H1", parent=base["Heading1"], fontName="Helvetica-Bold", fontSize=15, leading=19),
+                    "h2": ParagraphStyle("H2", parent=base["Heading2"], fontName="Helvetica-Bold", fontSize=12, leading=14),
+                    "normal": ParagraphStyle("Normal", parent=base["BodyText"], fontName="Helvetica", fontSize=10, leading=14),
+                    "toc": ParagraphStyle("TOC", parent=base["BodyText"], fontName="Helvetica", fontSize=10, leading=16, leftIndent=12),
+                }
+            return self._styles
+
+    def _header_story(self, user_name: str, user_email: str, test_title: str, created_at_iso: str) -> List[Any]:
         from reportlab.lib import colors
-        from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-        from reportlab.lib.units import cm
-        from reportlab.platypus import Image, Paragraph, SimpleDocTemplate, Spacer
+        from reportlab.platypus import Paragraph, Spacer
         from reportlab.platypus.flowables import HRFlowable
 
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            "Title",
-            parent=styles["Title"],
-            fontName="Helvetica-Bold",
-            fontSize=18,
-            leading=22,
-        )
-        h2 = ParagraphStyle(
-            "H2",
-            parent=styles["Heading2"],
-            fontName="Helvetica-Bold",
-            fontSize=12,
-            leading=14,
-        )
-        normal = ParagraphStyle(
-            "Normal",
-            parent=styles["BodyText"],
-            fontName="Helvetica",
-            fontSize=10,
-            leading=14,
-        )
+        normal = self.styles()["normal"]
+        return [
+            Paragraph(f"<b>User</b>: {user_name} &lt;{user_email}&gt;", normal),
+            Paragraph(f"<b>Test</b>: {test_title}", normal),
+            Paragraph(f"<b>Generated</b>: {created_at_iso}", normal),
+            Spacer(1, 12),
+            HRFlowable(width="100%", thickness=1, color=colors.HexColor("#DDDDDD")),
+            Spacer(1, 12),
+        ]
 
-        doc = SimpleDocTemplate(str(out_path), pagesize=A4, rightMargin=2 * cm, leftMargin=2 * cm, topMargin=2 * cm, bottomMargin=2 * cm)
-        story = []
+    def _result_story(self, result_payload: Dict[str, Any], chart: Any) -> List[Any]:
+        """Result body; `chart` is a PNG path, a vector Drawing, or None."""
 
-        story.append(Paragraph("Characterify — Personality Report", title_style))
-        story.append(Paragraph(f"<b>User</b>: {user_name} &lt;{user_email}&gt;", normal))
-        story.append(Paragraph(f"<b>Test</b>: {test_title}", normal))
-        story.append(Paragraph(f"<b>Generated</b>: {created_at_iso}", normal))
-        story.append(Spacer(1, 12))
-        story.append(HRFlowable(width="100%", thickness=1, color=colors.HexColor("#DDDDDD")))
-        story.append(Spacer(1, 12))
+        from reportlab.lib.units import cm
+        from reportlab.platypus import Image, Paragraph, Spacer
+
+        st = self.styles()
+        h2, normal = st["h2"], st["normal"]
+        story: List[Any] = []
 
         # Result headline
         content = result_payload.get("content", {})
@@ -78,10 +511,12 @@ class PdfReportService:
         story.append(Paragraph(summary_html, normal))
         story.append(Spacer(1, 12))
 
-        if chart_path and chart_path.exists():
+        if isinstance(chart, Path):
+            chart = Image(str(chart), width=16 * cm, height=9 * cm) if chart.exists() else None
+        if chart is not None:
             story.append(Paragraph("Score Chart", h2))
             story.append(Spacer(1, 6))
-            story.append(Image(str(chart_path), width=16 * cm, height=9 * cm))
+            story.append(chart)
             story.append(Spacer(1, 12))
 
         # Sections
@@ -92,60 +527,97 @@ class PdfReportService:
                 bullet_html = "<br/>".join([f"• {self._escape(i)}" for i in items])
                 story.append(Paragraph(bullet_html, normal))
             story.append(Spacer(1, 10))
+        return story
 
-        doc.build(story)
-        return out_path
+    @staticmethod
+    def _doc(out_path: Path, toc: bool = False):
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.units import cm
+        from reportlab.platypus import SimpleDocTemplate
+
+        cls = _toc_doc_class() if toc else SimpleDocTemplate
+        return cls(str(out_path), pagesize=A4, rightMargin=2 * cm, leftMargin=2 * cm, topMargin=2 * cm, bottomMargin=2 * cm)
+
+    @staticmethod
+    def _stamp(created_at_iso: str) -> str:
+        return created_at_iso.replace(":", "").replace("-", "").split(".")[0]
 
-    def _render_chart_png(self, result_payload: Dict[str, Any], suffix: str) -> Optional[Path]:
-        """Render matplotlib chart to PNG for embedding in PDF."""
+    def _report_path(
+        self,
+        result_payload: Dict[str, Any],
+        timestamp: str,
+        user_id: Optional[int] = None,
+        history_id: Optional[int] = None,
+    ) -> Path:
+        name = f"Characterify_{result_payload.get('test_id','test')}_{timestamp}"
+        if user_id is not None:
+            name += f"_u{user_id}"
+        if history_id is not None:
+            name += f"_h{history_id}"
+        return self._claim_path(name)
 
-        chart_kind = result_payload.get("chart_kind", "")
-        out = self.paths.temp_dir / f"chart_{result_payload.get('test_id','test')}_{suffix}.png"
+    def _claim_path(self, stem: str) -> Path:
+        """Create an empty `{stem}.pdf` (or `{stem}-2.pdf`, ...) that no one else has.
 
-        # Use Agg backend (safe for headless PDF generation)
-        import matplotlib
-        matplotlib.use("Agg")
-        import matplotlib.pyplot as plt
+        Creation is exclusive, so concurrent exports (threads or CLI worker
+        processes) never get the same file.
+        """
 
-        plt.figure(figsize=(8, 4.5))
+        self.paths.exports_dir.mkdir(parents=True, exist_ok=True)
+        n = 1
+        while True:
+            path = self.paths.exports_dir / (f"{stem}.pdf" if n == 1 else f"{stem}-{n}.pdf")
+            try:
+                with open(path, "xb"):
+                    return path
+            except FileExistsError:
+                n += 1
+
+    def _build(self, path: Path, story: List[Any], toc: bool = False) -> None:
+        """Write `story` into a claimed path; the placeholder is removed if building fails."""
         try:
-            if chart_kind == "mbti_stacked":
-                dims = result_payload.get("percentages", [])
-                labels = [f"{d['name_a']} vs {d['name_b']}" for d in dims]
-                y = list(range(len(dims)))
-                for i, d in enumerate(dims):
-                    plt.barh(i, d["pct_a"], color="#1DB954")
-                    plt.barh(i, d["pct_b"], left=d["pct_a"], color="#3A3A3A")
-                    plt.text(d["pct_a"] / 2, i, f"{d['name_a']} {d['pct_a']:.0f}%", ha="center", va="center", color="white", fontsize=9)
-                    plt.text(d["pct_a"] + d["pct_b"] / 2, i, f"{d['name_b']} {d['pct_b']:.0f}%", ha="center", va="center", color="white", fontsize=9)
-                plt.xlim(0, 100)
-                plt.yticks(y, labels, fontsize=9)
-                plt.xticks([])
-                plt.grid(False)
-                plt.box(False)
+            if toc:
+                self._doc(path, toc=True).multiBuild(story)
             else:
-                # barh chart for OCEAN/Enneagram/Temperament
-                if isinstance(result_payload.get("percentages"), dict):
-                    perc = result_payload["percentages"]
-                    labels = []
-                    vals = []
-                    for k, v in perc.items():
-                        labels.append(str(k))
-                        vals.append(float(v))
-                    plt.barh(labels, vals, color="#1DB954")
-                    plt.xlim(0, max(100, max(vals) + 10 if vals else 100))
-                    plt.xticks([])
-                    plt.grid(False)
-                    plt.box(False)
-                else:
-                    # already list? fallback
-                    plt.text(0.1, 0.5, "Chart unavailable", fontsize=12)
-
-            plt.tight_layout()
-            plt.savefig(out, bbox_inches="tight", transparent=False, dpi=150)
-            return out
-        finally:
-            plt.close()
+                self._doc(path).build(story)
+        except BaseException:
+            path.unlink(missing_ok=True)
+            raise
+
+    def _chart(self, result_payload: Dict[str, Any]) -> Optional[Path]:
+        """Chart PNG for one result (from the chart cache when possible)."""
+
+        kind, perc = result_payload.get("chart_kind", ""), result_payload.get("percentages")
+        key = self.charts.key(kind, perc, CHART_THEME, CHART_DPI)
+        return self.charts.get_or_render(key, lambda out: render_chart_png(kind, perc, str(out), CHART_DPI))
+
+    @staticmethod
+    def _vector_chart(result_payload: Dict[str, Any]):
+        from reportlab.lib.units import cm
+
+        # Same box as the PNG image
+        return chart_drawing(result_payload.get("chart_kind", ""), result_payload.get("percentages"), 16 * cm, 9 * cm)
+
+    def _backend(self, chart_backend: Optional[str]) -> str:
+        backend = chart_backend or self.chart_backend
+        if backend not in CHART_BACKENDS:
+            raise ValueError(f"Backend grafik tidak dikenal: {backend}")
+        return backend
+
+    def _maybe_prune_charts(self) -> None:
+        """Evict old chart images (and legacy tmp PNGs on first run), at most every few minutes."""
+
+        now = time.monotonic()
+        if self._last_prune is not None and now - self._last_prune < CHART_PRUNE_INTERVAL_S:
+            return
+        first = self._last_prune is None
+        self._last_prune = now
+        try:
+            if first:
+                purge_legacy_charts(self.paths.temp_dir)
+            self.charts.prune()
+        except Exception:
+            logging.getLogger("characterify").warning("Chart cache cleanup failed", exc_info=True)
 
     @staticmethod
     def _escape(text: str) -> str:
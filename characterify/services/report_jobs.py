@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import itertools
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+# progress(percent 0-100, message)
+ProgressFn = Callable[[int, str], None]
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when its cancellation was requested."""
+
+
+@dataclass
+class ReportJob:
+    """Handle for one background report job.
+
+    `progress`/`message` are updated from the worker thread; `on_progress`,
+    `on_done` and `on_error` are called from the worker thread too, so UI code
+    should go through `characterify.ui.jobs`, which marshals them to Qt.
+    """
+
+    id: int
+    title: str
+    progress: int = 0
+    message: str = ""
+
+    on_progress: Optional[ProgressFn] = field(default=None, repr=False)
+    on_done: Optional[Callable[[Any], None]] = field(default=None, repr=False)
+    on_error: Optional[Callable[[BaseException], None]] = field(default=None, repr=False)
+
+    _cancel: threading.Event = field(default_factory=threading.Event, init=False, repr=False)
+    future: Optional[Future] = field(default=None, init=False, repr=False)
+
+    def cancel(self) -> None:
+        """Request cancellation; the job stops at its next progress checkpoint."""
+        self._cancel.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def done(self) -> bool:
+        return self.future is not None and self.future.done()
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        if self.future is None:
+            raise RuntimeError("Job belum dijalankan.")
+        return self.future.result(timeout)
+
+    def report(self, percent: int, message: str = "") -> None:
+        """Progress checkpoint passed to the job function.
+
+        Raises `JobCancelled` once `cancel()` was called.
+        """
+        if self._cancel.is_set():
+            raise JobCancelled()
+        self.progress = max(0, min(100, int(percent)))
+        self.message = message
+        if self.on_progress is not None:
+            self.on_progress(self.progress, message)
+
+
+@dataclass
+class ReportJobService:
+    """Runs report generation off the UI thread.
+
+    Jobs run on a small thread pool. reportlab and matplotlib (object API +
+    Agg canvas) do not touch Qt, so they are safe to run here. Jobs may use
+    the database (`Database` keeps one connection per thread), but must not
+    touch widgets: read any input from the UI before submitting and update
+    the UI from the callbacks (via `characterify.ui.jobs`).
+    """
+
+    max_workers: int = 2
+
+    _executor: Optional[ThreadPoolExecutor] = field(default=None, init=False, repr=False)
+    _jobs: Dict[int, ReportJob] = field(default_factory=dict, init=False, repr=False)
+    _ids: Any = field(default_factory=lambda: itertools.count(1), init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="report")
+            return self._executor
+
+    def submit(
+        self,
+        title: str,
+        fn: Callable[[ProgressFn], Any],
+        on_progress: Optional[ProgressFn] = None,
+        on_done: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[BaseException], None]] = None,
+    ) -> ReportJob:
+        """Run `fn(progress)` in the background and return its job handle.
+
+        `fn` should call `progress(percent, message)` between steps; that call
+        raises `JobCancelled` after `cancel()`. Exactly one of `on_done(result)`
+        or `on_error(exc)` is called at the end (`on_error` receives
+        `JobCancelled` for cancelled jobs).
+        """
+
+        job = ReportJob(
+            id=next(self._ids),
+            title=title,
+            on_progress=on_progress,
+            on_done=on_done,
+            on_error=on_error,
+        )
+        with self._lock:
+            self._jobs[job.id] = job
+        job.future = self._pool().submit(self._run, job, fn)
+        # A job cancelled before it started never reaches `_run`
+        job.future.add_done_callback(lambda f, job=job: self._finish_cancelled(job, f))
+        return job
+
+    def _run(self, job: ReportJob, fn: Callable[[ProgressFn], Any]) -> Any:
+        logger = logging.getLogger("characterify")
+        try:
+            job.report(0, "")
+            result = fn(job.report)
+            job.report(100, "")
+        except JobCancelled as exc:
+            logger.info(f"Report job cancelled | id={job.id} title={job.title}")
+            self._forget(job)
+            if job.on_error is not None:
+                job.on_error(exc)
+            raise
+        except Exception as exc:
+            logger.warning(f"Report job failed | id={job.id} title={job.title}", exc_info=True)
+            self._forget(job)
+            if job.on_error is not None:
+                job.on_error(exc)
+            raise
+        self._forget(job)
+        if job.on_done is not None:
+            job.on_done(result)
+        return result
+
+    def _finish_cancelled(self, job: ReportJob, future: Future) -> None:
+        if future.cancelled():
+            self._forget(job)
+            if job.on_error is not None:
+                job.on_error(JobCancelled())
+
+    def _forget(self, job: ReportJob) -> None:
+        with self._lock:
+            self._jobs.pop(job.id, None)
+
+    def active_jobs(self) -> List[ReportJob]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    def shutdown(self, cancel: bool = True) -> None:
+        """Stop the pool (on app exit). Running jobs are cancelled by default."""
+
+        if cancel:
+            for job in self.active_jobs():
+                job.cancel()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=cancel)
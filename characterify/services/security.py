@@ -1,47 +1,106 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Iterable, List, Optional
 
 from characterify.utils.paths import AppPaths
 
 
+def _fernet_module():
+    try:
+        from cryptography import fernet
+    except Exception as exc:  # pragma: no cover
+        raise RuntimeError(
+            "cryptography belum terpasang. Install: pip install cryptography"
+        ) from exc
+    return fernet
+
+
 @dataclass
 class SecurityService:
     """Handles lightweight local encryption for sensitive fields (e.g., local secrets).
 
     Uses Fernet symmetric encryption. The key is stored locally in the user's
     home directory (offline-first).
+
+    `key.key` holds one key per line: the first encrypts, the rest are
+    retired keys still accepted for decryption (after `rotate_key()`). The
+    keys are read and the cipher is built once, on first use.
     """
 
     paths: AppPaths
 
+    _cipher: Any = field(default=None, init=False, repr=False)
+    _keys: Optional[List[bytes]] = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
     def _get_fernet(self):
-        try:
-            from cryptography.fernet import Fernet
-        except Exception as exc:  # pragma: no cover
-            raise RuntimeError(
-                "cryptography belum terpasang. Install: pip install cryptography"
-            ) from exc
+        """Cached MultiFernet over the keyring (thread-safe, built once)."""
+        cipher = self._cipher
+        if cipher is not None:
+            return cipher
+        fernet = _fernet_module()
+        with self._lock:
+            if self._cipher is None:
+                keys = self._keyring()
+                self._cipher = fernet.MultiFernet([fernet.Fernet(k) for k in keys])
+            return self._cipher
 
-        key = self.get_or_create_key()
-        return Fernet(key)
+    # ---------------------------
+    # Keys
+    # ---------------------------
+    def _keyring(self) -> List[bytes]:
+        """All keys, current first (caller holds the lock)."""
+        if self._keys is None:
+            keys: List[bytes] = []
+            if self.paths.key_path.exists():
+                keys = self.paths.key_path.read_bytes().split()
+            if not keys:
+                keys = [_fernet_module().Fernet.generate_key()]
+                self._write_keys(keys)
+            self._keys = keys
+        return self._keys
+
+    def _write_keys(self, keys: List[bytes]) -> None:
+        # Write-then-rename so a crash never leaves a half-written keyring
+        tmp = self.paths.key_path.with_name(self.paths.key_path.name + ".tmp")
+        tmp.write_bytes(b"\n".join(keys))
+        os.replace(tmp, self.paths.key_path)
 
     def get_or_create_key(self) -> bytes:
-        if self.paths.key_path.exists():
-            return self.paths.key_path.read_bytes()
+        """The current (encrypting) key."""
+        with self._lock:
+            return self._keyring()[0]
+
+    def rotate_key(self, keep_old: Optional[int] = None) -> bytes:
+        """Make a new current key; the previous ones stay valid for decryption.
+
+        `keep_old` limits how many retired keys are kept (None keeps all).
+        Re-encrypt stored tokens with `rotate_many()` before dropping keys.
+        """
 
-        try:
-            from cryptography.fernet import Fernet
-        except Exception as exc:  # pragma: no cover
-            raise RuntimeError(
-                "cryptography belum terpasang. Install: pip install cryptography"
-            ) from exc
+        fernet = _fernet_module()
+        with self._lock:
+            old = list(self._keyring())
+            if keep_old is not None:
+                old = old[: max(0, keep_old)]
+            keys = [fernet.Fernet.generate_key()] + old
+            self._write_keys(keys)
+            self._keys = keys
+            self._cipher = None
+        return keys[0]
 
-        key = Fernet.generate_key()
-        self.paths.key_path.write_bytes(key)
-        return key
+    def reload(self) -> None:
+        """Forget the cached keys/cipher (e.g. after `key.key` was replaced outside the app)."""
+        with self._lock:
+            self._keys = None
+            self._cipher = None
 
+    # ---------------------------
+    # Encrypt / decrypt
+    # ---------------------------
     def encrypt(self, plaintext: str) -> str:
         if not plaintext:
             return ""
@@ -55,3 +114,18 @@ class SecurityService:
         f = self._get_fernet()
         plaintext: bytes = f.decrypt(token.encode("utf-8"))
         return plaintext.decode("utf-8")
+
+    def encrypt_many(self, plaintexts: Iterable[str]) -> List[str]:
+        """`encrypt` for many values with one cipher lookup (empty values stay empty)."""
+        f = self._get_fernet()
+        return [f.encrypt(p.encode("utf-8")).decode("utf-8") if p else "" for p in plaintexts]
+
+    def decrypt_many(self, tokens: Iterable[str]) -> List[str]:
+        """`decrypt` for many values; raises `cryptography.fernet.InvalidToken` on a bad token."""
+        f = self._get_fernet()
+        return [f.decrypt(tok.encode("utf-8")).decode("utf-8") if tok else "" for tok in tokens]
+
+    def rotate_many(self, tokens: Iterable[str]) -> List[str]:
+        """Re-encrypt tokens made with any key of the keyring under the current key."""
+        f = self._get_fernet()
+        return [f.rotate(tok.encode("utf-8")).decode("utf-8") if tok else "" for tok in tokens]
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import copy
 import json
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from characterify.db.database import Database
 from characterify.db.repositories import UserRepository
 from characterify.services.security import SecurityService
+from characterify.utils.i18n import set_active_language
 from characterify.utils.paths import AppPaths
 
 
@@ -23,10 +26,25 @@ DEFAULT_SETTINGS: Dict[str, Any] = {
 
 @dataclass
 class SettingsService:
+    """Global config (app_config.json) and per-user settings (users.settings_json).
+
+    Both are cached in memory: `t()` asks for the language on every string, so
+    reads must not touch SQLite or the disk. Per-user snapshots carry a
+    version that is bumped by every `save_user_settings`; the global config
+    is refreshed by `save_global_config`. Anything writing these outside this
+    service must call `invalidate()`.
+    """
+
     db: Database
     security: SecurityService
     paths: AppPaths
 
+    # user id -> (version, merged settings); treat snapshots as read-only
+    _user_cache: Dict[int, Tuple[int, Dict[str, Any]]] = field(default_factory=dict, init=False, repr=False)
+    _versions: Dict[int, int] = field(default_factory=dict, init=False, repr=False)
+    _global_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
+    _lock: threading.RLock = field(default_factory=threading.RLock, init=False, repr=False)
+
     def __post_init__(self) -> None:
         self.users = UserRepository(self.db)
         self._global_config_path = self.paths.base_dir / "app_config.json"
@@ -34,7 +52,14 @@ class SettingsService:
     # ---------------------------
     # Global config (pre-login)
     # ---------------------------
-    def load_global_config(self) -> Dict[str, Any]:
+    def _global_config(self) -> Dict[str, Any]:
+        """Cached global config (read-only; use `load_global_config` for a copy)."""
+        with self._lock:
+            if self._global_cache is None:
+                self._global_cache = self._read_global_config()
+            return self._global_cache
+
+    def _read_global_config(self) -> Dict[str, Any]:
         if not self._global_config_path.exists():
             return {"theme": "dark", "language": "id"}
         try:
@@ -42,41 +67,89 @@ class SettingsService:
         except Exception:
             return {"theme": "dark", "language": "id"}
 
+    def load_global_config(self) -> Dict[str, Any]:
+        return copy.deepcopy(self._global_config())
+
     def save_global_config(self, config: Dict[str, Any]) -> None:
         try:
             self._global_config_path.write_text(json.dumps(config, ensure_ascii=False, indent=2), encoding="utf-8")
         except Exception:
             pass
+        with self._lock:
+            self._global_cache = copy.deepcopy(config)
 
     # ---------------------------
     # Per-user settings
     # ---------------------------
-    def get_user_settings(self, user_id: int) -> Dict[str, Any]:
+    @staticmethod
+    def _merge_defaults(data: Dict[str, Any]) -> Dict[str, Any]:
+        merged = copy.deepcopy(DEFAULT_SETTINGS)
+        # deep-ish merge
+        for k, v in data.items():
+            if isinstance(v, dict) and isinstance(merged.get(k), dict):
+                merged[k] = {**merged[k], **v}
+            else:
+                merged[k] = v
+        return merged
+
+    def _user_settings(self, user_id: int) -> Dict[str, Any]:
+        """Cached merged settings for `user_id` (read-only)."""
+
+        with self._lock:
+            cached = self._user_cache.get(user_id)
+            if cached is not None:
+                return cached[1]
         row = self.users.get_by_id(user_id)
         if not row:
-            return dict(DEFAULT_SETTINGS)
+            # Not cached: the id may be registered later
+            return DEFAULT_SETTINGS
         raw = row.get("settings_json") or "{}"
         try:
             data = json.loads(raw)
         except Exception:
             data = {}
-        merged = dict(DEFAULT_SETTINGS)
-        # deep-ish merge
-        for k, v in data.items():
-            if isinstance(v, dict) and isinstance(merged.get(k), dict):
-                merged[k] = {**merged[k], **v}
-            else:
-                merged[k] = v
+        merged = self._merge_defaults(data if isinstance(data, dict) else {})
+        with self._lock:
+            # A save may have won the race; keep the newer snapshot
+            cached = self._user_cache.get(user_id)
+            if cached is not None:
+                return cached[1]
+            self._user_cache[user_id] = (self._versions.get(user_id, 0), merged)
         return merged
 
+    def settings_version(self, user_id: int) -> int:
+        """Bumped on every save of this user's settings."""
+        with self._lock:
+            return self._versions.get(user_id, 0)
+
+    def get_user_settings(self, user_id: int) -> Dict[str, Any]:
+        return copy.deepcopy(self._user_settings(user_id))
+
     def save_user_settings(self, user_id: int, settings: Dict[str, Any]) -> None:
         raw = json.dumps(settings, ensure_ascii=False)
         self.users.update_settings_json(user_id=user_id, settings_json=raw)
+        with self._lock:
+            version = self._versions.get(user_id, 0) + 1
+            self._versions[user_id] = version
+            self._user_cache[user_id] = (version, self._merge_defaults(copy.deepcopy(settings)))
+
+    def invalidate(self, user_id: Optional[int] = None) -> None:
+        """Drop cached settings (one user, or everything incl. the global config)."""
+        with self._lock:
+            if user_id is None:
+                stale = list(self._user_cache)
+                self._user_cache.clear()
+                self._global_cache = None
+            else:
+                stale = [user_id]
+                self._user_cache.pop(user_id, None)
+            for uid in stale:
+                self._versions[uid] = self._versions.get(uid, 0) + 1
 
     def get_theme(self, user_id: Optional[int] = None) -> str:
         if user_id:
-            return self.get_user_settings(user_id).get("theme", "dark")
-        return self.load_global_config().get("theme", "dark")
+            return self._user_settings(user_id).get("theme", "dark")
+        return self._global_config().get("theme", "dark")
 
     def set_theme(self, user_id: Optional[int], theme: str) -> None:
         theme = theme if theme in ("dark", "light") else "dark"
@@ -90,8 +163,8 @@ class SettingsService:
 
     def get_language(self, user_id: Optional[int] = None) -> str:
         if user_id:
-            return self.get_user_settings(user_id).get("language", "id")
-        return self.load_global_config().get("language", "id")
+            return self._user_settings(user_id).get("language", "id")
+        return self._global_config().get("language", "id")
 
     def set_language(self, user_id: Optional[int], lang: str) -> None:
         lang = lang if lang in ("id", "en") else "id"
@@ -127,18 +200,19 @@ class SettingsService:
     # Language application (optional QTranslator)
     # ---------------------------
     def apply_language(self, app, lang: str) -> None:
-        """Install Qt translator if a compiled `.qm` exists.
+        """Switch the active UI language; install Qt translator if a compiled `.qm` exists.
 
         Notes:
             The UI in this project primarily uses explicit `t(ctx, id, en)`
             (see `characterify/utils/i18n.py`) so language switching works
-            even without Qt Linguist tools.
+            even without Qt Linguist tools. This swaps its active catalog;
+            callers still repaint with `retranslate_ui()`.
 
             If you compile the provided `.ts` into a `.qm`, this method will
             load it so you can also translate Qt native strings.
         """
 
-        lang = lang if lang in ("id", "en") else "id"
+        lang = set_active_language(lang)
         try:
             from PySide6.QtCore import QTranslator
         except Exception:
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from concurrent.futures import CancelledError, Future
+from typing import Any, Callable, Optional
+
+from PySide6.QtCore import QObject, Qt, Signal, Slot
+from PySide6.QtWidgets import QProgressDialog, QWidget
+
+from characterify.services.report_jobs import JobCancelled, ProgressFn, ReportJob, ReportJobService
+
+
+class _JobBridge(QObject):
+    """Re-emits a job's worker-thread callbacks on the Qt (GUI) thread."""
+
+    progress = Signal(int, str)
+    done = Signal(object)
+    failed = Signal(object)
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.on_progress: Optional[ProgressFn] = None
+        self.on_done: Optional[Callable[[Any], None]] = None
+        self.on_error: Optional[Callable[[BaseException], None]] = None
+        # Queued: the slots run on this object's (GUI) thread, whoever emits
+        self.progress.connect(self._progress, Qt.QueuedConnection)
+        self.done.connect(self._done, Qt.QueuedConnection)
+        self.failed.connect(self._failed, Qt.QueuedConnection)
+
+    @Slot(int, str)
+    def _progress(self, percent: int, message: str) -> None:
+        if self.on_progress is not None:
+            self.on_progress(percent, message)
+
+    @Slot(object)
+    def _done(self, result: Any) -> None:
+        try:
+            if self.on_done is not None:
+                self.on_done(result)
+        finally:
+            self.deleteLater()
+
+    @Slot(object)
+    def _failed(self, exc: BaseException) -> None:
+        try:
+            if self.on_error is not None:
+                self.on_error(exc)
+        finally:
+            self.deleteLater()
+
+
+def submit_job(
+    service: ReportJobService,
+    parent: QObject,
+    title: str,
+    fn: Callable[[ProgressFn], Any],
+    on_progress: Optional[ProgressFn] = None,
+    on_done: Optional[Callable[[Any], None]] = None,
+    on_error: Optional[Callable[[BaseException], None]] = None,
+) -> ReportJob:
+    """Submit `fn` to `service`; all callbacks are delivered on the GUI thread."""
+
+    bridge = _JobBridge(parent)
+    bridge.on_progress = on_progress
+    bridge.on_done = on_done
+    bridge.on_error = on_error
+    return service.submit(
+        title,
+        fn,
+        on_progress=bridge.progress.emit,
+        on_done=bridge.done.emit,
+        on_error=bridge.failed.emit,
+    )
+
+
+def run_with_progress(
+    service: ReportJobService,
+    parent: QWidget,
+    title: str,
+    fn: Callable[[ProgressFn], Any],
+    on_done: Callable[[Any], None],
+    on_error: Optional[Callable[[BaseException], None]] = None,
+    cancel_text: str = "Batal",
+) -> ReportJob:
+    """Run `fn` in the background behind a non-blocking progress dialog.
+
+    The dialog's cancel button cancels the job. `on_error` is not called for
+    a cancelled job.
+    """
+
+    dialog = QProgressDialog(title, cancel_text, 0, 100, parent)
+    dialog.setWindowTitle(title)
+    dialog.setWindowModality(Qt.NonModal)
+    dialog.setAutoClose(False)
+    dialog.setAutoReset(False)
+    # Quick exports finish before the dialog would even show
+    dialog.setMinimumDuration(400)
+    dialog.setValue(0)
+
+    def progress(percent: int, message: str) -> None:
+        dialog.setValue(percent)
+        if message:
+            dialog.setLabelText(message)
+
+    def finish() -> None:
+        # Closing a QProgressDialog emits `canceled`; the job is over anyway
+        try:
+            dialog.canceled.disconnect(job.cancel)
+        except (RuntimeError, TypeError):
+            pass
+        dialog.close()
+        dialog.deleteLater()
+
+    def done(result: Any) -> None:
+        finish()
+        on_done(result)
+
+    def failed(exc: BaseException) -> None:
+        finish()
+        if not isinstance(exc, JobCancelled) and on_error is not None:
+            on_error(exc)
+
+    job = submit_job(service, parent, title, fn, on_progress=progress, on_done=done, on_error=failed)
+    dialog.canceled.connect(job.cancel)
+    return job
+
+
+def watch_future(
+    parent: QObject,
+    future: Future,
+    on_done: Callable[[Any], None],
+    on_error: Optional[Callable[[BaseException], None]] = None,
+) -> Future:
+    """Call `on_done(result)` or `on_error(exc)` on the GUI thread when `future` finishes."""
+
+    bridge = _JobBridge(parent)
+    bridge.on_done = on_done
+    bridge.on_error = on_error
+
+    def relay(f: Future) -> None:
+        try:
+            if f.cancelled():
+                bridge.failed.emit(CancelledError())
+            elif f.exception() is not None:
+                bridge.failed.emit(f.exception())
+            else:
+                bridge.done.emit(f.result())
+        except RuntimeError:
+            # `parent` (and the bridge with it) was deleted meanwhile
+            pass
+
+    future.add_done_callback(relay)
+    return future
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import (
     QFrame,
     QHBoxLayout,
@@ -15,19 +15,11 @@ from PySide6.QtWidgets import (
 
 from characterify.app_context import AppContext
 from characterify.services.telemetry import TelemetryService
-from characterify.ui.pages.account_settings import AccountSettingsPage
 from characterify.ui.pages.auth import LoginPage, RegisterPage
-from characterify.ui.pages.dashboard import DashboardPage
-from characterify.ui.pages.help import HelpPage
-from characterify.ui.pages.home import HomePage
-from characterify.ui.pages.information import InformationPage
-from characterify.ui.pages.learn import ArticleReaderPage, LearnPage
-from characterify.ui.pages.result import ResultPage
-from characterify.ui.pages.settings import SettingsPage
-from characterify.ui.pages.test_flow import TestIntroPage, TestListPage, TestRunnerPage
+from characterify.ui.texts import TextRegistry
 from characterify.ui.widgets.sidebar import NavItem, Sidebar
 from characterify.ui.widgets.topbar import TopBar
-from characterify.utils.i18n import t
+from characterify.utils.i18n import get_lang, t
 
 
 class MainWindow(QMainWindow):
@@ -45,6 +37,10 @@ class MainWindow(QMainWindow):
         self.setObjectName("AppRoot")
 
         self._current_key: str = "home"
+        # Language the UI texts were last translated to; pages still showing an older one
+        self._ui_lang: Optional[str] = None
+        self._stale_pages: Set[QWidget] = set()
+        self._texts = TextRegistry(ctx)
 
         # Root stack: Auth vs App
         root = QStackedWidget()
@@ -66,7 +62,17 @@ class MainWindow(QMainWindow):
     # i18n refresh
     # ---------------------------
     def retranslate_ui(self) -> None:
-        """Refresh nav labels, titles, and per-page static text."""
+        """Refresh nav labels, titles, and per-page static text.
+
+        Texts update in place. Only the current page of each stack is
+        retranslated now; the others are marked stale and catch up when
+        they are next shown (see `_refresh_stale`).
+        """
+        lang = get_lang(self.ctx)
+        if lang == self._ui_lang:
+            return
+        self._ui_lang = lang
+
         # Sidebar nav items (2 groups)
         g1 = [
             NavItem("home", t(self.ctx, "Beranda", "Home"), icon_name="fa5s.home", emoji_fallback="🏠"),
@@ -80,16 +86,14 @@ class MainWindow(QMainWindow):
         ]
 
         if hasattr(self, "sidebar"):
+            # Same keys as before: labels are updated on the existing buttons
             self.sidebar.set_items(group1=g1, group2=g2)
-            # Group labels
-            try:
-                self.sidebar.group1_label.setText(t(self.ctx, "MENU", "MENU"))
-                self.sidebar.group2_label.setText(t(self.ctx, "PREFERENSI", "PREFERENCES"))
-            except Exception:
-                pass
             # Keep current active item
             self.sidebar.set_active(getattr(self, "_current_key", "home") if self.ctx.is_authenticated() else "home")
 
+        # Group labels and other bound static texts
+        self._texts.retranslate()
+
         # Topbar texts (search/menu)
         if hasattr(self, "topbar"):
             try:
@@ -105,24 +109,26 @@ class MainWindow(QMainWindow):
         if hasattr(self, "topbar"):
             self._apply_title_for_key(getattr(self, "_current_key", "home"))
 
-        # Re-translate pages if they support it
-        for p in getattr(self, "_page_map", {}).values():
-            fn = getattr(p, "retranslate_ui", None)
-            if callable(fn):
-                try:
-                    fn()
-                except Exception:
-                    pass
-
-        # Auth pages too
+        # Pages: current one now, hidden ones on their next show
+        stacks = [getattr(self, "pages", None), getattr(self, "_auth_stack", None)]
+        for stack in stacks:
+            if stack is None:
+                continue
+            for i in range(stack.count()):
+                w = stack.widget(i)
+                if callable(getattr(w, "retranslate_ui", None)):
+                    self._stale_pages.add(w)
+            self._refresh_stale(stack.currentWidget())
+
+    def _refresh_stale(self, page: Optional[QWidget]) -> None:
+        """Retranslate `page` if the language changed since it was last shown."""
+        if page is None or page not in self._stale_pages:
+            return
+        self._stale_pages.discard(page)
         try:
-            for i in range(self._auth_stack.count()):
-                w = self._auth_stack.widget(i)
-                fn = getattr(w, "retranslate_ui", None)
-                if callable(fn):
-                    fn()
+            page.retranslate_ui()  # type: ignore[attr-defined]
         except Exception:
-            pass
+            self.telemetry.logger.warning("Retranslate failed for page", exc_info=True)
 
     def _apply_title_for_key(self, key: str) -> None:
         mapping = {
@@ -151,6 +157,7 @@ class MainWindow(QMainWindow):
 
         auth_stack = QStackedWidget()
         self._auth_stack = auth_stack
+        auth_stack.currentChanged.connect(lambda i: self._refresh_stale(auth_stack.widget(i)))
 
         login = LoginPage(self.ctx, on_login=self._on_login_success, go_register=lambda: auth_stack.setCurrentIndex(1))
         register = RegisterPage(self.ctx, go_login=lambda: auth_stack.setCurrentIndex(0))
@@ -173,6 +180,8 @@ class MainWindow(QMainWindow):
         self.sidebar = Sidebar()
         self.sidebar.set_items(group1=[], group2=[])
         self.sidebar.navigated.connect(self.navigate)
+        self._texts.bind(self.sidebar.group1_label, "MENU", "MENU")
+        self._texts.bind(self.sidebar.group2_label, "PREFERENSI", "PREFERENCES")
         main_layout.addWidget(self.sidebar)
 
         # Right panel: topbar + pages + bottom status bar
@@ -189,6 +198,7 @@ class MainWindow(QMainWindow):
         right_layout.addWidget(self.topbar)
 
         self.pages = QStackedWidget()
+        self.pages.currentChanged.connect(lambda i: self._refresh_stale(self.pages.widget(i)))
         right_layout.addWidget(self.pages, 1)
 
         # Bottom bar
@@ -205,32 +215,113 @@ class MainWindow(QMainWindow):
 
         main_layout.addWidget(right, 1)
 
-        # Instantiate pages
+        # Pages are created on first navigate() (see _page)
         self._page_map: Dict[str, QWidget] = {}
+        self._page_factories: Dict[str, Callable[[], QWidget]] = {}
+        self._prewarm_queue: List[str] = []
         self._register_pages()
 
         return w
 
     def _register_pages(self) -> None:
-        self._add_page("home", HomePage(self.ctx, on_start_test=lambda: self.navigate("test")))
-        self._add_page("test", TestListPage(self.ctx, on_select_test=lambda tid: self.navigate("test_intro", test_id=tid)))
-        self._add_page("test_intro", TestIntroPage(self.ctx, on_start=lambda tid: self.navigate("test_run", test_id=tid)))
-        self._add_page("test_run", TestRunnerPage(self.ctx, on_finished=self._on_test_finished, on_cancel=lambda: self.navigate("test")))
-        self._add_page("result", ResultPage(self.ctx, on_done=lambda: self.navigate("test")))
-        self._add_page("learn", LearnPage(self.ctx, on_open_article=lambda aid: self.navigate("article", article_id=aid)))
-        self._add_page("article", ArticleReaderPage(self.ctx, on_back=lambda: self.navigate("learn")))
-        self._add_page("help", HelpPage(self.ctx))
-        self._add_page("information", InformationPage(self.ctx))
-        self._add_page("settings", SettingsPage(self.ctx, on_theme_changed=self._on_theme_changed))
-        self._add_page("dashboard", DashboardPage(self.ctx, on_open_history=self._open_history_result, on_resume_session=self._resume_session))
-        self._add_page("account", AccountSettingsPage(self.ctx, on_back=lambda: self.navigate("dashboard")))
-
-        # Default page (won't show until authenticated)
-        self.pages.setCurrentWidget(self._page_map["home"])
-
-    def _add_page(self, key: str, page: QWidget) -> None:
-        self._page_map[key] = page
-        self.pages.addWidget(page)
+        """Register page factories. Page modules are imported on first use."""
+
+        def home() -> QWidget:
+            from characterify.ui.pages.home import HomePage
+            return HomePage(self.ctx, on_start_test=lambda: self.navigate("test"))
+
+        def test() -> QWidget:
+            from characterify.ui.pages.test_flow import TestListPage
+            return TestListPage(self.ctx, on_select_test=lambda tid: self.navigate("test_intro", test_id=tid))
+
+        def test_intro() -> QWidget:
+            from characterify.ui.pages.test_flow import TestIntroPage
+            return TestIntroPage(self.ctx, on_start=lambda tid: self.navigate("test_run", test_id=tid))
+
+        def test_run() -> QWidget:
+            from characterify.ui.pages.test_flow import TestRunnerPage
+            return TestRunnerPage(self.ctx, on_finished=self._on_test_finished, on_cancel=lambda: self.navigate("test"))
+
+        def result() -> QWidget:
+            from characterify.ui.pages.result import ResultPage
+            return ResultPage(self.ctx, on_done=lambda: self.navigate("test"))
+
+        def learn() -> QWidget:
+            from characterify.ui.pages.learn import LearnPage
+            return LearnPage(self.ctx, on_open_article=lambda aid: self.navigate("article", article_id=aid))
+
+        def article() -> QWidget:
+            from characterify.ui.pages.learn import ArticleReaderPage
+            return ArticleReaderPage(self.ctx, on_back=lambda: self.navigate("learn"))
+
+        def help_page() -> QWidget:
+            from characterify.ui.pages.help import HelpPage
+            return HelpPage(self.ctx)
+
+        def information() -> QWidget:
+            from characterify.ui.pages.information import InformationPage
+            return InformationPage(self.ctx)
+
+        def settings() -> QWidget:
+            from characterify.ui.pages.settings import SettingsPage
+            return SettingsPage(self.ctx, on_theme_changed=self._on_theme_changed)
+
+        def dashboard() -> QWidget:
+            from characterify.ui.pages.dashboard import DashboardPage
+            return DashboardPage(self.ctx, on_open_history=self._open_history_result, on_resume_session=self._resume_session)
+
+        def account() -> QWidget:
+            from characterify.ui.pages.account_settings import AccountSettingsPage
+            return AccountSettingsPage(self.ctx, on_back=lambda: self.navigate("dashboard"))
+
+        self._page_factories = {
+            "home": home,
+            "test": test,
+            "test_intro": test_intro,
+            "test_run": test_run,
+            "result": result,
+            "learn": learn,
+            "article": article,
+            "help": help_page,
+            "information": information,
+            "settings": settings,
+            "dashboard": dashboard,
+            "account": account,
+        }
+
+    def _page(self, key: str) -> Optional[QWidget]:
+        """Return the page for `key`, creating it on first use."""
+        page = self._page_map.get(key)
+        if page is None:
+            factory = self._page_factories.get(key)
+            if factory is None:
+                return None
+            page = factory()
+            self._page_map[key] = page
+            self.pages.addWidget(page)
+        return page
+
+    def prewarm_pages(self, keys: Optional[Iterable[str]] = None) -> None:
+        """Build pages ahead of time, one per event-loop pass.
+
+        Intended to run after the first paint so the login screen shows
+        immediately; navigating to a page that is not built yet still works.
+        """
+        self._prewarm_queue = [k for k in (keys or self._page_factories) if k not in self._page_map]
+        QTimer.singleShot(0, self._prewarm_next)
+
+    def _prewarm_next(self) -> None:
+        while self._prewarm_queue:
+            key = self._prewarm_queue.pop(0)
+            if key in self._page_map:
+                continue
+            try:
+                self._page(key)
+            except Exception:
+                self.telemetry.logger.warning(f"Prewarm failed for page '{key}'", exc_info=True)
+            break
+        if self._prewarm_queue:
+            QTimer.singleShot(0, self._prewarm_next)
 
     # ---------------------------
     # Navigation
@@ -245,32 +336,31 @@ class MainWindow(QMainWindow):
         if key in ("home", "test", "learn", "settings", "information", "help"):
             self.sidebar.set_active(key)
 
+        page = self._page(key)
+        if page is None:
+            self._apply_title_for_key(key)
+            return
+
+        # Catch up on a language change before loading new content into it
+        self._refresh_stale(page)
+
         # Update dynamic pages
         if key == "test_intro":
-            page: TestIntroPage = self._page_map[key]  # type: ignore
-            page.load_test(kwargs.get("test_id", "mbti"))
+            page.load_test(kwargs.get("test_id", "mbti"))  # type: ignore[attr-defined]
         elif key == "test_run":
-            page: TestRunnerPage = self._page_map[key]  # type: ignore
-            page.start_test(kwargs.get("test_id", "mbti"))
+            page.start_test(kwargs.get("test_id", "mbti"))  # type: ignore[attr-defined]
         elif key == "result":
-            page: ResultPage = self._page_map[key]  # type: ignore
-            page.show_result(kwargs["payload"], history_id=kwargs.get("history_id"))
+            page.show_result(kwargs["payload"], history_id=kwargs.get("history_id"))  # type: ignore[attr-defined]
         elif key == "article":
-            page: ArticleReaderPage = self._page_map[key]  # type: ignore
-            page.open_article(kwargs.get("article_id", ""))
+            page.open_article(kwargs.get("article_id", ""))  # type: ignore[attr-defined]
         elif key == "dashboard":
-            page: DashboardPage = self._page_map[key]  # type: ignore
-            page.refresh()
+            page.refresh()  # type: ignore[attr-defined]
         elif key == "account":
-            page: AccountSettingsPage = self._page_map[key]  # type: ignore
-            page.load()
+            page.load()  # type: ignore[attr-defined]
 
         # Change title
         self._apply_title_for_key(key)
 
-        page = self._page_map.get(key)
-        if page is None:
-            return
         self.pages.setCurrentWidget(page)
 
     def set_status(self, text: str) -> None:
@@ -293,6 +383,7 @@ class MainWindow(QMainWindow):
 
     def _on_login_success(self, user_id: int) -> None:
         self.ctx.current_user_id = user_id
+        self.ctx.article_status.load(user_id)
         user = self.ctx.auth.get_user(user_id) or {}
         self.topbar.set_user_label(user.get("name") or t(self.ctx, "Akun", "Account"))
 
@@ -312,6 +403,10 @@ class MainWindow(QMainWindow):
 
     def logout(self) -> None:
         self.ctx.current_user_id = None
+        self.ctx.article_status.clear()
+        # Back to the global language for the auth screens
+        self.ctx.settings.apply_language(self.qApp(), lang=self.ctx.settings.get_language(None))
+        self.retranslate_ui()
         self._show_auth()
 
     # ---------------------------
@@ -327,9 +422,12 @@ class MainWindow(QMainWindow):
         row = repo.get(history_id, self.ctx.current_user_id or 0)
         if not row:
             return
-        payload = self.ctx.db.loads(row["score_json"])
-        payload["test_id"] = row["test_type"]
-        payload["result_type"] = row["result_type"]
+        payload = self.ctx.scoring.hydrate_payload(
+            self.ctx.db.loads(row["score_json"]),
+            test_id=row["test_type"],
+            result_type=row["result_type"],
+            lang=self.ctx.settings.get_language(self.ctx.current_user_id),
+        )
         self.navigate("result", payload=payload, history_id=history_id)
 
     def _resume_session(self, test_id: str) -> None:
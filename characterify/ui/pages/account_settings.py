@@ -15,6 +15,7 @@ from PySide6.QtWidgets import (
 )
 
 from characterify.app_context import AppContext
+from characterify.ui.jobs import watch_future
 from characterify.ui.widgets.common import Card, H1, H2, Muted
 from characterify.ui.widgets.dialogs import show_error, show_info
 
@@ -90,10 +91,10 @@ class AccountSettingsPage(QWidget):
 
         pw.body.addLayout(form2)
 
-        btn_save_pw = QPushButton("Update Password")
-        btn_save_pw.setObjectName("PrimaryButton")
-        btn_save_pw.clicked.connect(self._save_password)
-        pw.body.addWidget(btn_save_pw)
+        self.btn_save_pw = QPushButton("Update Password")
+        self.btn_save_pw.setObjectName("PrimaryButton")
+        self.btn_save_pw.clicked.connect(self._save_password)
+        pw.body.addWidget(self.btn_save_pw)
 
         layout.addWidget(pw)
         layout.addStretch(1)
@@ -118,13 +119,28 @@ class AccountSettingsPage(QWidget):
 
     def _save_password(self) -> None:
         uid = self.ctx.current_user_id
-        if not uid:
+        if not uid or not self.btn_save_pw.isEnabled():
             return
-        try:
-            self.ctx.auth.update_password(uid, self.current_pw.text(), self.new_pw.text(), self.confirm_pw.text())
-            show_info(self, "Password", "Password berhasil diperbarui.")
-            self.current_pw.clear()
-            self.new_pw.clear()
-            self.confirm_pw.clear()
-        except Exception as exc:
-            show_error(self, "Gagal", str(exc))
+        # Verifying and hashing run on the auth worker thread
+        self._set_pw_busy(True)
+        watch_future(
+            self,
+            self.ctx.auth.update_password_async(uid, self.current_pw.text(), self.new_pw.text(), self.confirm_pw.text()),
+            on_done=self._password_saved,
+            on_error=self._password_failed,
+        )
+
+    def _set_pw_busy(self, busy: bool) -> None:
+        self.btn_save_pw.setEnabled(not busy)
+        self.btn_save_pw.setText("Memproses…" if busy else "Update Password")
+
+    def _password_saved(self, _result) -> None:
+        self._set_pw_busy(False)
+        show_info(self, "Password", "Password berhasil diperbarui.")
+        self.current_pw.clear()
+        self.new_pw.clear()
+        self.confirm_pw.clear()
+
+    def _password_failed(self, exc: BaseException) -> None:
+        self._set_pw_busy(False)
+        show_error(self, "Gagal", str(exc))
@@ -13,6 +13,7 @@ from PySide6.QtWidgets import (
 )
 
 from characterify.app_context import AppContext
+from characterify.ui.jobs import watch_future
 from characterify.ui.widgets.common import Card, H1, Muted
 from characterify.ui.widgets.dialogs import show_error, show_info
 
@@ -59,13 +60,33 @@ class LoginPage(QWidget):
         card.body.addLayout(row)
 
     def _login(self) -> None:
+        if not self.btn_login.isEnabled():
+            return
+        # Password hashing runs on the auth worker thread
+        self._set_busy(True)
+        watch_future(
+            self,
+            self.ctx.auth.login_async(self.email.text(), self.password.text()),
+            on_done=self._login_done,
+            on_error=self._login_failed,
+        )
+
+    def _set_busy(self, busy: bool) -> None:
+        self.btn_login.setEnabled(not busy)
+        self.btn_login.setText("Memproses…" if busy else "Login")
+
+    def _login_done(self, user_id: int) -> None:
+        self._set_busy(False)
         try:
-            user_id = self.ctx.auth.login(self.email.text(), self.password.text())
             show_info(self, "Login Berhasil", "Selamat datang di Characterify!")
             self.on_login(user_id)
         except Exception as exc:
             show_error(self, "Login Gagal", str(exc))
 
+    def _login_failed(self, exc: BaseException) -> None:
+        self._set_busy(False)
+        show_error(self, "Login Gagal", str(exc))
+
 
 class RegisterPage(QWidget):
     def __init__(self, ctx: AppContext, go_login: Callable[[], None]) -> None:
@@ -101,10 +122,10 @@ class RegisterPage(QWidget):
         self.confirm.setEchoMode(QLineEdit.Password)
         card.body.addWidget(self.confirm)
 
-        btn = QPushButton("Buat Akun")
-        btn.setObjectName("PrimaryButton")
-        btn.clicked.connect(self._register)
-        card.body.addWidget(btn)
+        self.btn_register = QPushButton("Buat Akun")
+        self.btn_register.setObjectName("PrimaryButton")
+        self.btn_register.clicked.connect(self._register)
+        card.body.addWidget(self.btn_register)
 
         row = QHBoxLayout()
         row.addWidget(Muted("Sudah punya akun?"))
@@ -117,11 +138,25 @@ class RegisterPage(QWidget):
         card.body.addLayout(row)
 
     def _register(self) -> None:
-        try:
-            _user_id = self.ctx.auth.register(
-                self.name.text(), self.email.text(), self.password.text(), self.confirm.text()
-            )
-            show_info(self, "Register Berhasil", "Akun berhasil dibuat. Silakan login.")
-            self.go_login()
-        except Exception as exc:
-            show_error(self, "Register Gagal", str(exc))
+        if not self.btn_register.isEnabled():
+            return
+        self._set_busy(True)
+        watch_future(
+            self,
+            self.ctx.auth.register_async(self.name.text(), self.email.text(), self.password.text(), self.confirm.text()),
+            on_done=self._register_done,
+            on_error=self._register_failed,
+        )
+
+    def _set_busy(self, busy: bool) -> None:
+        self.btn_register.setEnabled(not busy)
+        self.btn_register.setText("Memproses…" if busy else "Buat Akun")
+
+    def _register_done(self, _user_id: int) -> None:
+        self._set_busy(False)
+        show_info(self, "Register Berhasil", "Akun berhasil dibuat. Silakan login.")
+        self.go_login()
+
+    def _register_failed(self, exc: BaseException) -> None:
+        self._set_busy(False)
+        show_error(self, "Register Gagal", str(exc))
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Callable, Optional
+from functools import partial
+from typing import Callable, List, Optional, Tuple
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QGridLayout,
@@ -20,12 +21,16 @@ from PySide6.QtWidgets import (
 
 from characterify.app_context import AppContext
 from characterify.db.repositories import TestHistoryRepository, TestSessionRepository
+from characterify.ui.jobs import run_with_progress
 from characterify.ui.widgets.common import Badge, Card, H1, H2, Muted
 from characterify.ui.widgets.dialogs import ask_yes_no, show_error, show_info
 from characterify.utils.i18n import t
 
 
 class DashboardPage(QWidget):
+    # History rows fetched per scroll step
+    HISTORY_PAGE_SIZE = 50
+
     def __init__(
         self,
         ctx: AppContext,
@@ -40,6 +45,10 @@ class DashboardPage(QWidget):
         self.history_repo = TestHistoryRepository(ctx.db)
         self.session_repo = TestSessionRepository(ctx.db)
 
+        # Keyset cursor (created_at, id) of the last loaded history row
+        self._history_cursor: Optional[Tuple[str, int]] = None
+        self._history_exhausted: bool = True
+
         root = QVBoxLayout(self)
         root.setContentsMargins(18, 18, 18, 18)
         root.setSpacing(12)
@@ -80,11 +89,15 @@ class DashboardPage(QWidget):
         self.table.setHorizontalHeaderLabels(["Tanggal", "Test", "Result", "ID"])
         self.table.setColumnHidden(3, True)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        # Several rows can be selected for a batch PDF export
+        self.table.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.table.setAlternatingRowColors(False)
         self.table.verticalHeader().setVisible(False)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.doubleClicked.connect(self._open_selected)
+        self.table.setMinimumHeight(320)
+        self.table.verticalScrollBar().valueChanged.connect(self._on_table_scrolled)
 
         self.history_card.body.addWidget(self.table)
 
@@ -163,8 +176,7 @@ class DashboardPage(QWidget):
         add_row(2, "Join", str(user.get("created_at", "-")))
 
         # Stats
-        history = self.history_repo.list_by_user(uid)
-        add_row(3, "Total Tes", str(len(history)))
+        add_row(3, "Total Tes", str(self.history_repo.count_by_user(uid)))
 
         self.profile_card.body.addWidget(form)
 
@@ -201,11 +213,68 @@ class DashboardPage(QWidget):
         if not any_session:
             self.sessions_card.body.addWidget(Muted("Tidak ada sesi tersimpan."))
 
-        # Fill table
-        self._load_table(history)
+        # Fill table (first page; more rows are fetched while scrolling)
+        self._reset_table()
 
-    def _load_table(self, history_rows) -> None:
+    def _reset_table(self) -> None:
+        # Clearing the table moves the scrollbar; keep that from fetching a page
+        self._history_exhausted = True
         self.table.setRowCount(0)
+        self._history_cursor = None
+        self._history_exhausted = False
+        self._load_more_history()
+        self.table.resizeColumnsToContents()
+        self._fill_viewport()
+
+    def _on_table_scrolled(self, value: int) -> None:
+        bar = self.table.verticalScrollBar()
+        if value >= bar.maximum() - 2:
+            self._load_more_history()
+
+    def _fill_viewport(self) -> None:
+        """Load more pages while every loaded row fits without scrolling.
+
+        Otherwise a tall window never gets a scrollbar, so the rest of the
+        history could not be reached.
+        """
+        while (
+            not self._history_exhausted
+            and self.table.isVisible()
+            and self.table.verticalHeader().length() <= self.table.viewport().height()
+        ):
+            count = self.table.rowCount()
+            self._load_more_history()
+            if self.table.rowCount() == count:
+                break
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        # Sizes are final once the layout has run
+        QTimer.singleShot(0, self._fill_viewport)
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        QTimer.singleShot(0, self._fill_viewport)
+
+    def _load_more_history(self) -> None:
+        uid = self.ctx.current_user_id
+        if not uid or self._history_exhausted:
+            return
+        before_created_at, before_id = self._history_cursor or (None, None)
+        rows = self.history_repo.list_page(
+            uid,
+            before_created_at=before_created_at,
+            before_id=before_id,
+            limit=self.HISTORY_PAGE_SIZE,
+        )
+        if len(rows) < self.HISTORY_PAGE_SIZE:
+            self._history_exhausted = True
+        if rows:
+            last = rows[-1]
+            self._history_cursor = (last["created_at"], int(last["id"]))
+            self._append_rows(rows)
+
+    def _append_rows(self, history_rows: List[dict]) -> None:
         for row in history_rows:
             r = self.table.rowCount()
             self.table.insertRow(r)
@@ -215,7 +284,7 @@ class DashboardPage(QWidget):
             result = row.get("result_type", "")
 
             # convert test_id to nice title
-            t = next((x for x in self.ctx.scoring.get_tests() if x.id == test_id), None)
+            t = self.ctx.scoring.get_test(test_id)
             test_title = t.title if t else test_id
 
             self.table.setItem(r, 0, QTableWidgetItem(dt))
@@ -223,8 +292,6 @@ class DashboardPage(QWidget):
             self.table.setItem(r, 2, QTableWidgetItem(result))
             self.table.setItem(r, 3, QTableWidgetItem(str(row.get("id"))))
 
-        self.table.resizeColumnsToContents()
-
     def _selected_history_id(self) -> Optional[int]:
         items = self.table.selectedItems()
         if not items:
@@ -239,10 +306,24 @@ class DashboardPage(QWidget):
         except Exception:
             return None
 
+    def _selected_history_ids(self) -> List[int]:
+        """Ids of all selected rows, in table order."""
+        ids: List[int] = []
+        for index in sorted(self.table.selectionModel().selectedRows(3), key=lambda i: i.row()):
+            try:
+                ids.append(int(index.data()))
+            except Exception:
+                continue
+        return ids
+
     def _open_selected(self) -> None:
         hid = self._selected_history_id()
         if hid is None:
-            show_error(self, "Pilih Item", "Pilih salah satu history terlebih dahulu.")
+            show_error(
+                self,
+                t(self.ctx, "Pilih Item", "Select an Item"),
+                t(self.ctx, "Pilih salah satu history terlebih dahulu.", "Select a history entry first."),
+            )
             return
         self.on_open_history(hid)
 
@@ -252,46 +333,142 @@ class DashboardPage(QWidget):
             return
         hid = self._selected_history_id()
         if hid is None:
-            show_error(self, "Pilih Item", "Pilih salah satu history terlebih dahulu.")
+            show_error(
+                self,
+                t(self.ctx, "Pilih Item", "Select an Item"),
+                t(self.ctx, "Pilih salah satu history terlebih dahulu.", "Select a history entry first."),
+            )
             return
-        if not ask_yes_no(self, "Hapus", "Hapus history yang dipilih?"):
+        question = t(self.ctx, "Hapus history yang dipilih?", "Delete the selected history?")
+        if not ask_yes_no(self, t(self.ctx, "Hapus", "Delete"), question):
             return
         self.history_repo.delete(hid, uid)
-        show_info(self, "Hapus", "History berhasil dihapus.")
+        show_info(self, t(self.ctx, "Hapus", "Delete"), t(self.ctx, "History berhasil dihapus.", "History deleted."))
         self.refresh()
 
     def _pdf_selected(self) -> None:
         uid = self.ctx.current_user_id
         if not uid:
             return
+        ids = self._selected_history_ids()
+        if len(ids) > 1:
+            self._pdf_batch(ids)
+            return
         hid = self._selected_history_id()
         if hid is None:
-            show_error(self, "Pilih Item", "Pilih salah satu history terlebih dahulu.")
+            show_error(
+                self,
+                t(self.ctx, "Pilih Item", "Select an Item"),
+                t(self.ctx, "Pilih salah satu history terlebih dahulu.", "Select a history entry first."),
+            )
             return
         row = self.history_repo.get(hid, uid)
         if not row:
-            show_error(self, "Tidak Ditemukan", "History tidak ditemukan.")
+            show_error(
+                self,
+                t(self.ctx, "Tidak Ditemukan", "Not Found"),
+                t(self.ctx, "History tidak ditemukan.", "History not found."),
+            )
             return
-        payload = self.ctx.db.loads(row["score_json"])
-        payload["test_id"] = row["test_type"]
-        payload["result_type"] = row["result_type"]
+        lang = self.ctx.settings.get_language(uid)
+        payload = self.ctx.scoring.hydrate_payload(
+            self.ctx.db.loads(row["score_json"]), test_id=row["test_type"], result_type=row["result_type"], lang=lang
+        )
 
         user = self.ctx.auth.get_user(uid) or {}
         test_id = row["test_type"]
-        t = next((x for x in self.ctx.scoring.get_tests() if x.id == test_id), None)
-        title = f"{t.title} — {t.subtitle}" if t else test_id
-
-        try:
-            path = self.ctx.pdf.create_report(
-                user_name=user.get("name", "User"),
-                user_email=user.get("email", "-"),
+        test = self.ctx.scoring.get_test(test_id, lang)
+        title = f"{test.title} — {test.subtitle}" if test else test_id
+
+        name = user.get("name", "User")
+        email = user.get("email", "-")
+        created_at = row.get("created_at")
+        label = partial(t, self.ctx)
+
+        def build(progress):
+            return self.ctx.pdf.create_report(
+                user_name=name,
+                user_email=email,
                 test_title=title,
                 result_payload=payload,
-                created_at_iso=row.get("created_at"),
+                created_at_iso=created_at,
+                progress=progress,
+                user_id=uid,
+                history_id=hid,
+                label=label,
             )
-        except Exception as exc:
-            show_error(self, "Export PDF Gagal", str(exc))
+
+        run_with_progress(
+            self.ctx.reports,
+            self,
+            t(self.ctx, "Membuat PDF...", "Creating PDF..."),
+            build,
+            on_done=lambda path: show_info(self, *self._pdf_saved_text(str(path))),
+            on_error=self._pdf_failed,
+            cancel_text=t(self.ctx, "Batal", "Cancel"),
+        )
+
+    def _pdf_batch(self, history_ids: List[int]) -> None:
+        uid = self.ctx.current_user_id
+        if not uid:
             return
-        show_info(self, "Export PDF", f"PDF tersimpan di:\n{path}")
+        combined = ask_yes_no(
+            self,
+            t(self.ctx, "Export PDF", "Export PDF"),
+            t(
+                self.ctx,
+                "{n} history dipilih.\n\nGabungkan ke satu PDF dengan daftar isi?\n"
+                "(Pilih No untuk satu PDF per history.)",
+                "{n} history entries selected.\n\nCombine them into one PDF with a table of contents?\n"
+                "(Choose No for one PDF per entry.)",
+            ).format(n=len(history_ids)),
+        )
+        mode = "combined" if combined else "separate"
+        user = self.ctx.auth.get_user(uid) or {}
+        lang = self.ctx.settings.get_language(uid)
+        label = partial(t, self.ctx)
+
+        def build(progress):
+            return self.ctx.pdf.create_reports_batch(
+                history_ids,
+                mode=mode,
+                user_id=uid,
+                user_name=user.get("name", "User"),
+                user_email=user.get("email", "-"),
+                lang=lang,
+                progress=progress,
+                label=label,
+            )
+
+        def done(paths) -> None:
+            if len(paths) == 1:
+                show_info(self, *self._pdf_saved_text(str(paths[0])))
+            else:
+                show_info(
+                    self,
+                    t(self.ctx, "Export PDF", "Export PDF"),
+                    t(self.ctx, "{n} PDF tersimpan di:\n{path}", "{n} PDFs saved to:\n{path}").format(
+                        n=len(paths), path=paths[0].parent
+                    ),
+                )
+
+        run_with_progress(
+            self.ctx.reports,
+            self,
+            t(self.ctx, "Membuat {n} laporan PDF...", "Creating {n} PDF reports...").format(n=len(history_ids)),
+            build,
+            on_done=done,
+            on_error=self._pdf_failed,
+            cancel_text=t(self.ctx, "Batal", "Cancel"),
+        )
+
+    def _pdf_saved_text(self, path: str) -> Tuple[str, str]:
+        return (
+            t(self.ctx, "Export PDF", "Export PDF"),
+            t(self.ctx, "PDF tersimpan di:\n{path}", "PDF saved to:\n{path}").format(path=path),
+        )
+
+    def _pdf_failed(self, exc: BaseException) -> None:
+        show_error(self, t(self.ctx, "Export PDF Gagal", "PDF Export Failed"), str(exc))
 
     # Note: Email sending feature intentionally removed for simplicity.
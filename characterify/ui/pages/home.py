@@ -16,8 +16,9 @@ from PySide6.QtWidgets import (
 )
 
 from characterify.app_context import AppContext
+from characterify.ui.texts import TextRegistry
 from characterify.ui.widgets.common import Card, H1, H2, Muted
-from characterify.utils.i18n import t
+from characterify.utils.i18n import N_, t
 
 
 class HomePage(QWidget):
@@ -25,6 +26,7 @@ class HomePage(QWidget):
         super().__init__()
         self.ctx = ctx
         self.on_start_test = on_start_test
+        self._texts = TextRegistry(ctx)
 
         root = QVBoxLayout(self)
         root.setContentsMargins(18, 18, 18, 18)
@@ -83,34 +85,29 @@ class HomePage(QWidget):
         grid = QGridLayout()
         grid.setSpacing(12)
 
-        self._feature_widgets: list[tuple[H2, Muted, tuple[str, str], tuple[str, str]]] = []
-
         items = [
-            (("Deep Personality Analysis", "Deep Personality Analysis"),
-             ("Dapatkan gambaran trait, kekuatan, dan area pengembangan yang jelas untuk konteks personal maupun profesional.",
-              "Get a clear picture of traits, strengths, and development areas for personal and professional contexts.")),
-            (("Powered by Psychology", "Powered by Psychology"),
-             ("Berbasis kerangka psikologi yang umum digunakan. Fokus pada insight, bukan sekadar label.",
-              "Built on commonly used psychology frameworks. Focused on insights—not just labels.")),
-            (("Quick and Engaging", "Quick and Engaging"),
-             ("Tampilan modern. 5 pertanyaan per halaman dengan progress yang jelas.",
-              "Modern experience. 5 questions per page with clear progress.")),
-            (("Your Path to Growth", "Your Path to Growth"),
-             ("Hasil dilengkapi saran pengembangan diri: komunikasi, kerja tim, dan rutinitas kecil yang bisa langsung dicoba.",
-              "Results include growth tips: communication, teamwork, and small habits you can try immediately.")),
-            (("Detailed Reports", "Detailed Reports"),
-             ("Hasil dapat disimpan ke history dan diekspor menjadi PDF untuk dibagikan.",
-              "Save results to history and export a PDF report you can share.")),
+            (N_("Deep Personality Analysis", "Deep Personality Analysis"),
+             N_("Dapatkan gambaran trait, kekuatan, dan area pengembangan yang jelas untuk konteks personal maupun profesional.",
+                "Get a clear picture of traits, strengths, and development areas for personal and professional contexts.")),
+            (N_("Powered by Psychology", "Powered by Psychology"),
+             N_("Berbasis kerangka psikologi yang umum digunakan. Fokus pada insight, bukan sekadar label.",
+                "Built on commonly used psychology frameworks. Focused on insights—not just labels.")),
+            (N_("Quick and Engaging", "Quick and Engaging"),
+             N_("Tampilan modern. 5 pertanyaan per halaman dengan progress yang jelas.",
+                "Modern experience. 5 questions per page with clear progress.")),
+            (N_("Your Path to Growth", "Your Path to Growth"),
+             N_("Hasil dilengkapi saran pengembangan diri: komunikasi, kerja tim, dan rutinitas kecil yang bisa langsung dicoba.",
+                "Results include growth tips: communication, teamwork, and small habits you can try immediately.")),
+            (N_("Detailed Reports", "Detailed Reports"),
+             N_("Hasil dapat disimpan ke history dan diekspor menjadi PDF untuk dibagikan.",
+                "Save results to history and export a PDF report you can share.")),
         ]
 
         for idx, (title_pair, desc_pair) in enumerate(items):
             c = Card()
-            h2 = H2()
-            m = Muted()
-            c.body.addWidget(h2)
-            c.body.addWidget(m)
+            c.body.addWidget(self._texts.bind(H2(), *title_pair))
+            c.body.addWidget(self._texts.bind(Muted(), *desc_pair))
             grid.addWidget(c, idx // 2, idx % 2)
-            self._feature_widgets.append((h2, m, title_pair, desc_pair))
 
         grid_wrap = QWidget()
         grid_wrap.setLayout(grid)
@@ -130,10 +127,7 @@ class HomePage(QWidget):
             )
         )
         self.btn_start.setText(t(self.ctx, "Mulai Tes", "Start Test"))
-
-        for h2, m, title_pair, desc_pair in self._feature_widgets:
-            h2.setText(t(self.ctx, title_pair[0], title_pair[1]))
-            m.setText(t(self.ctx, desc_pair[0], desc_pair[1]))
+        self._texts.retranslate()
 
     def _load_branding(self) -> Optional[QPixmap]:
         here = Path(__file__).resolve()
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Callable, Dict, List, Optional
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import (
     QComboBox,
     QHBoxLayout,
@@ -16,20 +16,66 @@ from PySide6.QtWidgets import (
 )
 
 from characterify.app_context import AppContext
-from characterify.data.articles import get_article, get_articles
-from characterify.db.repositories import ArticleReadRepository
+from characterify.data.article_store import get_article, get_articles
+from characterify.services.article_search import search_articles
+from characterify.ui.texts import TextRegistry
 from characterify.ui.widgets.common import Badge, Card, H1, H2, Muted
 from characterify.utils.i18n import t
 
 
+class _ArticleCard(Card):
+    """One article in the Learn list; reused across searches and filters."""
+
+    def __init__(self, ctx: AppContext, on_open: Callable[[str], None]) -> None:
+        super().__init__()
+        self.ctx = ctx
+        self.article_id = ""
+
+        title_row = QHBoxLayout()
+        self.title = H2("")
+        title_row.addWidget(self.title)
+        title_row.addStretch(1)
+        self.read_time = Badge("")
+        self.category = Badge("")
+        title_row.addWidget(self.read_time)
+        title_row.addWidget(self.category)
+        self.body.addLayout(title_row)
+
+        self.summary = Muted("")
+        self.body.addWidget(self.summary)
+
+        row = QHBoxLayout()
+        self.bookmark = Badge("")
+        row.addWidget(self.bookmark)
+        row.addStretch(1)
+        self.btn_open = QPushButton("")
+        self.btn_open.setObjectName("PrimaryButton")
+        self.btn_open.clicked.connect(lambda: on_open(self.article_id))
+        row.addWidget(self.btn_open)
+        self.body.addLayout(row)
+
+    def set_article(self, a: Dict) -> None:
+        self.article_id = a["id"]
+        self.title.setText(a["title"])
+        self.read_time.setText(a["read_time"])
+        self.category.setText(a["category"])
+        self.summary.setText(a["summary"])
+        self.bookmark.setText("★ " + t(self.ctx, "Tersimpan", "Bookmarked"))
+        self.btn_open.setText(t(self.ctx, "Buka", "Open"))
+
+    def set_bookmarked(self, bookmarked: bool) -> None:
+        self.bookmark.setVisible(bookmarked)
+
+
 class LearnPage(QWidget):
+    # Delay after the last keystroke before searching
+    SEARCH_DEBOUNCE_MS = 180
+
     def __init__(self, ctx: AppContext, on_open_article: Callable[[str], None]) -> None:
         super().__init__()
         self.ctx = ctx
         self.on_open_article = on_open_article
 
-        self.repo = ArticleReadRepository(ctx.db)
-
         root = QVBoxLayout(self)
         root.setContentsMargins(18, 18, 18, 18)
         root.setSpacing(12)
@@ -42,7 +88,12 @@ class LearnPage(QWidget):
         # Filters
         filters = QHBoxLayout()
         self.search = QLineEdit()
-        self.search.textChanged.connect(self.refresh)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self.refresh)
+        self.search.textChanged.connect(lambda _text: self._search_timer.start())
+        self.search.returnPressed.connect(self.refresh)
         filters.addWidget(self.search, 2)
 
         self.category = QComboBox()
@@ -61,24 +112,30 @@ class LearnPage(QWidget):
         self.body_layout = QVBoxLayout(body)
         self.body_layout.setContentsMargins(0, 0, 0, 0)
         self.body_layout.setSpacing(12)
+        self.body_layout.addStretch(1)
+
+        # article id -> card, built once per catalog and shown/hidden by refresh()
+        self._cards: Dict[str, _ArticleCard] = {}
+        self._shown: List[str] = []
 
+        self._texts = TextRegistry(ctx)
+        self._texts.bind(self.h_title, "Learn", "Learn")
+        self._texts.bind(
+            self.h_sub,
+            "Artikel pembelajaran tentang kepribadian dan psikologi—ringkas, terstruktur, dan praktis.",
+            "Learning articles about personality and psychology—structured, practical, and easy to follow.",
+        )
+        self._texts.bind(self.search, "Cari artikel…", "Search articles…", setter="setPlaceholderText")
+
+        # Language the articles and cards were loaded in
+        self._data_lang = ""
         self._reload_data()
 
     def _reload_data(self) -> None:
         lang = self.ctx.settings.get_language(self.ctx.current_user_id)
+        self._data_lang = lang
         self.articles: List[Dict] = get_articles(lang)
 
-        # retranslate static UI
-        self.h_title.setText(t(self.ctx, "Learn", "Learn"))
-        self.h_sub.setText(
-            t(
-                self.ctx,
-                "Artikel pembelajaran tentang kepribadian dan psikologi—ringkas, terstruktur, dan praktis.",
-                "Learning articles about personality and psychology—structured, practical, and easy to follow.",
-            )
-        )
-        self.search.setPlaceholderText(t(self.ctx, "Cari artikel…", "Search articles…"))
-
         # categories depend on language
         self.category.blockSignals(True)
         prev = self.category.currentText()
@@ -92,66 +149,69 @@ class LearnPage(QWidget):
             self.category.setCurrentText(prev)
         self.category.blockSignals(False)
 
+        self._sync_cards()
+        self._refresh_bookmarks()
         self.refresh()
 
+    def _sync_cards(self) -> None:
+        """Create cards for new articles, update texts of existing ones."""
+        ids = {a["id"] for a in self.articles}
+        for aid in [k for k in self._cards if k not in ids]:
+            card = self._cards.pop(aid)
+            self.body_layout.removeWidget(card)
+            card.deleteLater()
+        for a in self.articles:
+            card = self._cards.get(a["id"])
+            if card is None:
+                card = _ArticleCard(self.ctx, self.on_open_article)
+                card.hide()
+                self._cards[a["id"]] = card
+            card.set_article(a)
+        self._shown = [aid for aid in self._shown if aid in self._cards]
+
+    def _refresh_bookmarks(self) -> None:
+        status = self.ctx.article_status
+        for aid, card in self._cards.items():
+            card.set_bookmarked(status.is_bookmarked(aid))
+
+    def showEvent(self, event) -> None:
+        if self._data_lang != self.ctx.settings.get_language(self.ctx.current_user_id):
+            # Language changed while hidden
+            self._reload_data()
+        else:
+            # Bookmarks may have changed in the reader
+            self._refresh_bookmarks()
+        super().showEvent(event)
+
     def _filtered(self) -> List[Dict]:
-        q = (self.search.text() or "").strip().lower()
+        lang = self.ctx.settings.get_language(self.ctx.current_user_id)
         cat = self.category.currentText()
-        all_label = t(self.ctx, "All", "All")
-        items: List[Dict] = []
-        for a in self.articles:
-            if cat != all_label and a["category"] != cat:
-                continue
-            if q:
-                hay = f"{a['title']} {a['summary']} {a['category']}".lower()
-                if q not in hay:
-                    continue
-            items.append(a)
-        return items
+        category = None if cat == t(self.ctx, "All", "All") else cat
+        return search_articles(self.search.text() or "", lang, category)
 
     def refresh(self) -> None:
-        # Clear
-        while self.body_layout.count():
-            it = self.body_layout.takeAt(0)
-            w = it.widget()
-            if w:
-                w.deleteLater()
-
-        items = self._filtered()
-
-        for a in items:
-            c = Card()
-            title_row = QHBoxLayout()
-            title_row.addWidget(H2(a["title"]))
-            title_row.addStretch(1)
-            title_row.addWidget(Badge(a["read_time"]))
-            title_row.addWidget(Badge(a["category"]))
-            c.body.addLayout(title_row)
-
-            c.body.addWidget(Muted(a["summary"]))
-
-            # Bookmark state
-            bookmarked = False
-            if self.ctx.current_user_id:
-                st = self.repo.get_status(self.ctx.current_user_id, a["id"])
-                bookmarked = st["bookmarked"]
-
-            row = QHBoxLayout()
-            if bookmarked:
-                row.addWidget(Badge("★ " + t(self.ctx, "Tersimpan", "Bookmarked")))
-            row.addStretch(1)
-            btn = QPushButton(t(self.ctx, "Buka", "Open"))
-            btn.setObjectName("PrimaryButton")
-            btn.clicked.connect(lambda _=False, aid=a["id"]: self.on_open_article(aid))
-            row.addWidget(btn)
-            c.body.addLayout(row)
-
-            self.body_layout.addWidget(c)
+        self._search_timer.stop()
+        order = [a["id"] for a in self._filtered()]
+        if order == self._shown:
+            return
 
-        self.body_layout.addStretch(1)
+        # Reorder the existing cards; only visibility and position change
+        for aid in self._shown:
+            card = self._cards.get(aid)
+            if card is not None:
+                card.hide()
+        for pos, aid in enumerate(order):
+            card = self._cards[aid]
+            self.body_layout.removeWidget(card)
+            self.body_layout.insertWidget(pos, card)
+            card.show()
+        self._shown = order
 
     def retranslate_ui(self) -> None:
-        self._reload_data()
+        self._texts.retranslate()
+        # Articles and cards are reloaded now only if visible, otherwise on the next show
+        if self.isVisible() and self._data_lang != self.ctx.settings.get_language(self.ctx.current_user_id):
+            self._reload_data()
 
 
 class ArticleReaderPage(QWidget):
@@ -159,17 +219,18 @@ class ArticleReaderPage(QWidget):
         super().__init__()
         self.ctx = ctx
         self.on_back = on_back
-        self.repo = ArticleReadRepository(ctx.db)
 
         self.current_article_id: str = ""
+        # Language the open article was loaded in
+        self._content_lang = ""
 
         root = QVBoxLayout(self)
         root.setContentsMargins(18, 18, 18, 18)
         root.setSpacing(12)
 
         top = QHBoxLayout()
-        self.btn_back = QPushButton("")
-        self.btn_back.setText("← " + t(self.ctx, "Kembali", "Back"))
+        self._texts = TextRegistry(ctx)
+        self.btn_back = self._texts.bind(QPushButton(""), "Kembali", "Back", template="← {}")
         self.btn_back.clicked.connect(self.on_back)
         top.addWidget(self.btn_back)
 
@@ -194,6 +255,7 @@ class ArticleReaderPage(QWidget):
     def open_article(self, article_id: str) -> None:
         self.current_article_id = article_id
         lang = self.ctx.settings.get_language(self.ctx.current_user_id)
+        self._content_lang = lang
         a = get_article(article_id, lang)
         if not a:
             self.title.setText(t(self.ctx, "Artikel tidak ditemukan", "Article not found"))
@@ -205,33 +267,39 @@ class ArticleReaderPage(QWidget):
         self.meta.setText(f"{a['category']} • {a['read_time']}")
         self.reader.setHtml(a["content"])
 
-        # Mark read
+        # Mark read (cached; written in batches)
         if self.ctx.current_user_id:
-            self.repo.mark_read(self.ctx.current_user_id, article_id, bookmarked=False)
+            self.ctx.article_status.mark_read(article_id)
 
         self._refresh_bookmark_button()
 
     def retranslate_ui(self) -> None:
-        # re-open current article with new language
-        if self.current_article_id:
+        self._texts.retranslate()
+        self._refresh_bookmark_button()
+        # re-open current article with new language (when hidden: on the next show)
+        if self.isVisible():
+            self._reopen_if_language_changed()
+
+    def showEvent(self, event) -> None:
+        self._reopen_if_language_changed()
+        super().showEvent(event)
+
+    def _reopen_if_language_changed(self) -> None:
+        if self.current_article_id and self._content_lang != self.ctx.settings.get_language(self.ctx.current_user_id):
             self.open_article(self.current_article_id)
-        else:
-            self.btn_back.setText("← " + t(self.ctx, "Kembali", "Back"))
-            self._refresh_bookmark_button()
 
     def _refresh_bookmark_button(self) -> None:
         if not self.ctx.current_user_id or not self.current_article_id:
             self.btn_bookmark.setText(t(self.ctx, "Bookmark", "Bookmark"))
             return
-        st = self.repo.get_status(self.ctx.current_user_id, self.current_article_id)
+        bookmarked = self.ctx.article_status.is_bookmarked(self.current_article_id)
         self.btn_bookmark.setText(
-            t(self.ctx, "Unbookmark", "Unbookmark") if st["bookmarked"] else t(self.ctx, "Bookmark", "Bookmark")
+            t(self.ctx, "Unbookmark", "Unbookmark") if bookmarked else t(self.ctx, "Bookmark", "Bookmark")
         )
 
     def _toggle_bookmark(self) -> None:
         if not self.ctx.current_user_id or not self.current_article_id:
             return
-        st = self.repo.get_status(self.ctx.current_user_id, self.current_article_id)
-        new_val = not st["bookmarked"]
-        self.repo.toggle_bookmark(self.ctx.current_user_id, self.current_article_id, new_val)
+        status = self.ctx.article_status
+        status.set_bookmark(self.current_article_id, not status.is_bookmarked(self.current_article_id))
         self._refresh_bookmark_button()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -16,7 +17,7 @@ from PySide6.QtWidgets import (
 
 from characterify.app_context import AppContext
 from characterify.db.repositories import TestHistoryRepository
-from characterify.services.pdf_report import PdfReportService
+from characterify.ui.jobs import run_with_progress
 from characterify.ui.widgets.charts import ChartPayload, ChartWidget
 from characterify.ui.widgets.common import Badge, Card, H1, H2, Muted
 from characterify.ui.widgets.dialogs import show_error, show_info
@@ -78,7 +79,8 @@ class ResultPage(QWidget):
 
         # Determine test title
         test_id = self.payload.get("test_id", "")
-        t = next((x for x in self.ctx.scoring.get_tests() if x.id == test_id), None)
+        lang = self.ctx.settings.get_language(self.ctx.current_user_id)
+        t = self.ctx.scoring.get_test(test_id, lang)
         self.test_title = f"{t.title} — {t.subtitle}" if t else test_id
 
         self._render()
@@ -199,18 +201,41 @@ class ResultPage(QWidget):
         user = self.ctx.auth.get_user(self.ctx.current_user_id) or {}
         name = user.get("name", "User")
         email = user.get("email", "-")
-        try:
-            path = self.ctx.pdf.create_report(
+        title = self.test_title
+        payload = self.payload
+        created_at = self.created_at
+        user_id = self.ctx.current_user_id
+        history_id = self.history_id
+        label = partial(t, self.ctx)
+
+        def build(progress):
+            return self.ctx.pdf.create_report(
                 user_name=name,
                 user_email=email,
-                test_title=self.test_title,
-                result_payload=self.payload,
-                created_at_iso=self.created_at,
+                test_title=title,
+                result_payload=payload,
+                created_at_iso=created_at,
+                progress=progress,
+                user_id=user_id,
+                history_id=history_id,
+                label=label,
             )
-        except Exception as exc:
+
+        def done(path) -> None:
+            show_info(self, t(self.ctx, "Export PDF", "Export PDF"), f"PDF {t(self.ctx,'tersimpan di','saved to')}:\n{path}")
+
+        def failed(exc: BaseException) -> None:
             show_error(self, t(self.ctx, "Export PDF Gagal", "PDF Export Failed"), str(exc))
-            return
-        show_info(self, t(self.ctx, "Export PDF", "Export PDF"), f"PDF {t(self.ctx,'tersimpan di','saved to')}:\n{path}")
+
+        run_with_progress(
+            self.ctx.reports,
+            self,
+            t(self.ctx, "Membuat PDF...", "Creating PDF..."),
+            build,
+            on_done=done,
+            on_error=failed,
+            cancel_text=t(self.ctx, "Batal", "Cancel"),
+        )
 
     def retranslate_ui(self) -> None:
         self.btn_pdf.setText(t(self.ctx, "Export PDF", "Export PDF"))
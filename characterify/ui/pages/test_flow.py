@@ -55,7 +55,8 @@ class TestListPage(QWidget):
             if w:
                 w.deleteLater()
 
-        tests = self.ctx.scoring.get_tests()
+        lang = self.ctx.settings.get_language(self.ctx.current_user_id)
+        tests = self.ctx.scoring.get_tests(lang)
         sessions = TestSessionRepository(self.ctx.db)
 
         for t in tests:
@@ -125,7 +126,8 @@ class TestIntroPage(QWidget):
 
     def load_test(self, test_id: str) -> None:
         self.current_test_id = test_id
-        t = next((x for x in self.ctx.scoring.get_tests() if x.id == test_id), None)
+        lang = self.ctx.settings.get_language(self.ctx.current_user_id)
+        t = self.ctx.scoring.get_test(test_id, lang)
         if not t:
             return
         self.title.setText(f"{t.title}")
@@ -217,7 +219,8 @@ class TestRunnerPage(QWidget):
         self.answers = {}
         self._question_widgets.clear()
 
-        t = next((x for x in self.ctx.scoring.get_tests() if x.id == test_id), None)
+        lang = self.ctx.settings.get_language(self.ctx.current_user_id)
+        t = self.ctx.scoring.get_test(test_id, lang)
         if not t:
             return
         self.title.setText(f"{t.title} — {t.subtitle}")
@@ -250,7 +253,7 @@ class TestRunnerPage(QWidget):
                 w.deleteLater()
         self._question_widgets.clear()
 
-        t = next((x for x in self.ctx.scoring.get_tests() if x.id == self.current_test_id), None)
+        t = self.ctx.scoring.get_test(self.current_test_id)
         if not t:
             return
 
@@ -295,7 +298,7 @@ class TestRunnerPage(QWidget):
             show_error(self, "Belum Lengkap", "Mohon jawab semua pertanyaan di halaman ini sebelum lanjut.")
             return
 
-        t = next((x for x in self.ctx.scoring.get_tests() if x.id == self.current_test_id), None)
+        t = self.ctx.scoring.get_test(self.current_test_id)
         if not t:
             return
 
@@ -320,9 +323,10 @@ class TestRunnerPage(QWidget):
             show_error(self, "Not Logged In", "Silakan login.")
             return
 
-        payload = self.ctx.scoring.score_test(self.current_test_id, self.answers)
-        # Persist full payload in history for later view
-        score_json = self.ctx.db.dumps(payload)
+        lang = self.ctx.settings.get_language(self.ctx.current_user_id)
+        payload = self.ctx.scoring.score_test(self.current_test_id, self.answers, lang)
+        # Persist scores only; the narrative is regenerated when viewed
+        score_json = self.ctx.db.dumps(self.ctx.scoring.compact_payload(payload))
         answers_json = self.ctx.db.dumps(self.answers)
         repo = TestHistoryRepository(self.ctx.db)
         history_id = repo.add(
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import List, Optional, Tuple, TypeVar
+
+import shiboken6
+
+from characterify.utils.i18n import t
+
+W = TypeVar("W")
+
+
+class TextRegistry:
+    """Static texts bound to widgets, re-applied in place on language change.
+
+    `bind(label, "Beranda", "Home")` sets the text now and remembers it;
+    `retranslate()` calls the setter again for every bound widget that still
+    exists, without rebuilding anything.
+    """
+
+    def __init__(self, ctx) -> None:
+        self.ctx = ctx
+        # (widget, setter name, id_text, en_text, template)
+        self._entries: List[Tuple[object, str, str, Optional[str], str]] = []
+
+    def bind(
+        self,
+        widget: W,
+        id_text: str,
+        en_text: Optional[str] = None,
+        setter: str = "setText",
+        template: str = "{}",
+    ) -> W:
+        """Register `widget`; `template` wraps the translated text (e.g. "← {}")."""
+        entry = (widget, setter, id_text, en_text, template)
+        self._entries.append(entry)
+        self._apply(entry)
+        return widget
+
+    def retranslate(self) -> None:
+        alive = [e for e in self._entries if shiboken6.isValid(e[0])]
+        self._entries = alive
+        for entry in alive:
+            self._apply(entry)
+
+    def _apply(self, entry: Tuple[object, str, str, Optional[str], str]) -> None:
+        widget, setter, id_text, en_text, template = entry
+        getattr(widget, setter)(template.format(t(self.ctx, id_text, en_text)))
@@ -5,10 +5,6 @@ from typing import Any, Dict, List, Optional
 
 from PySide6.QtWidgets import QVBoxLayout, QWidget
 
-# Matplotlib embedding
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-
 
 @dataclass
 class ChartPayload:
@@ -28,6 +24,10 @@ class ChartWidget(QWidget):
         super().__init__(parent)
         self.payload = payload
 
+        # Matplotlib embedding (imported on first chart, not at app startup)
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+
         self.figure = Figure(figsize=(6, 4))
         self.canvas = FigureCanvas(self.figure)
 
@@ -38,6 +38,8 @@ class Sidebar(QFrame):
         self._buttons: Dict[str, QPushButton] = {}
         self._items: Tuple[List[NavItem], List[NavItem]] = ([], [])
         self._active_key: str = ""
+        # qtawesome is slow to import; icons are loaded when the sidebar is first shown
+        self._icons_ready = False
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(14, 16, 14, 16)
@@ -73,13 +75,41 @@ class Sidebar(QFrame):
         self.footer.setStyleSheet("color: #6F6F6F; font-size: 8pt;")
         layout.addWidget(self.footer)
 
+    def showEvent(self, event) -> None:
+        if not self._icons_ready:
+            self._icons_ready = True
+            self._rebuild_buttons()
+        super().showEvent(event)
+
     @property
     def active_key(self) -> str:
         return self._active_key
 
     def set_items(self, group1: List[NavItem], group2: List[NavItem]) -> None:
-        self._items = (list(group1), list(group2))
-        self._rebuild_buttons()
+        """Set the nav items; if only labels changed, the buttons are relabeled in place."""
+        items = (list(group1), list(group2))
+        same_layout = bool(self._buttons) and self._layout_of(items) == self._layout_of(self._items)
+        self._items = items
+        if same_layout:
+            self._relabel()
+        else:
+            self._rebuild_buttons()
+
+    @staticmethod
+    def _layout_of(items: Tuple[List[NavItem], List[NavItem]]) -> List[List[Tuple[str, str, str]]]:
+        return [[(i.key, i.icon_name, i.emoji_fallback) for i in group] for group in items]
+
+    def _relabel(self) -> None:
+        for item in self._items[0] + self._items[1]:
+            btn = self._buttons.get(item.key)
+            if btn is not None:
+                btn.setText(self._button_text(item, has_icon=not btn.icon().isNull()))
+
+    @staticmethod
+    def _button_text(item: NavItem, has_icon: bool) -> str:
+        if not has_icon and item.emoji_fallback:
+            return f"{item.emoji_fallback} {item.label}".strip()
+        return item.label
 
     def _rebuild_buttons(self) -> None:
         # Clear existing
@@ -102,12 +132,9 @@ class Sidebar(QFrame):
             self.set_active(self._active_key)
 
     def _add_button(self, layout: QVBoxLayout, item: NavItem) -> None:
-        icon = _qta_icon(item.icon_name, color="#B3B3B3")
-        text = item.label
-        if icon is None and item.emoji_fallback:
-            text = f"{item.emoji_fallback} {item.label}".strip()
+        icon = _qta_icon(item.icon_name, color="#B3B3B3") if self._icons_ready else None
 
-        btn = QPushButton(text)
+        btn = QPushButton(self._button_text(item, has_icon=icon is not None))
         btn.setObjectName("NavButton")
         btn.setCheckable(True)
         btn.setCursor(Qt.PointingHandCursor)
@@ -130,7 +157,7 @@ class Sidebar(QFrame):
             btn.setChecked(active)
 
             icon_name = str(btn.property("icon_name") or "")
-            if icon_name:
+            if icon_name and self._icons_ready:
                 color = "#1DB954" if active else "#B3B3B3"
                 icon = _qta_icon(icon_name, color=color)
                 if icon is not None:
@@ -52,13 +52,20 @@ class TopBar(QFrame):
 
         self.user_button.setMenu(menu)
 
-        # Try to use a modern icon (FontAwesome via qtawesome) if available
-        self._apply_user_icon()
+        # Modern icon (FontAwesome via qtawesome) if available; applied on first show
+        # because importing qtawesome is a noticeable part of startup.
+        self._icon_applied = False
 
         # Initial translation for title/search/menu
         # MainWindow will call retranslate_ui(ctx) after ctx exists / language changes.
         self.retranslate_ui(ctx=None)
 
+    def showEvent(self, event) -> None:
+        if not self._icon_applied:
+            self._icon_applied = True
+            self._apply_user_icon()
+        super().showEvent(event)
+
     def _apply_user_icon(self) -> None:
         try:
             import qtawesome as qta  # type: ignore
@@ -1,12 +1,22 @@
 """Lightweight i18n helpers.
 
 The app supports 2 languages:
- - Indonesian (id) [default]
+ - Indonesian (id) [default, source language]
  - English (en)
 
 Instead of relying solely on Qt's QTranslator (.qm), we keep i18n explicit
 and deterministic: call :func:`t` with (id_text, en_text) and we pick the
-right one based on current settings.
+right one for the active language.
+
+Message keys are the Indonesian source text. Translations come from a
+compiled catalog (`characterify/assets/i18n/catalog.json`, generated by
+`python -m characterify.utils.i18n_extract`), loaded once per language into
+a plain dict. Lookup order: catalog -> inline `en_text` -> source text.
+
+The active language is a module-level pointer swapped by
+`SettingsService.apply_language()`, so :func:`t` never touches settings per
+string. Code that runs without it (e.g. the CLI) falls back to reading the
+language from `ctx.settings`.
 
 Qt translation files are still supported (optional): if you compile
 `characterify/assets/i18n/characterify_en.ts` into a `.qm` file,
@@ -16,15 +26,119 @@ to translate via Qt Linguist.
 
 from __future__ import annotations
 
-from typing import Optional
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+SOURCE_LANG = "id"
+LANGUAGES = ("id", "en")
+CATALOG_PATH = Path(__file__).resolve().parent.parent / "assets" / "i18n" / "catalog.json"
+
+_EMPTY: Dict[str, str] = {}
+_tables: Dict[str, Dict[str, str]] = {}
+_tables_lock = threading.Lock()
+# (lang, table); replaced as a whole so readers never see a half-switched state
+_active: Optional[Tuple[str, Dict[str, str]]] = None
+_missing: Set[Tuple[str, str]] = set()
+
+
+# ---------------------------
+# Catalog
+# ---------------------------
+def _normalize(lang: Optional[str]) -> str:
+    return lang if lang in LANGUAGES else SOURCE_LANG
+
+
+def load_catalog(lang: str) -> Dict[str, str]:
+    """Translation table for `lang` (source text -> text); read from disk once."""
+
+    lang = _normalize(lang)
+    if lang == SOURCE_LANG:
+        return _EMPTY
+    table = _tables.get(lang)
+    if table is not None:
+        return table
+    with _tables_lock:
+        table = _tables.get(lang)
+        if table is None:
+            table = {}
+            try:
+                data = json.loads(CATALOG_PATH.read_text(encoding="utf-8"))
+                table = dict(data.get("languages", {}).get(lang, {}))
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError):
+                logging.getLogger("characterify").exception(f"Failed to read i18n catalog {CATALOG_PATH}")
+            _tables[lang] = table
+    return table
+
+
+def reload_catalog() -> None:
+    """Drop loaded tables (after regenerating the catalog) and reload the active one."""
+
+    global _active
+    with _tables_lock:
+        _tables.clear()
+    if _active is not None:
+        _active = (_active[0], load_catalog(_active[0]))
+
+
+# ---------------------------
+# Active language
+# ---------------------------
+def set_active_language(lang: str) -> str:
+    """Switch the language used by :func:`t`; returns the normalized code."""
+
+    global _active
+    lang = _normalize(lang)
+    _active = (lang, load_catalog(lang))
+    return lang
+
+
+def active_language() -> Optional[str]:
+    """The language set by :func:`set_active_language`, or None if never set."""
+    active = _active
+    return active[0] if active is not None else None
 
 
 def get_lang(ctx) -> str:
     """Return current language code ('id' or 'en')."""
+    active = _active
+    if active is not None:
+        return active[0]
     try:
         return str(ctx.settings.get_language(getattr(ctx, "current_user_id", None)))
     except Exception:
-        return "id"
+        return SOURCE_LANG
+
+
+# ---------------------------
+# Lookup
+# ---------------------------
+def translate(id_text: str, en_text: Optional[str] = None, lang: Optional[str] = None) -> str:
+    """`id_text` in `lang` (default: the active language), without an AppContext."""
+
+    if lang is None:
+        active = _active
+        lang, table = active if active is not None else (SOURCE_LANG, _EMPTY)
+    else:
+        lang = _normalize(lang)
+        table = load_catalog(lang)
+    return _lookup(lang, table, id_text, en_text)
+
+
+def _lookup(lang: str, table: Dict[str, str], id_text: str, en_text: Optional[str]) -> str:
+    if lang == SOURCE_LANG:
+        return id_text
+    text = table.get(id_text)
+    if text is not None:
+        return text
+    _missing.add((lang, id_text))
+    if lang == "en" and en_text is not None:
+        return en_text
+    return id_text
 
 
 def t(ctx, id_text: str, en_text: Optional[str] = None) -> str:
@@ -32,15 +146,30 @@ def t(ctx, id_text: str, en_text: Optional[str] = None) -> str:
 
     Args:
         ctx: AppContext
-        id_text: Indonesian text (source)
-        en_text: English text
+        id_text: Indonesian text (source, also the catalog key)
+        en_text: English text, used when the catalog has no entry
 
     Returns:
-        The text in the active language. If `en_text` is not provided, we
-        fall back to `id_text`.
+        The text in the active language. If neither the catalog nor
+        `en_text` has a translation, we fall back to `id_text`.
     """
 
-    lang = get_lang(ctx)
-    if lang == "en" and en_text is not None:
-        return en_text
-    return id_text
+    active = _active
+    if active is None:
+        lang = _normalize(get_lang(ctx))
+        return _lookup(lang, load_catalog(lang), id_text, en_text)
+    return _lookup(active[0], active[1], id_text, en_text)
+
+
+def N_(id_text: str, en_text: str) -> Tuple[str, str]:
+    """Mark a text pair for the extractor without translating it yet.
+
+    For texts kept in data (e.g. a list of cards) and passed on later with
+    `t(ctx, *pair)` or `bind(widget, *pair)`.
+    """
+    return id_text, en_text
+
+
+def missing_translations(lang: str = "en") -> List[str]:
+    """Source texts looked up this session that the `lang` catalog lacks."""
+    return sorted(text for code, text in set(_missing) if code == lang)
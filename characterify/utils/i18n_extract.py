@@ -0,0 +1,180 @@
+"""Build `assets/i18n/catalog.json` from the `t(ctx, "id", "en")` calls in the code.
+
+`TextRegistry.bind(widget, "id", "en")` calls (same argument positions) and
+`N_("id", "en")` markers (for pairs kept in data and passed on later with
+`*pair`) are harvested too.
+
+    python -m characterify.utils.i18n_extract            # add new strings
+    python -m characterify.utils.i18n_extract --prune    # also drop unused keys
+    python -m characterify.utils.i18n_extract --update   # also take changed inline texts
+    python -m characterify.utils.i18n_extract --check    # exit 1 if out of date
+
+Only calls whose texts are string literals are harvested; calls with computed
+arguments are counted and keep working through their inline `en_text`.
+When an inline text differs from its catalog entry, the catalog entry is kept
+(it may have been edited by hand) and the difference is reported; `--check`
+fails on it until the code or the catalog is fixed, or `--update` takes the
+inline text.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from characterify.utils.i18n import CATALOG_PATH
+
+CATALOG_VERSION = 1
+PACKAGE_DIR = Path(__file__).resolve().parent.parent
+
+
+@dataclass
+class Extraction:
+    messages: Dict[str, str] = field(default_factory=dict)
+    # (location, source text, kept translation, other translation)
+    conflicts: List[Tuple[str, str, str, str]] = field(default_factory=list)
+    dynamic: List[str] = field(default_factory=list)
+
+
+def _literal(node: ast.AST) -> Optional[str]:
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return None
+
+
+# Callable name -> position of id_text (en_text follows it)
+CALL_NAMES = {"t": 1, "bind": 1, "N_": 0}
+
+# Functions that only pass texts through (their callers are harvested instead)
+FORWARDERS = {
+    "characterify/ui/texts.py": {"_apply"},
+}
+
+
+def _text_index(node: ast.Call) -> Optional[int]:
+    func = node.func
+    name = func.id if isinstance(func, ast.Name) else func.attr if isinstance(func, ast.Attribute) else None
+    index = CALL_NAMES.get(name)
+    if index is None or len(node.args) <= index:
+        return None
+    return index
+
+
+def _forwarded_calls(tree: ast.AST, names: Iterable[str]) -> Set[ast.AST]:
+    skip: Set[ast.AST] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name in names:
+            skip.update(ast.walk(node))
+    return skip
+
+
+def extract(files: Iterable[Path], root: Path = PACKAGE_DIR) -> Extraction:
+    out = Extraction()
+    for path in files:
+        rel = path.relative_to(root.parent)
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+        skip = _forwarded_calls(tree, FORWARDERS.get(rel.as_posix(), ()))
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.Call) or node in skip:
+                continue
+            index = _text_index(node)
+            if index is None:
+                continue
+            args = node.args
+            if any(isinstance(a, ast.Starred) for a in args[: index + 2]):
+                continue  # `*pair`: harvested where the pair is made, via N_()
+            where = f"{rel}:{node.lineno}"
+            source = _literal(args[index])
+            target = _literal(args[index + 1]) if len(args) > index + 1 else None
+            if source is None or (len(args) > index + 1 and target is None):
+                out.dynamic.append(where)
+                continue
+            if target is None:
+                continue
+            known = out.messages.get(source)
+            if known is None:
+                out.messages[source] = target
+            elif known != target:
+                out.conflicts.append((where, source, known, target))
+    return out
+
+
+def merge(
+    existing: Dict[str, str], found: Dict[str, str], prune: bool, update: bool = False
+) -> Tuple[Dict[str, str], List[Tuple[str, str, str]]]:
+    """Merged table and the (source, catalog text, inline text) pairs that disagree.
+
+    Disagreeing entries keep the catalog text unless `update` is set.
+    """
+
+    merged = {k: v for k, v in existing.items() if not prune or k in found}
+    stale: List[Tuple[str, str, str]] = []
+    for source, target in found.items():
+        known = merged.get(source)
+        if known is not None and known != target:
+            stale.append((source, known, target))
+            if not update:
+                continue
+        merged[source] = target
+    return dict(sorted(merged.items())), stale
+
+
+def _read_catalog(path: Path) -> Dict:
+    if not path.exists():
+        return {"version": CATALOG_VERSION, "languages": {}}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _dump(catalog: Dict) -> str:
+    return json.dumps(catalog, ensure_ascii=False, indent=2) + "\n"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m characterify.utils.i18n_extract", description=__doc__.splitlines()[0])
+    parser.add_argument("--out", type=Path, default=CATALOG_PATH)
+    parser.add_argument("--prune", action="store_true", help="Hapus key yang tidak dipakai lagi")
+    parser.add_argument("--update", action="store_true", help="Timpa entri katalog dengan teks inline yang berubah")
+    parser.add_argument("--check", action="store_true", help="Jangan tulis; exit 1 bila katalog belum up to date")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Tampilkan lokasi pemanggilan dinamis")
+    args = parser.parse_args(argv)
+
+    result = extract(sorted(PACKAGE_DIR.rglob("*.py")))
+    catalog = _read_catalog(args.out)
+    languages = catalog.setdefault("languages", {})
+    languages["en"], stale = merge(languages.get("en", {}), result.messages, args.prune, args.update)
+    catalog["version"] = CATALOG_VERSION
+
+    for where, source, kept, other in result.conflicts:
+        print(f"{where}: '{source}' punya terjemahan lain ('{other}'), dipakai '{kept}'", file=sys.stderr)
+    for source, kept, inline in stale:
+        action = "diganti" if args.update else "dipakai katalog"
+        print(f"'{source}': teks inline '{inline}' beda dengan katalog '{kept}' ({action})", file=sys.stderr)
+    print(f"{len(result.messages)} teks, {len(result.dynamic)} panggilan dinamis dilewati", file=sys.stderr)
+    if args.verbose:
+        for where in result.dynamic:
+            print(f"  dinamis: {where}", file=sys.stderr)
+
+    text = _dump(catalog)
+    current = args.out.read_text(encoding="utf-8") if args.out.exists() else ""
+    if args.check:
+        if text != current:
+            print(f"{args.out} belum up to date", file=sys.stderr)
+            return 1
+        if stale and not args.update:
+            print(f"{len(stale)} teks inline beda dengan {args.out}; perbaiki atau jalankan --update", file=sys.stderr)
+            return 1
+        return 0
+    if text != current:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(text, encoding="utf-8")
+        print(f"Wrote {args.out} ({len(languages['en'])} entri)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
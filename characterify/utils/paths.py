@@ -26,6 +26,10 @@ class AppPaths:
     def temp_dir(self) -> Path:
         return self.base_dir / "tmp"
 
+    @property
+    def cache_dir(self) -> Path:
+        return self.base_dir / "cache"
+
     @property
     def key_path(self) -> Path:
         return self.base_dir / "key.key"
@@ -35,3 +39,4 @@ class AppPaths:
         self.logs_dir.mkdir(parents=True, exist_ok=True)
         self.exports_dir.mkdir(parents=True, exist_ok=True)
         self.temp_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
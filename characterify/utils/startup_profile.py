@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+@dataclass
+class StartupProfiler:
+    """Per-phase wall-clock timings for `--profile-startup`.
+
+    Call :meth:`mark` at the end of each phase; the duration is measured from
+    the previous mark (or from construction for the first one). When disabled,
+    marks still cost only a `perf_counter()` call so the hooks can stay in place.
+    """
+
+    enabled: bool = False
+    phases: List[Tuple[str, float]] = field(default_factory=list)
+
+    _start: float = field(default_factory=time.perf_counter, init=False, repr=False)
+    _last: float = field(default=0.0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._last = self._start
+
+    def mark(self, phase: str) -> None:
+        now = time.perf_counter()
+        self.phases.append((phase, (now - self._last) * 1000.0))
+        self._last = now
+
+    @property
+    def total_ms(self) -> float:
+        return (self._last - self._start) * 1000.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "phases_ms": {name: round(ms, 2) for name, ms in self.phases},
+            "total_ms": round(self.total_ms, 2),
+        }
+
+    def report(self, logger, out_path: Optional[Path] = None) -> Dict[str, Any]:
+        """Log the timings and, if `out_path` is given, write them as JSON."""
+
+        data = self.as_dict()
+        if not self.enabled:
+            return data
+        breakdown = " | ".join(f"{name}={ms:.1f}ms" for name, ms in self.phases)
+        logger.info(f"STARTUP total={data['total_ms']:.1f}ms | {breakdown}")
+        if out_path is not None:
+            try:
+                out_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            except Exception:
+                logger.warning("Could not write startup profile", exc_info=True)
+        return data
+
+
+def on_first_paint(widget, callback: Callable[[], None]) -> None:
+    """Run `callback` once, right after `widget` receives its first paint event."""
+
+    from PySide6.QtCore import QEvent, QObject, QTimer
+
+    class _FirstPaintFilter(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint:
+                obj.removeEventFilter(self)
+                # Let the paint itself finish before reporting
+                QTimer.singleShot(0, callback)
+            return False
+
+    flt = _FirstPaintFilter(widget)
+    widget.installEventFilter(flt)
@@ -2,4 +2,8 @@ from characterify.main import main
 
 
 if __name__ == "__main__":
+    import multiprocessing
+
+    # Needed for the chart worker processes in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     raise SystemExit(main())
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from characterify.db.database import Database, StorageProfile
+
+
+class StorageProfileTest(unittest.TestCase):
+    def test_keyword_values_are_normalized(self) -> None:
+        profile = StorageProfile.from_config({"journal_mode": "delete", "synchronous": "full"})
+        self.assertIn("PRAGMA journal_mode = DELETE;", profile.pragmas())
+        self.assertIn("PRAGMA synchronous = FULL;", profile.pragmas())
+
+    def test_unknown_values_are_rejected(self) -> None:
+        for config in ({"journal_mode": "WAL; DROP TABLE users"}, {"synchronous": "fast"}, {"temp_store": "ram"}):
+            with self.subTest(config=config), self.assertRaises(ValueError):
+                StorageProfile.from_config(config)
+
+
+class MaintenanceIdleTest(unittest.TestCase):
+    def test_checkpoint_and_optimize_do_not_count_as_use(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            db = Database(Path(tmp) / "test.db")
+            db.initialize()
+            last_used = db.last_used
+            db.checkpoint()
+            db.optimize()
+            self.assertEqual(db.last_used, last_used)
+            db.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
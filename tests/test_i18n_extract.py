@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+from characterify.utils.i18n_extract import extract, merge
+
+
+class MergeTest(unittest.TestCase):
+    def test_changed_inline_text_is_reported_and_kept(self) -> None:
+        merged, stale = merge({"Simpan": "Save", "Lama": "Old"}, {"Simpan": "Store"}, prune=False)
+        self.assertEqual(merged, {"Lama": "Old", "Simpan": "Save"})
+        self.assertEqual(stale, [("Simpan", "Save", "Store")])
+
+    def test_update_takes_inline_text(self) -> None:
+        merged, stale = merge({"Simpan": "Save"}, {"Simpan": "Store"}, prune=False, update=True)
+        self.assertEqual(merged, {"Simpan": "Store"})
+        self.assertEqual(len(stale), 1)
+
+
+class ExtractTest(unittest.TestCase):
+    def test_marked_pairs_are_harvested_and_star_calls_skipped(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "pkg"
+            root.mkdir()
+            src = root / "page.py"
+            src.write_text(
+                textwrap.dedent(
+                    """
+                    pair = N_("Judul", "Title")
+                    bind(label, *pair)
+                    t(ctx, "Simpan", "Save")
+                    t(ctx, name, "Computed")
+                    """
+                ),
+                encoding="utf-8",
+            )
+            result = extract([src], root=root)
+        self.assertEqual(result.messages, {"Judul": "Title", "Simpan": "Save"})
+        self.assertEqual(result.dynamic, ["pkg/page.py:5"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+try:
+    import reportlab  # noqa: F401
+except ImportError:  # pragma: no cover
+    reportlab = None
+
+from characterify.db.database import Database
+from characterify.db import repositories
+from characterify.services.pdf_report import PdfReportService
+from characterify.services.scoring import ScoringService
+from characterify.utils.paths import AppPaths
+
+
+@unittest.skipIf(reportlab is None, "reportlab belum terpasang")
+class BatchExportNamesTest(unittest.TestCase):
+    """Batch exports must never overwrite each other's files."""
+
+    N = 12
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.paths = AppPaths(base_dir=Path(self._tmp.name))
+        self.paths.ensure()
+        self.db = Database(self.paths.db_path)
+        self.db.initialize()
+        self.scoring = ScoringService()
+        self.user_id = repositories.UserRepository(self.db).create("Tester", "t@example.com", "x", "y")
+        payload = self.scoring.compact_payload(self.scoring.score_test("mbti", {0: 5, 1: 2, 2: 4}))
+        repo = repositories.TestHistoryRepository(self.db)
+        # Same test type and the same second: the case that used to collide
+        self.history_ids = [
+            repo.add(self.user_id, "mbti", payload["result_type"], json.dumps(payload), "{}", created_at="2026-01-01T10:00:00")
+            for _ in range(self.N)
+        ]
+        self.pdf = PdfReportService(paths=self.paths, db=self.db, scoring=self.scoring, chart_processes=1)
+
+    def tearDown(self) -> None:
+        self.db.close()
+        self._tmp.cleanup()
+
+    def _export(self, mode: str):
+        return self.pdf.create_reports_batch(
+            self.history_ids,
+            mode=mode,
+            user_id=self.user_id,
+            user_name="Tester",
+            user_email="t@example.com",
+            chart_backend="vector",
+        )
+
+    def test_separate_mode_writes_one_distinct_file_per_entry(self) -> None:
+        paths = self._export("separate")
+        self.assertEqual(len(paths), self.N)
+        self.assertEqual(len(set(paths)), self.N)
+        self.assertTrue(all(p.exists() and p.stat().st_size > 0 for p in paths))
+        self.assertEqual(len(list(self.paths.exports_dir.glob("*.pdf"))), self.N)
+
+    def test_repeated_exports_do_not_overwrite(self) -> None:
+        first = self._export("combined") + self._export("separate")
+        second = self._export("combined") + self._export("separate")
+        self.assertEqual(len(set(first + second)), 2 * (self.N + 1))
+        self.assertEqual(len(list(self.paths.exports_dir.glob("*.pdf"))), 2 * (self.N + 1))
+
+
+if __name__ == "__main__":
+    unittest.main()